@@ -4,16 +4,122 @@
 #include <string>
 #include <vector>
 #include <fstream>
+#include <cstddef>
+#include <cstdlib>
+#include "json_output.h"
+
+// Ablation 변형: 후보 그래프 × 초기 투어 구성 × 2-opt 반복 횟수
+struct AblationVariant {
+    std::string name;
+    std::string candidates;    // "kdtree" 또는 "bruteforce"
+    std::string construction;  // "best" (Greedy/MST 중 짧은 투어), "greedy", "mst"
+    int two_opt_iterations;    // 0이면 2-opt 생략
+};
+
+// 이름으로 쓸 수 있는 기본 변형 (full과 bruteforce는 기존 KD-tree/brute-force 비교)
+inline std::vector<AblationVariant> ablationVariantPresets() {
+    return {
+        {"full", "kdtree", "best", 2},
+        {"bruteforce", "bruteforce", "best", 2},
+        {"no_2opt", "kdtree", "best", 0},
+        {"greedy_only", "kdtree", "greedy", 2},
+        {"mst_only", "kdtree", "mst", 2},
+    };
+}
+
+// 쉼표로 구분한 변형 목록을 해석
+// 각 항목은 기본 변형 이름이거나 "후보:구성:2-opt 반복" (예: bruteforce:mst:0)
+// 잘못된 항목이 있으면 false를 반환하고 error에 이유를 기록
+inline bool parseAblationVariants(const std::string& text, std::vector<AblationVariant>& variants,
+                                  std::string& error) {
+    std::vector<AblationVariant> presets = ablationVariantPresets();
+    variants.clear();
+    size_t start = 0;
+    while (start <= text.size()) {
+        size_t comma = text.find(',', start);
+        std::string item = text.substr(start, comma == std::string::npos ? std::string::npos
+                                                                           : comma - start);
+        start = (comma == std::string::npos) ? text.size() + 1 : comma + 1;
+        if (item.empty()) continue;
+        
+        bool found = false;
+        for (const AblationVariant& preset : presets) {
+            if (preset.name == item) {
+                variants.push_back(preset);
+                found = true;
+                break;
+            }
+        }
+        if (found) continue;
+        
+        size_t first = item.find(':');
+        size_t second = (first == std::string::npos) ? first : item.find(':', first + 1);
+        if (second == std::string::npos) {
+            error = "unknown variant '" + item + "'";
+            return false;
+        }
+        AblationVariant variant;
+        variant.name = item;
+        variant.candidates = item.substr(0, first);
+        variant.construction = item.substr(first + 1, second - first - 1);
+        std::string iterations = item.substr(second + 1);
+        char* end = nullptr;
+        long value = strtol(iterations.c_str(), &end, 10);
+        if (variant.candidates != "kdtree" && variant.candidates != "bruteforce") {
+            error = "unknown candidate backend '" + variant.candidates + "' in '" + item + "'";
+            return false;
+        }
+        if (variant.construction != "best" && variant.construction != "greedy" &&
+            variant.construction != "mst") {
+            error = "unknown construction '" + variant.construction + "' in '" + item + "'";
+            return false;
+        }
+        if (iterations.empty() || *end != '\0' || value < 0 || value > 1000) {
+            error = "invalid 2-opt iterations '" + iterations + "' in '" + item + "'";
+            return false;
+        }
+        variant.two_opt_iterations = (int)value;
+        variants.push_back(variant);
+    }
+    if (variants.empty()) {
+        error = "no variants given";
+        return false;
+    }
+    return true;
+}
+
+// 변형 하나의 결과
+// time_ms는 변형이 사용한 모든 단계(Phase 1 포함)의 측정 시간 합이고,
+// 앞선 변형에서 계산된 단계를 재사용했으면 그 시간은 reused_time_ms에도 포함됨
+struct AblationVariantResult {
+    AblationVariant variant;
+    int graph_id;              // 내용이 같은 후보 그래프는 같은 번호
+    std::string source;        // 2-opt에 들어간 초기 투어 ("greedy" 또는 "mst")
+    double distance_before_2opt;
+    double distance;
+    double time_ms;
+    double reused_time_ms;
+    double two_opt_time_ms;
+    int computed_phases;
+    int reused_phases;
+};
 
 struct AblationStudyStats {
     std::string dataset_name;
     int nodes;
+    int k;  // 후보 이웃 수
     
     // Phase 1 비교 (KD-tree vs Brute-force KNN)
     double kdtree_phase1_time_ms;
     double bruteforce_phase1_time_ms;
     double kdtree_candidate_edges;
-    double bruteforce_candidate_edges;
+    double bruteforce_candidate_edges;  // 표본 모드에서는 NaN
+    
+    // Brute-force 기준선 실행 방식: "full" (모든 노드) 또는 "sampled" (표본 질의로 시간 추정)
+    std::string bruteforce_mode;
+    int bruteforce_sample_queries;
+    int bruteforce_threads;
+    double candidate_agreement;  // brute-force 이웃 중 KD-tree 후보에도 있는 비율
     
     // Phase 4 비교 (2-opt 전후)
     double distance_before_2opt;
@@ -21,15 +127,44 @@ struct AblationStudyStats {
     double phase4_2opt_time_ms;
     double improvement_ratio_2opt;  // (before - after) / before
     
-    // 전체 성능 비교
+    // 전체 성능 비교 (brute-force 쪽은 표본 모드에서 NaN)
     double total_time_kdtree_ms;
     double total_time_bruteforce_ms;
     double final_distance_kdtree;
     double final_distance_bruteforce;
     
     // 시간 복잡도 분석
-    double time_complexity_ratio;  // bruteforce_time / kdtree_time
+    // bruteforce_time / kdtree_time: KD-tree는 단일 스레드, brute-force는 bruteforce_threads개 스레드로
+    // 측정하므로 스레드 수에 따라 달라짐 (CSV의 BruteForceThreads와 함께 비교)
+    double time_complexity_ratio;
     double quality_difference;     // |kdtree_distance - bruteforce_distance| / min(kdtree, bruteforce)
+    
+    // 메모리 사용량
+    size_t kdtree_phase1_alloc_bytes;
+    size_t bruteforce_phase1_alloc_bytes;
+    size_t kdtree_bytes;
+    size_t candidate_bytes;
+    long peak_rss_kb;
+    
+    // 변형별 결과와 단계 재사용 요약
+    std::vector<AblationVariantResult> variants;
+    int unique_candidate_graphs;
+    int computed_phases;
+    int reused_phases;
+    double reused_time_ms;  // 재사용으로 다시 계산하지 않은 단계 시간의 합
+    
+    AblationStudyStats() : nodes(0), k(0), kdtree_phase1_time_ms(0), bruteforce_phase1_time_ms(0),
+                           kdtree_candidate_edges(0), bruteforce_candidate_edges(0),
+                           bruteforce_mode("full"), bruteforce_sample_queries(0), bruteforce_threads(1),
+                           candidate_agreement(0),
+                           distance_before_2opt(0), distance_after_2opt(0), phase4_2opt_time_ms(0),
+                           improvement_ratio_2opt(0), total_time_kdtree_ms(0), total_time_bruteforce_ms(0),
+                           final_distance_kdtree(0), final_distance_bruteforce(0),
+                           time_complexity_ratio(0), quality_difference(0),
+                           kdtree_phase1_alloc_bytes(0), bruteforce_phase1_alloc_bytes(0),
+                           kdtree_bytes(0), candidate_bytes(0), peak_rss_kb(0),
+                           unique_candidate_graphs(0), computed_phases(0), reused_phases(0),
+                           reused_time_ms(0) {}
 };
 
 void saveAblationStats(const std::string& csv_file, const AblationStudyStats& stats) {
@@ -50,11 +185,91 @@ void saveAblationStats(const std::string& csv_file, const AblationStudyStats& st
              << stats.final_distance_kdtree << ","
              << stats.final_distance_bruteforce << ","
              << stats.time_complexity_ratio << ","
-             << stats.quality_difference << std::endl;
+             << stats.quality_difference << ","
+             << stats.kdtree_phase1_alloc_bytes << ","
+             << stats.bruteforce_phase1_alloc_bytes << ","
+             << stats.kdtree_bytes << ","
+             << stats.candidate_bytes << ","
+             << stats.peak_rss_kb << ","
+             << stats.bruteforce_mode << ","
+             << stats.bruteforce_sample_queries << ","
+             << stats.candidate_agreement << ","
+             << stats.bruteforce_threads << std::endl;
         file.close();
     }
 }
 
+// --json 레코드의 ablation 항목 (parameters, phase1, phase4, totals, variants, reuse, memory)
+void addAblationStatsToJson(JsonObject& record, const AblationStudyStats& stats) {
+    JsonObject parameters;
+    parameters.add("k", stats.k)
+              .add("bruteforce_mode", stats.bruteforce_mode);
+    
+    JsonObject phase1;
+    phase1.add("kdtree_time_ms", stats.kdtree_phase1_time_ms)
+          .add("bruteforce_time_ms", stats.bruteforce_phase1_time_ms)
+          .add("kdtree_candidate_edges", stats.kdtree_candidate_edges)
+          .add("bruteforce_candidate_edges", stats.bruteforce_candidate_edges)
+          .add("kdtree_alloc_bytes", stats.kdtree_phase1_alloc_bytes)
+          .add("bruteforce_alloc_bytes", stats.bruteforce_phase1_alloc_bytes)
+          .add("bruteforce_mode", stats.bruteforce_mode)
+          .add("bruteforce_sample_queries", stats.bruteforce_sample_queries)
+          .add("bruteforce_threads", stats.bruteforce_threads)
+          .add("candidate_agreement", stats.candidate_agreement);
+    
+    JsonObject phase4;
+    phase4.add("distance_before", stats.distance_before_2opt)
+          .add("distance_after", stats.distance_after_2opt)
+          .add("time_ms", stats.phase4_2opt_time_ms)
+          .add("improvement_ratio", stats.improvement_ratio_2opt);
+    
+    JsonObject totals;
+    totals.add("kdtree_time_ms", stats.total_time_kdtree_ms)
+          .add("bruteforce_time_ms", stats.total_time_bruteforce_ms)
+          .add("kdtree_distance", stats.final_distance_kdtree)
+          .add("bruteforce_distance", stats.final_distance_bruteforce)
+          .add("time_complexity_ratio", stats.time_complexity_ratio)
+          .add("quality_difference", stats.quality_difference);
+    
+    JsonArray variants;
+    for (const AblationVariantResult& result : stats.variants) {
+        JsonObject variant;
+        variant.add("name", result.variant.name)
+               .add("candidates", result.variant.candidates)
+               .add("construction", result.variant.construction)
+               .add("two_opt_iterations", result.variant.two_opt_iterations)
+               .add("graph_id", result.graph_id)
+               .add("source", result.source)
+               .add("distance_before_2opt", result.distance_before_2opt)
+               .add("distance", result.distance)
+               .add("time_ms", result.time_ms)
+               .add("two_opt_time_ms", result.two_opt_time_ms)
+               .add("reused_time_ms", result.reused_time_ms)
+               .add("computed_phases", result.computed_phases)
+               .add("reused_phases", result.reused_phases);
+        variants.add(variant);
+    }
+    
+    JsonObject reuse;
+    reuse.add("unique_candidate_graphs", stats.unique_candidate_graphs)
+         .add("computed_phases", stats.computed_phases)
+         .add("reused_phases", stats.reused_phases)
+         .add("reused_time_ms", stats.reused_time_ms);
+    
+    JsonObject memory;
+    memory.add("peak_rss_kb", stats.peak_rss_kb)
+          .add("kdtree_bytes", stats.kdtree_bytes)
+          .add("candidate_bytes", stats.candidate_bytes);
+    
+    record.add("parameters", parameters)
+          .add("phase1", phase1)
+          .add("phase4", phase4)
+          .add("totals", totals)
+          .add("variants", variants)
+          .add("reuse", reuse)
+          .add("memory", memory);
+}
+
 void initAblationStatsCSV(const std::string& csv_file) {
     std::ofstream file(csv_file);
     if (file.is_open()) {
@@ -63,7 +278,9 @@ void initAblationStatsCSV(const std::string& csv_file) {
              << "DistanceBefore2Opt,DistanceAfter2Opt,Phase4_2OptTimeMs,"
              << "ImprovementRatio2Opt,TotalTimeKDTreeMs,TotalTimeBruteForceMs,"
              << "FinalDistanceKDTree,FinalDistanceBruteForce,"
-             << "TimeComplexityRatio,QualityDifference" << std::endl;
+             << "TimeComplexityRatio,QualityDifference,"
+             << "KDTreePhase1AllocBytes,BruteForcePhase1AllocBytes,KDTreeBytes,CandidateBytes,PeakRSSKB,"
+             << "BruteForceMode,BruteForceSampleQueries,CandidateAgreement,BruteForceThreads" << std::endl;
         file.close();
     }
 }
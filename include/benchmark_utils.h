@@ -4,6 +4,7 @@
 #include <chrono>
 #include <iostream>
 #include <fstream>
+#include <cstddef>
 
 class BenchmarkTimer {
 private:
@@ -29,12 +30,15 @@ public:
     }
 };
 
+// 컬럼: Algorithm,Dataset,Nodes,Time_ms,Distance,Status,PeakRSSKB,GraphBytes,AllocatedBytes
 void saveBenchmarkResult(const std::string& csv_file, const std::string& algorithm, 
-                        const std::string& dataset, int nodes, double time_ms, int distance) {
+                        const std::string& dataset, int nodes, double time_ms, int distance,
+                        long peak_rss_kb, size_t graph_bytes, size_t allocated_bytes) {
     std::ofstream file(csv_file, std::ios::app);
     if (file.is_open()) {
         file << algorithm << "," << dataset << "," << nodes << "," 
-             << time_ms << "," << distance << std::endl;
+             << time_ms << "," << distance << ",SUCCESS," 
+             << peak_rss_kb << "," << graph_bytes << "," << allocated_bytes << std::endl;
         file.close();
     }
 }
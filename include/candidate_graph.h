@@ -0,0 +1,57 @@
+#ifndef CANDIDATE_GRAPH_H
+#define CANDIDATE_GRAPH_H
+
+#include <cstddef>
+#include <vector>
+
+// 후보 간선 그래프 (CSR: compressed sparse row)
+// 정점 u의 후보 이웃은 neighbors[offsets[u] .. offsets[u + 1]) 구간에 (거리, id) 오름차순으로,
+// 같은 위치의 lengths에는 그 간선 길이(float)가 저장됨
+// 전체가 세 개의 배열이므로 정점별 할당이 없고, 각 Phase는 길이를 다시 계산하지 않음
+struct CandidateGraph {
+    std::vector<int> offsets;    // n + 1개
+    std::vector<int> neighbors;
+    std::vector<float> lengths;
+    
+    int nodeCount() const { return (int)offsets.size() - 1; }
+    int begin(int u) const { return offsets[u]; }
+    int end(int u) const { return offsets[u + 1]; }
+    int degree(int u) const { return offsets[u + 1] - offsets[u]; }
+    size_t edgeCount() const { return neighbors.size(); }
+    
+    // 구성: startBuild 후 정점 0..n-1 순서로 addEdge를 호출하고 정점마다 finishNode
+    void startBuild(int n, size_t expected_edges) {
+        offsets.clear();
+        offsets.reserve(n + 1);
+        offsets.push_back(0);
+        neighbors.clear();
+        neighbors.reserve(expected_edges);
+        lengths.clear();
+        lengths.reserve(expected_edges);
+    }
+    
+    void addEdge(int v, double length) {
+        neighbors.push_back(v);
+        lengths.push_back((float)length);
+    }
+    
+    void finishNode() {
+        offsets.push_back((int)neighbors.size());
+    }
+    
+    size_t getMemoryBytes() const {
+        return offsets.capacity() * sizeof(int) + neighbors.capacity() * sizeof(int) +
+               lengths.capacity() * sizeof(float);
+    }
+};
+
+// 각 후보 목록의 앞 k개만 남긴 그래프
+// 목록이 거리순이므로 k로 직접 구성한 후보 그래프와 같음 (K 스윕에서 사용)
+CandidateGraph truncateCandidateGraph(const CandidateGraph& graph, int k);
+
+// 그래프 내용(offsets, neighbors, lengths)의 64비트 FNV-1a 지문
+// 같은 지문은 sameCandidateGraph로 다시 확인해 충돌을 배제함 (ablation의 단계 재사용에 사용)
+unsigned long long candidateGraphHash(const CandidateGraph& graph);
+bool sameCandidateGraph(const CandidateGraph& a, const CandidateGraph& b);
+
+#endif // CANDIDATE_GRAPH_H
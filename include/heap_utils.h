@@ -3,6 +3,8 @@
 
 #include <climits>
 #include <cmath>
+#include <cstddef>
+#include <vector>
 
 // Priority Queue Node 구조체 (double key용)
 struct PQNode {
@@ -31,6 +33,11 @@ struct DistNode {
     DistNode(double d, int i) : dist(d), id(i) {}
 };
 
+// (거리, id) 사전식 비교: 거리가 같은 이웃은 id가 작은 쪽이 앞섬
+inline bool distNodeLess(const DistNode& a, const DistNode& b) {
+    return a.dist < b.dist || (a.dist == b.dist && a.id < b.id);
+}
+
 // 힙 관련 함수들 (double key용)
 int left_child(int i);
 int right_child(int i);
@@ -40,6 +47,7 @@ void build_min_heap(PQNode* heap, int size);
 void build_max_heap(DistNode* heap, int size);
 PQNode extract_min(PQNode* heap, int& heap_size);
 DistNode extract_max(DistNode* heap, int& heap_size);
+// 정점 위치를 선형 탐색하므로 O(n): Prim에는 IndexedMinHeap 사용
 void decrease_key(PQNode* heap, int heap_size, int vertex, double new_key);
 void insert_max_heap(DistNode* heap, int& heap_size, int max_size, DistNode new_node);
 
@@ -47,6 +55,102 @@ void insert_max_heap(DistNode* heap, int& heap_size, int max_size, DistNode new_
 void min_heapify_int(PQNodeInt* heap, int heap_size, int i);
 void build_min_heap_int(PQNodeInt* heap, int size);
 PQNodeInt extract_min_int(PQNodeInt* heap, int& heap_size);
+// 정점 위치를 선형 탐색하므로 O(n): Prim에는 IndexedMinHeap 사용
 void decrease_key_int(PQNodeInt* heap, int heap_size, int vertex, int new_key);
 
+// 정점 -> 힙 슬롯 위치 맵을 가진 최소 힙 (Node = PQNode 또는 PQNodeInt)
+// decrease_key가 선형 탐색 없이 O(log n)이고, sift는 재귀 없이 반복문으로 수행
+// 자식 선택 규칙은 min_heapify와 같아서 추출 순서가 기존 힙과 동일함
+template <typename Node>
+class IndexedMinHeap {
+public:
+    typedef decltype(Node().key) Key;
+    
+    explicit IndexedMinHeap(int n) : nodes(n), pos(n, -1), heap_size(0) {}
+    
+    // 정점 v를 keys[v]로 모두 넣고 bottom-up으로 힙 구성 (O(n))
+    void build(const std::vector<Key>& keys) {
+        heap_size = (int)keys.size();
+        for (int v = 0; v < heap_size; v++) {
+            nodes[v] = Node(v, keys[v]);
+            pos[v] = v;
+        }
+        for (int i = heap_size / 2 - 1; i >= 0; i--) {
+            siftDown(i);
+        }
+    }
+    
+    bool empty() const { return heap_size == 0; }
+    int size() const { return heap_size; }
+    bool contains(int vertex) const { return pos[vertex] >= 0; }
+    
+    Node extractMin() {
+        Node min_node = nodes[0];
+        pos[min_node.vertex] = -1;
+        heap_size--;
+        if (heap_size > 0) {
+            place(0, nodes[heap_size]);
+            siftDown(0);
+        }
+        return min_node;
+    }
+    
+    // 힙에 있는 vertex의 키를 new_key로 낮춤 (키가 작아지지 않으면 무시)
+    bool decreaseKey(int vertex, Key new_key) {
+        int i = pos[vertex];
+        if (i < 0 || !(new_key < nodes[i].key)) {
+            return false;
+        }
+        nodes[i].key = new_key;
+        siftUp(i);
+        return true;
+    }
+    
+    size_t getMemoryBytes() const {
+        return nodes.capacity() * sizeof(Node) + pos.capacity() * sizeof(int);
+    }
+    
+private:
+    std::vector<Node> nodes;
+    std::vector<int> pos;  // 정점 -> nodes 슬롯 (힙에 없으면 -1)
+    int heap_size;
+    
+    void place(int i, const Node& node) {
+        nodes[i] = node;
+        pos[node.vertex] = i;
+    }
+    
+    void siftUp(int i) {
+        Node node = nodes[i];
+        while (i > 0) {
+            int parent = (i - 1) / 2;
+            if (!(node.key < nodes[parent].key)) {
+                break;
+            }
+            place(i, nodes[parent]);
+            i = parent;
+        }
+        place(i, node);
+    }
+    
+    void siftDown(int i) {
+        Node node = nodes[i];
+        while (true) {
+            int child = 2 * i + 1;
+            if (child >= heap_size) {
+                break;
+            }
+            if (child + 1 < heap_size && nodes[child + 1].key < nodes[child].key) {
+                child++;
+            }
+            if (!(nodes[child].key < node.key)) {
+                break;
+            }
+            place(i, nodes[child]);
+            i = child;
+        }
+        place(i, node);
+    }
+};
+
 #endif // HEAP_UTILS_H 
\ No newline at end of file
@@ -0,0 +1,153 @@
+#ifndef JSON_OUTPUT_H
+#define JSON_OUTPUT_H
+
+#include <cmath>
+#include <cstdio>
+#include <iomanip>
+#include <iostream>
+#include <sstream>
+#include <string>
+
+class JsonArray;
+
+// 한 줄짜리 JSON 객체 작성기 (--json 모드용)
+class JsonObject {
+private:
+    std::string body;
+    
+    void key(const std::string& name) {
+        if (!body.empty()) body += ",";
+        body += quote(name) + ":";
+    }
+    
+public:
+    static std::string quote(const std::string& value) {
+        std::string result = "\"";
+        for (size_t i = 0; i < value.size(); i++) {
+            char c = value[i];
+            if (c == '"' || c == '\\') {
+                result += '\\';
+                result += c;
+            } else if (c == '\n') {
+                result += "\\n";
+            } else if ((unsigned char)c < 0x20) {
+                char buf[8];
+                snprintf(buf, sizeof(buf), "\\u%04x", c);
+                result += buf;
+            } else {
+                result += c;
+            }
+        }
+        return result + "\"";
+    }
+    
+    JsonObject& add(const std::string& name, const std::string& value) {
+        key(name);
+        body += quote(value);
+        return *this;
+    }
+    
+    JsonObject& add(const std::string& name, const char* value) {
+        return add(name, std::string(value));
+    }
+    
+    JsonObject& add(const std::string& name, double value) {
+        key(name);
+        if (!std::isfinite(value)) {
+            body += "null";
+        } else {
+            std::ostringstream os;
+            os << std::setprecision(15) << value;
+            body += os.str();
+        }
+        return *this;
+    }
+    
+    JsonObject& add(const std::string& name, bool value) {
+        key(name);
+        body += value ? "true" : "false";
+        return *this;
+    }
+    
+    JsonObject& add(const std::string& name, int value) { return addInteger(name, value); }
+    JsonObject& add(const std::string& name, long value) { return addInteger(name, value); }
+    JsonObject& add(const std::string& name, long long value) { return addInteger(name, value); }
+    JsonObject& add(const std::string& name, unsigned long value) { return addInteger(name, value); }
+    JsonObject& add(const std::string& name, unsigned long long value) { return addInteger(name, value); }
+    
+    JsonObject& add(const std::string& name, const JsonObject& value) {
+        key(name);
+        body += value.str();
+        return *this;
+    }
+    
+    JsonObject& add(const std::string& name, const JsonArray& value);
+    
+    template<typename T>
+    JsonObject& addInteger(const std::string& name, T value) {
+        key(name);
+        std::ostringstream os;
+        os << value;
+        body += os.str();
+        return *this;
+    }
+    
+    std::string str() const {
+        return "{" + body + "}";
+    }
+};
+
+// JSON 객체 배열 (예: K 스윕의 K별 결과)
+class JsonArray {
+private:
+    std::string body;
+    
+public:
+    JsonArray& add(const JsonObject& value) {
+        if (!body.empty()) body += ",";
+        body += value.str();
+        return *this;
+    }
+    
+    std::string str() const {
+        return "[" + body + "]";
+    }
+};
+
+inline JsonObject& JsonObject::add(const std::string& name, const JsonArray& value) {
+    key(name);
+    body += value.str();
+    return *this;
+}
+
+// --json 모드: 사람이 읽는 출력은 stderr로 보내고 stdout에는 JSON 레코드 한 줄만 출력
+class JsonOutputMode {
+private:
+    std::streambuf* stdout_buf;
+    bool enabled;
+    
+public:
+    explicit JsonOutputMode(bool enable) : stdout_buf(nullptr), enabled(enable) {
+        if (enabled) {
+            stdout_buf = std::cout.rdbuf(std::cerr.rdbuf());
+        }
+    }
+    
+    ~JsonOutputMode() {
+        if (enabled) {
+            std::cout.rdbuf(stdout_buf);
+        }
+    }
+    
+    bool isEnabled() const {
+        return enabled;
+    }
+    
+    void emit(const JsonObject& record) {
+        if (!enabled) return;
+        std::ostream out(stdout_buf);
+        out << record.str() << std::endl;
+    }
+};
+
+#endif // JSON_OUTPUT_H
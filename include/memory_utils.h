@@ -0,0 +1,68 @@
+#ifndef MEMORY_UTILS_H
+#define MEMORY_UTILS_H
+
+#include <cstddef>
+#include <vector>
+
+// 힙 할당 카운터 (memory_utils.cpp에서 전역 operator new/delete를 교체하여 집계)
+size_t totalAllocatedBytes();     // 프로그램 시작 이후 할당된 누적 바이트
+size_t liveHeapBytes();           // 현재 해제되지 않은 바이트
+size_t peakLiveHeapBytes();       // 마지막 reset 이후 최대 live 바이트
+void resetPeakLiveHeapBytes();
+
+// 프로세스 최대 RSS (KB)
+long getPeakRSSKB();
+
+// 구간별 할당량 측정 (BenchmarkTimer와 같은 start/stop 방식)
+class MemoryTracker {
+private:
+    size_t start_allocated;
+    size_t start_live;
+    size_t end_allocated;
+    size_t peak_live;
+    
+public:
+    MemoryTracker() : start_allocated(0), start_live(0), end_allocated(0), peak_live(0) {}
+    
+    void start() {
+        start_allocated = totalAllocatedBytes();
+        start_live = liveHeapBytes();
+        resetPeakLiveHeapBytes();
+    }
+    
+    void stop() {
+        end_allocated = totalAllocatedBytes();
+        peak_live = peakLiveHeapBytes();
+    }
+    
+    // 구간 동안 할당된 총 바이트
+    size_t getAllocatedBytes() const {
+        return end_allocated - start_allocated;
+    }
+    
+    // 구간 시작 대비 최대 추가 사용량
+    size_t getPeakBytes() const {
+        return peak_live > start_live ? peak_live - start_live : 0;
+    }
+};
+
+// 컨테이너 메모리 사용량 (capacity 기준)
+template<typename T>
+size_t vectorBytes(const std::vector<T>& v) {
+    return v.capacity() * sizeof(T);
+}
+
+inline size_t vectorBytes(const std::vector<bool>& v) {
+    return (v.capacity() + 7) / 8;
+}
+
+template<typename T>
+size_t nestedVectorBytes(const std::vector<std::vector<T> >& v) {
+    size_t total = v.capacity() * sizeof(std::vector<T>);
+    for (size_t i = 0; i < v.size(); i++) {
+        total += vectorBytes(v[i]);
+    }
+    return total;
+}
+
+#endif // MEMORY_UTILS_H
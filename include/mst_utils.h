@@ -0,0 +1,25 @@
+#ifndef MST_UTILS_H
+#define MST_UTILS_H
+
+#include <cstddef>
+#include <vector>
+
+// MST 자식 배열 (CSR: compressed sparse row)
+// 정점 u의 자식은 child_ids[child_start[u] .. child_start[u + 1]) 구간에 id 오름차순으로 저장
+struct MSTChildArray {
+    std::vector<int> child_start;  // n + 1개
+    std::vector<int> child_ids;    // 부모가 있는 정점 수만큼
+    
+    size_t getMemoryBytes() const {
+        return child_start.capacity() * sizeof(int) + child_ids.capacity() * sizeof(int);
+    }
+};
+
+// Prim의 parent 배열(루트와 도달하지 못한 정점은 -1)로 자식 배열 구성 (O(n), 할당 2회)
+MSTChildArray buildMSTChildArray(const std::vector<int>& parent);
+
+// root부터의 전위 순회 (명시적 스택, 재귀 깊이 제한 없음)
+// 자식은 id 오름차순으로 방문하며, root에서 도달할 수 없는 정점은 포함되지 않음
+std::vector<int> mstPreorder(const MSTChildArray& tree, int root);
+
+#endif // MST_UTILS_H
@@ -0,0 +1,73 @@
+#ifndef MULTI_START_H
+#define MULTI_START_H
+
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <vector>
+#include "json_output.h"
+
+// 작업 스레드 수 기본값 (하드웨어 스레드 수, 알 수 없으면 1)
+inline int defaultThreadCount() {
+    return std::max(1, (int)std::thread::hardware_concurrency());
+}
+
+// task(i)를 i = 0..count-1에 대해 최대 threads개 스레드로 실행 (호출 스레드도 작업에 참여)
+// 스레드는 다음 작업 번호를 원자적으로 가져가며, 첫 번째 예외는 모든 스레드가 끝난 뒤 다시 던짐
+template <typename Task>
+void parallelFor(int count, int threads, Task task) {
+    threads = std::max(1, std::min(threads, count));
+    std::atomic<int> next(0);
+    std::exception_ptr error;
+    std::mutex error_mutex;
+    
+    auto worker = [&]() {
+        for (int i = next++; i < count; i = next++) {
+            try {
+                task(i);
+            } catch (...) {
+                std::lock_guard<std::mutex> lock(error_mutex);
+                if (!error) error = std::current_exception();
+            }
+        }
+    };
+    
+    std::vector<std::thread> pool;
+    for (int t = 1; t < threads; t++) {
+        pool.emplace_back(worker);
+    }
+    worker();
+    for (std::thread& t : pool) {
+        t.join();
+    }
+    if (error) {
+        std::rethrow_exception(error);
+    }
+}
+
+// 다중 시작 결과의 분포 (시작점마다 얻은 투어 길이)
+struct StartSpread {
+    int starts;
+    int best_start;      // 최단 투어의 시작 노드 (동률이면 먼저 실행한 시작점)
+    double min_length;
+    double mean_length;
+    double max_length;
+    double std_length;   // 모표준편차
+    
+    StartSpread() : starts(0), best_start(0), min_length(0), mean_length(0), max_length(0),
+                    std_length(0) {}
+};
+
+// n개 노드에서 고른 starts개의 서로 다른 시작 노드: 0번 노드와 id 간격이 고른 노드들
+// (starts=1이면 {0}이라 단일 시작 결과와 같음)
+std::vector<int> multiStartNodes(int n, int starts);
+
+// start_nodes[i]에서 얻은 투어 길이 lengths[i]의 분포
+StartSpread summarizeStarts(const std::vector<int>& start_nodes, const std::vector<double>& lengths);
+
+// --json 레코드의 multi_start 항목
+JsonObject startSpreadToJson(const StartSpread& spread, int threads);
+
+#endif // MULTI_START_H
@@ -0,0 +1,45 @@
+#ifndef PERF_COUNTERS_H
+#define PERF_COUNTERS_H
+
+// 하드웨어 카운터 값 (측정 불가능한 항목은 -1)
+struct PerfCounterValues {
+    long long cycles;
+    long long instructions;
+    long long cache_misses;
+    long long branch_misses;
+    
+    PerfCounterValues() : cycles(-1), instructions(-1), cache_misses(-1), branch_misses(-1) {}
+    
+    // 명령어당 사이클 수의 역수 (IPC)
+    double ipc() const {
+        if (cycles <= 0 || instructions < 0) return -1;
+        return (double)instructions / cycles;
+    }
+    
+    // 1000 명령어당 캐시 미스 (MPKI)
+    double cacheMissesPerKiloInstruction() const {
+        if (instructions <= 0 || cache_misses < 0) return -1;
+        return cache_misses * 1000.0 / instructions;
+    }
+};
+
+// perf_event 기반 카운터 (Linux, 사용자 공간만 측정하므로 perf_event_paranoid <= 2면 root 불필요)
+// 사용할 수 없는 환경에서는 모든 값이 -1로 남음
+class PerfCounters {
+private:
+    static const int NUM_COUNTERS = 4;
+    int fds[NUM_COUNTERS];
+    PerfCounterValues values;
+    
+public:
+    PerfCounters();
+    ~PerfCounters();
+    
+    bool open();
+    bool isAvailable() const;
+    void start();
+    void stop();
+    const PerfCounterValues& getValues() const { return values; }
+};
+
+#endif // PERF_COUNTERS_H
@@ -0,0 +1,122 @@
+#ifndef POINT_SET_H
+#define POINT_SET_H
+
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <utility>
+#include <vector>
+#include "tsp_metric.h"
+
+// 좌표 저장 방식 (spatial_solver --coords)
+// DOUBLE: float64 (기존과 같은 정밀도), FLOAT: float32, INT32: 정수 좌표 파일용 int32
+enum CoordinateMode {
+    COORDS_DOUBLE,
+    COORDS_FLOAT,
+    COORDS_INT32
+};
+
+// 점 좌표 한 개: x, y만 붙여 저장 (id는 배열 위치)
+// 각 Phase는 노드 번호로 임의 접근하므로 x/y를 따로 두는 SoA보다 한 점이 한 캐시 라인 안에 있는 편이 유리함
+template <typename T>
+struct PackedPoint {
+    T x, y;
+};
+
+// 점 집합: PackedPoint<T> 배열 하나 (float/int32이면 점당 8바이트, 기존 Point2D는 24바이트)
+// 거리 계산은 항상 double로 하므로 정수 좌표의 INT32 모드는 DOUBLE 모드와 비트 단위로 같은 거리를 냄
+template <typename T>
+class PointSet {
+public:
+    std::vector<PackedPoint<T>> points;
+
+    PointSet() {}
+
+    explicit PointSet(const std::vector<std::pair<double, double>>& coordinates) {
+        points.reserve(coordinates.size());
+        for (const std::pair<double, double>& c : coordinates) {
+            push_back(c.first, c.second);
+        }
+    }
+
+    int size() const { return (int)points.size(); }
+    double x(int i) const { return (double)points[i].x; }
+    double y(int i) const { return (double)points[i].y; }
+
+    double distance(int a, int b) const {
+        double dx = x(a) - x(b);
+        double dy = y(a) - y(b);
+        return sqrt(dx * dx + dy * dy);
+    }
+
+    // 집합 밖의 좌표 (px, py)까지의 거리
+    double distanceTo(int a, double px, double py) const {
+        double dx = x(a) - px;
+        double dy = y(a) - py;
+        return sqrt(dx * dx + dy * dy);
+    }
+
+    void push_back(double px, double py) {
+        PackedPoint<T> p;
+        p.x = convert(px);
+        p.y = convert(py);
+        points.push_back(p);
+    }
+
+    // ids[0..m)의 점만 모은 집합 (새 번호는 ids 안의 위치, 저장된 값을 그대로 복사)
+    PointSet subset(const int* ids, int m) const {
+        PointSet result;
+        result.points.reserve(m);
+        for (int i = 0; i < m; i++) {
+            result.points.push_back(points[ids[i]]);
+        }
+        return result;
+    }
+
+    size_t getMemoryBytes() const {
+        return points.capacity() * sizeof(PackedPoint<T>);
+    }
+
+private:
+    static T convert(double value);
+};
+
+template <>
+inline double PointSet<double>::convert(double value) { return value; }
+
+template <>
+inline float PointSet<float>::convert(double value) { return (float)value; }
+
+template <>
+inline int32_t PointSet<int32_t>::convert(double value) { return (int32_t)llround(value); }
+
+// 좌표 모드 선택과 정확성 검사 결과
+struct CoordinateCheck {
+    CoordinateMode mode;
+    size_t bytes_per_point;
+    int rounded_coordinates;      // 저장하면서 값이 바뀐 좌표 수 (x, y 각각)
+    double max_coordinate_error;  // 바뀐 좌표의 최대 절댓값 오차
+    int edge_mismatches;          // 투어 간선 중 TSPLIB 정수 거리가 원래 좌표와 다른 간선 수
+    bool exact;                   // 좌표가 하나도 바뀌지 않았거나 모든 간선의 정수 거리가 같음
+
+    CoordinateCheck() : mode(COORDS_DOUBLE), bytes_per_point(0), rounded_coordinates(0),
+                        max_coordinate_error(0), edge_mismatches(0), exact(true) {}
+};
+
+std::string coordinateModeName(CoordinateMode mode);
+
+// "auto", "double", "float", "int" 해석 (실패하면 false)
+// auto는 모든 좌표가 int32 범위의 정수이면 INT32, 아니면 DOUBLE
+bool parseCoordinateMode(const std::string& text, const std::vector<std::pair<double, double>>& coordinates,
+                         CoordinateMode& mode, std::string& error);
+
+// 모든 좌표가 int32 범위의 정수인지 (INT32 모드가 정확한지)
+bool hasIntegerCoordinates(const std::vector<std::pair<double, double>>& coordinates);
+
+// mode로 저장했을 때 좌표 오차와, tour의 각 간선에서 metric의 정수 거리가 원래 좌표의 값과 같은지 검사
+CoordinateCheck checkCoordinates(const std::vector<std::pair<double, double>>& coordinates,
+                                 CoordinateMode mode, const std::vector<int>& tour,
+                                 MetricType metric = METRIC_EUC_2D);
+
+#endif // POINT_SET_H
@@ -4,10 +4,15 @@
 #include <string>
 #include <vector>
 #include <fstream>
+#include <cstddef>
+#include "perf_counters.h"
+#include "json_output.h"
+#include "multi_start.h"
 
 struct SpatialStats {
     std::string dataset_name;
     int nodes;
+    int k;  // 후보 이웃 수
     double greedy_distance;
     double mst_distance;
     std::string winner;  // "Greedy" or "MST"
@@ -24,8 +29,51 @@ struct SpatialStats {
     double greedy_only_distance;
     double mst_only_distance;
     double final_distance;
+    
+    // 메모리 사용량 (단계별 할당 바이트, 주요 자료구조 크기, 최대 RSS)
+    size_t phase1_alloc_bytes;
+    size_t phase2_alloc_bytes;
+    size_t phase3_alloc_bytes;
+    size_t phase4_alloc_bytes;
+    size_t peak_heap_bytes;
+    size_t kdtree_bytes;
+    size_t candidate_bytes;
+    long peak_rss_kb;
+    
+    // 연산 횟수 (KD-tree 탐색 노드, 힙 연산, 2-opt 이동 평가)
+    long long kd_queries;
+    long long kd_nodes_visited;
+    long long heap_ops;
+    long long two_opt_evaluations;
+    
+    // 하드웨어 카운터 (--profile 모드, 측정 불가 시 -1)
+    PerfCounterValues phase1_counters;
+    PerfCounterValues kd_query_counters;
+    PerfCounterValues phase2_counters;
+    PerfCounterValues phase3_counters;
+    PerfCounterValues phase4_counters;
+    
+    // 다중 시작 (--starts): 시작점별 최종 투어 길이 분포, 스레드 수, Phase 4 이후 나머지 시작점을 실행한 시간
+    StartSpread start_spread;
+    int multi_start_threads;
+    double multi_start_wait_ms;
+    
+    SpatialStats() : nodes(0), k(0), greedy_distance(0), mst_distance(0), improvement_ratio(0),
+                     phase1_time_ms(0), phase2_time_ms(0), phase3_time_ms(0), phase4_time_ms(0),
+                     total_time_ms(0), greedy_only_distance(0), mst_only_distance(0), final_distance(0),
+                     phase1_alloc_bytes(0), phase2_alloc_bytes(0), phase3_alloc_bytes(0), phase4_alloc_bytes(0),
+                     peak_heap_bytes(0), kdtree_bytes(0), candidate_bytes(0), peak_rss_kb(0),
+                     kd_queries(0), kd_nodes_visited(0), heap_ops(0), two_opt_evaluations(0),
+                     multi_start_threads(1), multi_start_wait_ms(0) {}
 };
 
+void writePerfCounterValues(std::ofstream& file, const PerfCounterValues& values) {
+    file << "," << values.cycles
+         << "," << values.instructions
+         << "," << values.cache_misses
+         << "," << values.branch_misses;
+}
+
 void saveSpatialStats(const std::string& csv_file, const SpatialStats& stats) {
     std::ofstream file(csv_file, std::ios::app);
     if (file.is_open()) {
@@ -42,17 +90,130 @@ void saveSpatialStats(const std::string& csv_file, const SpatialStats& stats) {
              << stats.total_time_ms << ","
              << stats.greedy_only_distance << ","
              << stats.mst_only_distance << ","
-             << stats.final_distance << std::endl;
+             << stats.final_distance << ","
+             << stats.phase1_alloc_bytes << ","
+             << stats.phase2_alloc_bytes << ","
+             << stats.phase3_alloc_bytes << ","
+             << stats.phase4_alloc_bytes << ","
+             << stats.peak_heap_bytes << ","
+             << stats.kdtree_bytes << ","
+             << stats.candidate_bytes << ","
+             << stats.peak_rss_kb << ","
+             << stats.kd_queries << ","
+             << stats.kd_nodes_visited << ","
+             << stats.heap_ops << ","
+             << stats.two_opt_evaluations;
+        writePerfCounterValues(file, stats.phase1_counters);
+        writePerfCounterValues(file, stats.kd_query_counters);
+        writePerfCounterValues(file, stats.phase2_counters);
+        writePerfCounterValues(file, stats.phase3_counters);
+        writePerfCounterValues(file, stats.phase4_counters);
+        file << "," << stats.start_spread.starts
+             << "," << stats.start_spread.best_start
+             << "," << stats.start_spread.min_length
+             << "," << stats.start_spread.mean_length
+             << "," << stats.start_spread.max_length
+             << "," << stats.start_spread.std_length
+             << "," << stats.multi_start_wait_ms;
+        file << std::endl;
         file.close();
     }
 }
 
+JsonObject perfCounterValuesToJson(const PerfCounterValues& values) {
+    JsonObject json;
+    json.add("cycles", values.cycles)
+        .add("instructions", values.instructions)
+        .add("cache_misses", values.cache_misses)
+        .add("branch_misses", values.branch_misses);
+    return json;
+}
+
+// --json 레코드의 분석 항목 (parameters, phases, distances, memory, counts[, counters])
+// memory에는 호출 측에서 측정한 항목(graph_bytes 등)이 미리 들어 있을 수 있음
+void addSpatialStatsToJson(JsonObject& record, const SpatialStats& stats, JsonObject memory,
+                           bool include_counters) {
+    JsonObject parameters;
+    parameters.add("k", stats.k);
+    if (stats.start_spread.starts > 1) {
+        parameters.add("starts", stats.start_spread.starts);
+    }
+    
+    const char* phase_names[] = {"candidate_filtering", "greedy_insertion", "mst_construction", "two_opt"};
+    double phase_times[] = {stats.phase1_time_ms, stats.phase2_time_ms, stats.phase3_time_ms, stats.phase4_time_ms};
+    size_t phase_bytes[] = {stats.phase1_alloc_bytes, stats.phase2_alloc_bytes,
+                            stats.phase3_alloc_bytes, stats.phase4_alloc_bytes};
+    JsonObject phases;
+    for (int i = 0; i < 4; i++) {
+        JsonObject phase;
+        phase.add("name", phase_names[i])
+             .add("time_ms", phase_times[i])
+             .add("alloc_bytes", phase_bytes[i]);
+        phases.add("phase" + std::to_string(i + 1), phase);
+    }
+    phases.add("total_time_ms", stats.total_time_ms);
+    
+    JsonObject distances;
+    distances.add("greedy", stats.greedy_distance)
+             .add("mst", stats.mst_distance)
+             .add("winner", stats.winner)
+             .add("improvement_ratio", stats.improvement_ratio)
+             .add("final", stats.final_distance);
+    
+    memory.add("peak_rss_kb", stats.peak_rss_kb)
+          .add("peak_heap_bytes", stats.peak_heap_bytes)
+          .add("kdtree_bytes", stats.kdtree_bytes)
+          .add("candidate_bytes", stats.candidate_bytes);
+    
+    JsonObject counts;
+    counts.add("kd_queries", stats.kd_queries)
+          .add("kd_nodes_visited", stats.kd_nodes_visited)
+          .add("heap_ops", stats.heap_ops)
+          .add("two_opt_evaluations", stats.two_opt_evaluations);
+    
+    record.add("parameters", parameters)
+          .add("phases", phases)
+          .add("distances", distances)
+          .add("memory", memory)
+          .add("counts", counts);
+    
+    // 시작점이 하나면 분포가 최종 거리 하나뿐이므로 생략
+    if (stats.start_spread.starts > 1) {
+        JsonObject multi_start = startSpreadToJson(stats.start_spread, stats.multi_start_threads);
+        multi_start.add("wait_time_ms", stats.multi_start_wait_ms);
+        record.add("multi_start", multi_start);
+    }
+    
+    if (include_counters) {
+        JsonObject counters;
+        counters.add("phase1", perfCounterValuesToJson(stats.phase1_counters))
+                .add("kd_query", perfCounterValuesToJson(stats.kd_query_counters))
+                .add("phase2", perfCounterValuesToJson(stats.phase2_counters))
+                .add("phase3", perfCounterValuesToJson(stats.phase3_counters))
+                .add("phase4", perfCounterValuesToJson(stats.phase4_counters));
+        record.add("counters", counters);
+    }
+}
+
 void initSpatialStatsCSV(const std::string& csv_file) {
     std::ofstream file(csv_file);
     if (file.is_open()) {
         file << "Dataset,Nodes,GreedyDistance,MSTDistance,Winner,ImprovementRatio,"
              << "Phase1TimeMs,Phase2TimeMs,Phase3TimeMs,Phase4TimeMs,TotalTimeMs,"
-             << "GreedyOnlyDistance,MSTOnlyDistance,FinalDistance" << std::endl;
+             << "GreedyOnlyDistance,MSTOnlyDistance,FinalDistance,"
+             << "Phase1AllocBytes,Phase2AllocBytes,Phase3AllocBytes,Phase4AllocBytes,"
+             << "PeakHeapBytes,KDTreeBytes,CandidateBytes,PeakRSSKB,"
+             << "KDQueries,KDNodesVisited,HeapOps,TwoOptEvaluations";
+        const char* sections[] = {"Phase1", "KDQuery", "Phase2", "Phase3", "Phase4"};
+        for (int i = 0; i < 5; i++) {
+            file << "," << sections[i] << "Cycles"
+                 << "," << sections[i] << "Instructions"
+                 << "," << sections[i] << "CacheMisses"
+                 << "," << sections[i] << "BranchMisses";
+        }
+        file << ",Starts,BestStart,StartMinDistance,StartMeanDistance,StartMaxDistance,"
+             << "StartStdDistance,MultiStartWaitMs";
+        file << std::endl;
         file.close();
     }
 }
@@ -9,6 +9,8 @@
 #include <climits>
 #include <iomanip>
 #include <stdexcept>
+#include <map>
+#include "tsp_metric.h"
 
 using namespace std;
 
@@ -25,6 +27,7 @@ public:
     void addEdge(int u, int v, int cost);
     int getCost(int u, int v) const;
     int getNodeNum() const;
+    size_t getMemoryBytes() const;
 };
 
 // TSP 파일 파싱 함수들
@@ -32,10 +35,60 @@ CompleteGraph parseTSP(const string& filename);
 CompleteGraph parseTSPExplicit(const string& filename);
 vector<pair<double,double> > parseCoordinates(const string& filename);
 vector<pair<double,double> > parseDisplayCoordinates(const string& filename);
+vector<pair<double,double> > parseBinaryCoordinates(const string& filename);
+bool isBinaryTSP(const string& filename);
+bool hasExplicitWeights(const string& filename);
+
+// 좌표 기반 투어 길이 (metric의 TSPLIB 정수 거리, 완전 그래프 없이 계산)
+int calculateTourDistance(const vector<int>& tour, const vector<pair<double,double> >& coordinates,
+                          MetricType metric = METRIC_EUC_2D);
+
+// 결과 투어 길이 계산 (좌표 기반 솔버의 모든 모드가 공유)
+// EXPLICIT 파일은 간선 가중치 행렬(parseTSP)로, 나머지는 EDGE_WEIGHT_TYPE의 TSPLIB 거리로 계산
+// (EXPLICIT 파일의 좌표는 표시용이라 좌표 거리로는 실제 비용을 알 수 없음)
+class TourScorer {
+private:
+    bool explicit_weights;
+    MetricType metric_type;
+    TSPMetric metric;
+    CompleteGraph graph;  // EXPLICIT 파일만 (나머지는 빈 그래프)
+    
+public:
+    TourScorer(const string& tsp_filename, const vector<pair<double,double> >& coordinates);
+    
+    MetricType getMetricType() const { return metric_type; }
+    string getName() const { return explicit_weights ? "EXPLICIT" : metricName(metric_type); }
+    size_t getGraphBytes() const { return explicit_weights ? graph.getMemoryBytes() : 0; }
+    int tourLength(const vector<int>& tour) const;
+};
+
+// 명령행 인자: "--name" / "--name=value" 옵션과 위치 인자를 분리 (위치 인자 순서는 유지)
+struct SolverArgs {
+    vector<string> positional;
+    map<string, string> options;
+    
+    bool hasOption(const string& name) const;
+    string getOption(const string& name, const string& default_value = "") const;
+};
+
+SolverArgs parseSolverArgs(int argc, char* argv[]);
+
+// 파일 경로에서 데이터셋 이름 추출 (디렉토리와 확장자 제거)
+string getDatasetName(const string& filename);
 
 // 결과 저장 함수들
+// tour 파일 확장자가 .tourb이면 바이너리 형식으로 저장 (little-endian):
+//   "TOUR" | int32 version(=1) | int32 length | int32 reserved(=0)
+//   | int64 total_distance | uint64 coordinates_hash | int32 tour * length
+// 좌표는 tour 파일마다 복사하지 않고 <tour 디렉토리>/coordinates/<hash>.tspb에 한 번만 저장하며,
+// tour 파일 헤더에 그 경로(텍스트) 또는 해시(바이너리)를 기록합니다.
 void saveTourToFile(const vector<int>& tour, const vector<pair<double,double> >& coordinates, 
                     const string& tour_filename, int total_distance);
+bool isBinaryTourFile(const string& filename);
+unsigned long long hashCoordinates(const vector<pair<double,double> >& coordinates);
+string coordinatesHashHex(unsigned long long hash);
+string saveCoordinatesOnce(const vector<pair<double,double> >& coordinates,
+                           const string& tour_filename, unsigned long long hash);
 
 // TSP 솔루션 실행 및 저장 (템플릿으로 알고리즘을 받음)
 template<typename TSPAlgorithm>
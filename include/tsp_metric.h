@@ -0,0 +1,61 @@
+#ifndef TSP_METRIC_H
+#define TSP_METRIC_H
+
+#include <string>
+#include <utility>
+#include <vector>
+
+// TSPLIB 좌표 기반 간선 가중치 (EDGE_WEIGHT_TYPE)
+// EUC_2D: 반올림한 유클리드 거리, CEIL_2D: 올림한 유클리드 거리,
+// ATT: 의사 유클리드 거리 (sqrt(d^2 / 10)을 올림), GEO: 위도/경도 좌표의 지구 표면 거리 (km)
+enum MetricType {
+    METRIC_EUC_2D,
+    METRIC_CEIL_2D,
+    METRIC_ATT,
+    METRIC_GEO
+};
+
+std::string metricName(MetricType type);
+
+// TSPLIB 이름("EUC_2D", "CEIL_2D", "ATT", "GEO") 해석 (지원하지 않으면 false)
+bool parseMetricType(const std::string& name, MetricType& type);
+
+// TSP 파일 헤더의 EDGE_WEIGHT_TYPE
+// 바이너리 좌표 파일과 EDGE_WEIGHT_TYPE이 없는 파일은 EUC_2D
+// EXPLICIT 파일도 EUC_2D를 반환함 (가중치는 행렬에서 읽고, 표시용 좌표에는 유클리드 거리를 씀)
+// 그 밖의 타입(EUC_3D, MAN_2D 등)은 runtime_error
+MetricType readMetricType(const std::string& filename);
+
+// 두 좌표 사이의 TSPLIB 정수 거리 (좌표 한 쌍마다 변환하므로 반복 계산에는 TSPMetric 사용)
+int metricDistance(MetricType type, const std::pair<double, double>& p1, const std::pair<double, double>& p2);
+
+// 좌표 기반 간선 가중치: 완전 그래프 없이 O(n) 메모리로 TSPLIB 거리를 계산
+// 좌표는 x, y 배열 두 개(SoA)로 저장하고, GEO는 생성할 때 위도/경도를 라디안으로 한 번만 변환함
+// 여러 간선을 계산하는 함수는 타입 분기를 루프 밖에서 한 번만 하고, 루프 본문은 분기 없는 산술이라
+// 컴파일러가 벡터화할 수 있음
+class TSPMetric {
+private:
+    MetricType metric_type;
+    std::vector<double> xs;
+    std::vector<double> ys;
+
+public:
+    TSPMetric(const std::vector<std::pair<double, double>>& coordinates, MetricType type);
+
+    MetricType getType() const { return metric_type; }
+    int getNodeNum() const { return (int)xs.size(); }
+
+    int getCost(int a, int b) const;
+
+    // a에서 ids[0..count)까지의 거리를 out[0..count)에 저장
+    void costsFrom(int a, const int* ids, int count, int* out) const;
+
+    // 투어(시작점으로 돌아오는 노드 순서)의 길이
+    int tourLength(const std::vector<int>& tour) const;
+
+    size_t getMemoryBytes() const {
+        return (xs.capacity() + ys.capacity()) * sizeof(double);
+    }
+};
+
+#endif // TSP_METRIC_H
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Ablation 매트릭스 드라이버
+후보 백엔드, K, 초기 투어 구성, 2-opt 반복 횟수, 스레드 수의 그리드를 받아
+모든 조합을 spatial_ablation으로 실행하고 결과를 tidy 테이블 하나에 저장합니다.
+
+- (데이터셋, K, 스레드 수)마다 솔버를 한 번 실행하고, 나머지 축(백엔드 × 구성 × 2-opt)은
+  --variants로 넘깁니다. 솔버는 후보 그래프가 같은 변형끼리 Phase 2~4 결과를 재사용합니다.
+- 솔버 실행은 프로세스 풀에서 병렬로 진행합니다. 실행끼리 시간 측정이 간섭하지 않도록
+  기본 워커 수는 (CPU 수 / 그리드의 최대 스레드 수)입니다.
+- 그리드에 bruteforce 백엔드가 없으면 쓰지 않는 brute-force 기준선은 표본 질의로만 추정합니다.
+- 솔버가 항상 실행하는 기본 비교 변형 중 그리드에 없는 것은 테이블에서 제외합니다.
+
+출력:
+- results/ablation_matrix.csv: 변형 하나당 한 행 (solver_records.ABLATION_MATRIX_COLUMNS)
+- results/ablation_components.png, results/ablation_components_report.txt
+  (run_ablation_study.analyze_ablation_results가 구성 요소별 시간/품질 기여도를 그림)
+- 결과 저장소 "ablation_matrix" 테이블
+  (params k, threads, candidates, construction, two_opt_iterations)
+
+사용법: python3 ablation_matrix.py [데이터셋...] [--candidates kdtree,bruteforce]
+        [--k-values auto,10,20] [--constructions best,greedy,mst] [--two-opt 0,2]
+        [--threads 1,4] [--workers N] [--bf-sample S]
+"""
+
+import argparse
+import itertools
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from results_store import save_rows
+from solver_records import (
+    ABLATION_MATRIX_COLUMNS,
+    ablation_matrix_rows,
+    append_row,
+    failure_message,
+    init_csv,
+    run_solver_json,
+)
+
+BASE_DIR = Path(__file__).parent.parent
+
+CANDIDATE_BACKENDS = ["kdtree", "bruteforce"]
+CONSTRUCTIONS = ["best", "greedy", "mst"]
+# 그리드에 bruteforce 백엔드가 없을 때 brute-force 기준선을 추정할 표본 질의 수
+UNUSED_BF_SAMPLE = 256
+TIMEOUT = 7200
+
+
+def parse_choices(choices):
+    def parse(text):
+        values = [item.strip() for item in text.split(",") if item.strip()]
+        unknown = [value for value in values if value not in choices]
+        if not values or unknown:
+            raise argparse.ArgumentTypeError(
+                f"expected a comma-separated subset of {','.join(choices)}: {text}"
+            )
+        return list(dict.fromkeys(values))
+
+    return parse
+
+
+def parse_int_list(minimum, allow_auto=False):
+    """쉼표로 구분한 정수 목록 (allow_auto이면 "auto"는 None: 솔버 기본값)"""
+
+    def parse(text):
+        values = []
+        for item in (item.strip() for item in text.split(",")):
+            if not item:
+                continue
+            if allow_auto and item == "auto":
+                values.append(None)
+                continue
+            try:
+                value = int(item)
+            except ValueError:
+                raise argparse.ArgumentTypeError(f"invalid list: {text}")
+            if value < minimum:
+                raise argparse.ArgumentTypeError(f"invalid list: {text}")
+            values.append(value)
+        if not values:
+            raise argparse.ArgumentTypeError(f"invalid list: {text}")
+        return list(dict.fromkeys(values))
+
+    return parse
+
+
+def variant_specs(candidates, constructions, two_opt_values):
+    """백엔드 × 구성 × 2-opt 조합을 spatial_ablation --variants 항목으로 변환"""
+    return [
+        f"{backend}:{construction}:{iterations}"
+        for backend, construction, iterations in itertools.product(
+            candidates, constructions, two_opt_values
+        )
+    ]
+
+
+def run_cell(solver_path, dataset, k, threads, specs, bf_sample, timeout):
+    """
+    (데이터셋, K, 스레드 수) 한 칸을 실행하고 (행 목록, 오류 메시지)를 반환합니다.
+    프로세스 풀에서 실행되므로 모듈 최상위 함수입니다.
+    """
+    wanted = {tuple(spec.rsplit(":", 2)) for spec in specs}
+    with tempfile.TemporaryDirectory() as work_dir:
+        command = [
+            solver_path,
+            dataset,
+            Path(work_dir) / "tour.txt",
+            f"--threads={threads}",
+            "--variants=" + ",".join(specs),
+        ]
+        if k is not None:
+            command.append(f"--k={k}")
+        if bf_sample:
+            command.append(f"--bf-sample={bf_sample}")
+        try:
+            record, result = run_solver_json(command, timeout=timeout, cwd=work_dir)
+        except subprocess.TimeoutExpired:
+            return [], f"timeout ({timeout // 60} minutes exceeded)"
+
+    if result.returncode != 0 or record is None or record.get("status") != "SUCCESS":
+        return [], failure_message(record, result)
+    rows = [
+        row
+        for row in ablation_matrix_rows(record, threads)
+        if (row["Candidates"], row["Construction"], str(row["TwoOptIterations"]))
+        in wanted
+    ]
+    return rows, None
+
+
+def store_rows(rows):
+    """tidy 테이블 행을 결과 저장소 행으로 변환 (변형 축은 params로 기록)"""
+    stored = []
+    for row in rows:
+        row = dict(row)
+        row["solver"] = "Spatial-Algorithm-Ablation"
+        row["dataset"] = row.pop("Dataset")
+        row["params"] = {
+            "k": row["K"],
+            "threads": row["Threads"],
+            "candidates": row["Candidates"],
+            "construction": row["Construction"],
+            "two_opt_iterations": row["TwoOptIterations"],
+        }
+        stored.append(row)
+    return stored
+
+
+def run_ablation_matrix(
+    datasets=None,
+    candidates=("kdtree", "bruteforce"),
+    k_values=(None,),
+    constructions=("best", "greedy", "mst"),
+    two_opt_values=(0, 2),
+    threads_values=(1,),
+    workers=None,
+    bf_sample=None,
+    solver_path=None,
+    timeout=TIMEOUT,
+):
+    results_dir = BASE_DIR / "results"
+    results_dir.mkdir(exist_ok=True)
+    solver_path = solver_path or BASE_DIR / "build" / "spatial_ablation"
+
+    if not solver_path.exists():
+        print(f"❌ Spatial ablation solver not found: {solver_path}")
+        print("   Please run 'make ablation' first.")
+        return
+
+    datasets = datasets or sorted(
+        (BASE_DIR / "data").glob("*.tsp"), key=lambda p: p.stat().st_size
+    )
+    # 솔버는 임시 디렉토리에서 실행되므로 절대 경로로 전달
+    datasets = [Path(dataset).resolve() for dataset in datasets]
+    solver_path = Path(solver_path).resolve()
+    specs = variant_specs(candidates, constructions, two_opt_values)
+    if "bruteforce" not in candidates and not bf_sample:
+        bf_sample = UNUSED_BF_SAMPLE
+    cells = list(itertools.product(datasets, k_values, threads_values))
+    workers = workers or max(1, (os.cpu_count() or 1) // max(threads_values))
+    workers = max(1, min(workers, len(cells)))
+
+    matrix_csv = results_dir / "ablation_matrix.csv"
+    k_list = ", ".join("auto" if k is None else str(k) for k in k_values)
+    print("🧮 Spatial Algorithm Ablation Matrix")
+    print("=" * 60)
+    print(f"   Variants per run: {len(specs)} ({', '.join(specs)})")
+    print(f"   K values: {k_list}")
+    print(f"   Threads: {', '.join(str(t) for t in threads_values)}")
+    print(f"   {len(cells)} solver runs on {len(datasets)} datasets, {workers} workers")
+    print("=" * 60)
+
+    init_csv(matrix_csv, ABLATION_MATRIX_COLUMNS)
+    all_rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (
+                pool.submit(
+                    run_cell,
+                    solver_path,
+                    dataset,
+                    k,
+                    threads,
+                    specs,
+                    bf_sample,
+                    timeout,
+                ),
+                dataset,
+                k,
+                threads,
+            )
+            for dataset, k, threads in cells
+        ]
+        for future, dataset, k, threads in futures:
+            label = f"{dataset.name} K={'auto' if k is None else k} threads={threads}"
+            try:
+                rows, error = future.result()
+            except Exception as e:
+                rows, error = [], str(e)
+            if error is not None:
+                print(f"   ❌ {label}: {error}")
+                continue
+            for row in rows:
+                append_row(matrix_csv, ABLATION_MATRIX_COLUMNS, row)
+            all_rows.extend(rows)
+            reused = sum(row["ReusedPhases"] for row in rows)
+            print(f"   ✅ {label}: {len(rows)} variants, {reused} phases reused")
+
+    save_rows("ablation_matrix", store_rows(all_rows))
+    print("=" * 60)
+    print(f"📄 Results: {matrix_csv}")
+
+    if all_rows:
+        from run_ablation_study import analyze_ablation_results
+
+        analyze_ablation_results(matrix_csv, results_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the cross-product of spatial ablation settings "
+        "and write one tidy table"
+    )
+    parser.add_argument(
+        "datasets", nargs="*", type=Path, help="instances (default: data/*.tsp)"
+    )
+    parser.add_argument(
+        "--candidates",
+        type=parse_choices(CANDIDATE_BACKENDS),
+        default=CANDIDATE_BACKENDS,
+        help="candidate backends (default: kdtree,bruteforce)",
+    )
+    parser.add_argument(
+        "--k-values",
+        type=parse_int_list(1, allow_auto=True),
+        default=[None],
+        help="candidate K values; 'auto' uses min(30, max(10, n/10)) (default: auto)",
+    )
+    parser.add_argument(
+        "--constructions",
+        type=parse_choices(CONSTRUCTIONS),
+        default=CONSTRUCTIONS,
+        help="initial tours (default: best,greedy,mst)",
+    )
+    parser.add_argument(
+        "--two-opt",
+        type=parse_int_list(0),
+        default=[0, 2],
+        help="2-opt iteration counts (default: 0,2)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=parse_int_list(1),
+        default=[1],
+        help="brute-force KNN thread counts (default: 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="parallel solver runs (default: CPUs / max threads)",
+    )
+    parser.add_argument(
+        "--bf-sample",
+        type=int,
+        default=None,
+        help="estimate the brute-force baseline from this many random query points "
+        "(kdtree-only grids)",
+    )
+    parser.add_argument("--solver", type=Path, default=None)
+    parser.add_argument("--timeout", type=int, default=TIMEOUT)
+    args = parser.parse_args(argv)
+
+    if args.bf_sample and "bruteforce" in args.candidates:
+        parser.error("--bf-sample cannot be combined with the bruteforce backend")
+
+    run_ablation_matrix(
+        args.datasets,
+        args.candidates,
+        args.k_values,
+        args.constructions,
+        args.two_opt,
+        args.threads,
+        args.workers,
+        args.bf_sample,
+        args.solver,
+        args.timeout,
+    )
+
+
+if __name__ == "__main__":
+    main()
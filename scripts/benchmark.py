@@ -1,13 +1,206 @@
 #!/usr/bin/env python3
 
 import os
+import argparse
+import json
+import platform
+import sys
+import random
 import subprocess
 import csv
+import tempfile
+import threading
 import time
+from datetime import datetime
 from pathlib import Path
 
+from results_store import save_rows
+from solver_records import (
+    SPATIAL_COLUMNS,
+    failure_message,
+    init_csv,
+    parse_solver_record,
+    spatial_phase_columns,
+)
+from tsp_io import read_tsp_dimension
+from tune_k import tuned_k_args
 
-def run_benchmark():
+
+def parse_solver_output(stdout):
+    """
+    솔버 stdout에서 노드 수, 솔버 측정 시간(ms), 투어 거리, 메모리 사용량을 추출합니다.
+    --json 모드 레코드가 있으면 그것을 사용하고, 없으면 텍스트 출력을 파싱합니다.
+    """
+    parsed = {
+        "nodes": None,
+        "solver_time_ms": None,
+        "distance": None,
+        "graph_bytes": None,
+        "allocated_bytes": None,
+        "peak_rss_kb": None,
+        "phases": {},
+        "record": None,
+    }
+    record = parse_solver_record(stdout)
+    if record is not None:
+        memory = record.get("memory", {})
+        parsed.update(
+            {
+                "nodes": record.get("n"),
+                "solver_time_ms": record.get("time_ms"),
+                "distance": record.get("distance"),
+                "graph_bytes": memory.get("graph_bytes"),
+                "allocated_bytes": memory.get("allocated_bytes"),
+                "peak_rss_kb": memory.get("peak_rss_kb"),
+                "record": record,
+            }
+        )
+        if "phases" in record:
+            parsed["phases"] = spatial_phase_columns(record)
+        return parsed
+
+    for line in stdout.split("\n"):
+        if line.startswith("Nodes:"):
+            parsed["nodes"] = int(line.split(":")[1].strip())
+        elif line.startswith("Execution time:"):
+            parsed["solver_time_ms"] = float(line.split(":")[1].split()[0])
+        elif line.startswith("Tour distance:"):
+            parsed["distance"] = int(line.split(":")[1].strip())
+        elif line.startswith("Graph memory:"):
+            parsed["graph_bytes"] = int(line.split(":")[1].split()[0])
+        elif line.startswith("Allocated during solve:"):
+            parsed["allocated_bytes"] = int(line.split(":")[1].split()[0])
+        elif line.startswith("Peak RSS:"):
+            parsed["peak_rss_kb"] = int(line.split(":")[1].split()[0])
+    return parsed
+
+
+def run_with_rusage(command, timeout=None, cwd=None):
+    """
+    subprocess.run과 같이 솔버를 실행하되, os.wait4로 자식 프로세스를 직접 회수하여
+    벽시계 시간(ms)과 최대 RSS(KB)를 함께 반환합니다.
+    (result, wall_time_ms, max_rss_kb)
+    """
+    with tempfile.TemporaryFile("w+") as stdout, tempfile.TemporaryFile("w+") as stderr:
+        start_time = time.perf_counter()
+        process = subprocess.Popen(
+            command, stdout=stdout, stderr=stderr, text=True, cwd=cwd
+        )
+
+        # 타임아웃 시 타이머 스레드가 프로세스를 종료
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+        finally:
+            if timer:
+                timer.cancel()
+        end_time = time.perf_counter()
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+
+        stdout.seek(0)
+        stderr.seek(0)
+        result = subprocess.CompletedProcess(
+            command, process.returncode, stdout.read(), stderr.read()
+        )
+
+    # Linux는 KB, macOS는 바이트 단위. ru_maxrss는 fork 시점 부모(Python)의 RSS를
+    # 물려받으므로 작은 솔버에서는 하한이 생김 -> 솔버가 보고한 "Peak RSS"를 우선 사용
+    max_rss_kb = rusage.ru_maxrss
+    if sys.platform == "darwin":
+        max_rss_kb //= 1024
+    return result, (end_time - start_time) * 1000, max_rss_kb
+
+
+def percentile(sorted_samples, q):
+    """
+    정렬된 샘플에서 선형 보간으로 q 분위수(0~100)를 계산합니다.
+    """
+    if not sorted_samples:
+        return None
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    pos = (len(sorted_samples) - 1) * q / 100.0
+    lower = int(pos)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    frac = pos - lower
+    return sorted_samples[lower] * (1 - frac) + sorted_samples[upper] * frac
+
+
+def bootstrap_ci(samples, statistic, resamples=2000, confidence=0.95, seed=0):
+    """
+    부트스트랩 재표본으로 statistic의 신뢰구간을 추정합니다.
+    """
+    if len(samples) < 2:
+        value = statistic(sorted(samples)) if samples else None
+        return value, value
+
+    rng = random.Random(seed)
+    n = len(samples)
+    estimates = []
+    for _ in range(resamples):
+        resample = sorted(samples[rng.randrange(n)] for _ in range(n))
+        estimates.append(statistic(resample))
+    estimates.sort()
+
+    alpha = (1 - confidence) / 2 * 100
+    return percentile(estimates, alpha), percentile(estimates, 100 - alpha)
+
+
+def summarize_samples(samples, resamples=2000, confidence=0.95, seed=0):
+    """
+    반복 측정 샘플의 min/median/p95와 median·p95의 부트스트랩 신뢰구간을 계산합니다.
+    """
+    ordered = sorted(samples)
+    median = lambda s: percentile(s, 50)
+    p95 = lambda s: percentile(s, 95)
+
+    median_low, median_high = bootstrap_ci(
+        samples, median, resamples, confidence, seed
+    )
+    p95_low, p95_high = bootstrap_ci(samples, p95, resamples, confidence, seed)
+
+    return {
+        "count": len(ordered),
+        "min": ordered[0] if ordered else None,
+        "median": median(ordered),
+        "p95": p95(ordered),
+        "max": ordered[-1] if ordered else None,
+        "mean": sum(ordered) / len(ordered) if ordered else None,
+        "median_ci": [median_low, median_high],
+        "p95_ci": [p95_low, p95_high],
+        "samples": samples,
+    }
+
+
+def get_git_commit(base_dir):
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=base_dir,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return None
+
+
+def run_benchmark(
+    repeats=1, warmup=0, resamples=2000, confidence=0.95, seed=0, stats_file=None
+):
     # 디렉토리 설정
     base_dir = Path(__file__).parent.parent
     data_dir = base_dir / "data"
@@ -37,10 +230,27 @@ def run_benchmark():
     with open(csv_file, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(
-            ["Algorithm", "Dataset", "Nodes", "Time_ms", "Distance", "Status"]
+            [
+                "Algorithm",
+                "Dataset",
+                "Nodes",
+                "Time_ms",
+                "Distance",
+                "Status",
+                "PeakRSSKB",
+                "GraphBytes",
+                "AllocatedBytes",
+            ]
         )
 
+    # 반복 측정 통계 파일
+    if stats_file is None:
+        stats_file = results_dir / "benchmark_stats.json"
+    stats_records = []
+
     print("🚀 Starting TSP Algorithm Benchmark")
+    if repeats > 1 or warmup > 0:
+        print(f"   Repeats: {repeats}, Warmup runs: {warmup}")
     print("=" * 60)
 
     total_tests = 0
@@ -59,6 +269,9 @@ def run_benchmark():
 
             output_file = results_dir / f"{algorithm_name}_{dataset.stem}.txt"
 
+            # Spatial 솔버는 tune_k.py로 튜닝된 K가 있으면 사용
+            solver_options = tuned_k_args(dataset) if solver == "spatial_solver" else []
+
             print(f"  Running {algorithm_name:<20} ... ", end="", flush=True)
 
             try:
@@ -67,62 +280,133 @@ def run_benchmark():
                 if solver == "held_solver":
                     # Held-Karp는 15개 노드 이상에서는 실행하지 않음
                     try:
-                        with open(dataset, "r") as f:
-                            content = f.read()
-                            if "DIMENSION" in content:
-                                dimension_line = [
-                                    line
-                                    for line in content.split("\n")
-                                    if "DIMENSION" in line
-                                ][0]
-                                nodes = int(dimension_line.split()[1])
-                                if nodes > 30:
-                                    print("⏭️  SKIPPED (too large for Held-Karp)")
-                                    with open(csv_file, "a", newline="") as f:
-                                        writer = csv.writer(f)
-                                        writer.writerow(
-                                            [
-                                                algorithm_name,
-                                                dataset.stem,
-                                                nodes,
-                                                0,
-                                                0,
-                                                "SKIPPED",
-                                            ]
-                                        )
-                                    total_tests += 1
-                                    continue
-                    except:
-                        pass
+                        nodes = read_tsp_dimension(dataset)
+                    except (OSError, ValueError):
+                        nodes = None
+                    if nodes is not None and nodes > 30:
+                        print("⏭️  SKIPPED (too large for Held-Karp)")
+                        with open(csv_file, "a", newline="") as f:
+                            writer = csv.writer(f)
+                            writer.writerow(
+                                [
+                                    algorithm_name,
+                                    dataset.stem,
+                                    nodes,
+                                    0,
+                                    0,
+                                    "SKIPPED",
+                                    "",
+                                    "",
+                                    "",
+                                ]
+                            )
+                        total_tests += 1
+                        continue
                     timeout = 7200  # 2시간 타임아웃
 
-                # 알고리즘 실행
-                start_time = time.time()
-                result = subprocess.run(
-                    [str(solver_path), str(dataset), str(output_file), str(csv_file)],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    cwd=base_dir,
-                )
-                end_time = time.time()
+                # 워밍업 실행 (측정에서 제외)
+                for _ in range(warmup):
+                    run_with_rusage(
+                        [str(solver_path), str(dataset), str(output_file), "--json"]
+                        + solver_options,
+                        timeout=timeout,
+                        cwd=base_dir,
+                    )
+
+                # 알고리즘 실행 (CSV 행은 모든 측정 실행이 끝난 뒤 중앙값으로 기록)
+                wall_samples = []
+                solver_samples = []
+                rss_samples = []
+                parsed = {}
+                failed_result = None
+                for run in range(repeats):
+                    command = [str(solver_path), str(dataset), str(output_file)]
+                    command.append("--json")
+                    command += solver_options
+
+                    result, wall_ms, max_rss_kb = run_with_rusage(
+                        command, timeout=timeout, cwd=base_dir
+                    )
+
+                    if result.returncode != 0:
+                        failed_result = result
+                        break
 
-                if result.returncode == 0:
-                    execution_time = (end_time - start_time) * 1000  # ms로 변환
+                    wall_samples.append(wall_ms)
+                    parsed = parse_solver_output(result.stdout)
+                    rss_samples.append(parsed["peak_rss_kb"] or max_rss_kb)
+                    if parsed["solver_time_ms"] is not None:
+                        solver_samples.append(parsed["solver_time_ms"])
+
+                if failed_result is None:
+                    execution_time = sorted(wall_samples)[len(wall_samples) // 2]
+                    peak_rss_mb = max(rss_samples) / 1024
                     if execution_time > 60000:  # 1분 이상인 경우
-                        print(f"✅ SUCCESS ({execution_time/1000:.1f}s)")
+                        print(
+                            f"✅ SUCCESS ({execution_time/1000:.1f}s, {peak_rss_mb:.1f} MB)"
+                        )
                     else:
-                        print(f"✅ SUCCESS ({execution_time:.1f}ms)")
+                        print(
+                            f"✅ SUCCESS ({execution_time:.1f}ms, {peak_rss_mb:.1f} MB)"
+                        )
                     successful_tests += 1
+
+                    # 솔버 측정 시간은 중앙값, 최대 RSS는 반복 중 최댓값
+                    with open(csv_file, "a", newline="") as f:
+                        writer = csv.writer(f)
+                        writer.writerow(
+                            [
+                                algorithm_name,
+                                dataset.stem,
+                                parsed.get("nodes"),
+                                percentile(sorted(solver_samples), 50),
+                                parsed.get("distance"),
+                                "SUCCESS",
+                                max(rss_samples),
+                                parsed.get("graph_bytes"),
+                                parsed.get("allocated_bytes"),
+                            ]
+                        )
+
+                    stats_records.append(
+                        {
+                            "algorithm": algorithm_name,
+                            "dataset": dataset.stem,
+                            "nodes": parsed.get("nodes"),
+                            "distance": parsed.get("distance"),
+                            "status": "SUCCESS",
+                            "solver_time_ms": summarize_samples(
+                                solver_samples, resamples, confidence, seed
+                            ),
+                            "wall_time_ms": summarize_samples(
+                                wall_samples, resamples, confidence, seed
+                            ),
+                            "max_rss_kb": summarize_samples(
+                                rss_samples, resamples, confidence, seed
+                            ),
+                            "graph_bytes": parsed.get("graph_bytes"),
+                            "allocated_bytes": parsed.get("allocated_bytes"),
+                        }
+                    )
                 else:
                     print(f"❌ FAILED")
-                    print(f"     Error: {result.stderr.strip()}")
+                    failed_record = parse_solver_record(failed_result.stdout)
+                    print(
+                        f"     Error: {failure_message(failed_record, failed_result)}"
+                    )
                     # 실패한 경우에도 CSV에 기록
                     with open(csv_file, "a", newline="") as f:
                         writer = csv.writer(f)
                         writer.writerow(
-                            [algorithm_name, dataset.stem, 0, 0, 0, "FAILED"]
+                            [algorithm_name, dataset.stem, 0, 0, 0, "FAILED", "", "", ""]
                         )
+                    stats_records.append(
+                        {
+                            "algorithm": algorithm_name,
+                            "dataset": dataset.stem,
+                            "status": "FAILED",
+                        }
+                    )
 
                 total_tests += 1
 
@@ -130,24 +414,368 @@ def run_benchmark():
                 print(f"⏰ TIMEOUT")
                 with open(csv_file, "a", newline="") as f:
                     writer = csv.writer(f)
-                    writer.writerow([algorithm_name, dataset.stem, 0, 0, 0, "TIMEOUT"])
+                    writer.writerow(
+                        [algorithm_name, dataset.stem, 0, 0, 0, "TIMEOUT", "", "", ""]
+                    )
+                stats_records.append(
+                    {
+                        "algorithm": algorithm_name,
+                        "dataset": dataset.stem,
+                        "status": "TIMEOUT",
+                    }
+                )
                 total_tests += 1
 
             except Exception as e:
                 print(f"❌ ERROR: {str(e)}")
                 with open(csv_file, "a", newline="") as f:
                     writer = csv.writer(f)
-                    writer.writerow([algorithm_name, dataset.stem, 0, 0, 0, "ERROR"])
+                    writer.writerow(
+                        [algorithm_name, dataset.stem, 0, 0, 0, "ERROR", "", "", ""]
+                    )
+                stats_records.append(
+                    {
+                        "algorithm": algorithm_name,
+                        "dataset": dataset.stem,
+                        "status": "ERROR",
+                    }
+                )
                 total_tests += 1
 
+    # 반복 측정 통계 저장
+    git_commit = get_git_commit(base_dir)
+    with open(stats_file, "w") as f:
+        json.dump(
+            {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "git_commit": git_commit,
+                "host": platform.node(),
+                "repeats": repeats,
+                "warmup": warmup,
+                "bootstrap_resamples": resamples,
+                "confidence": confidence,
+                "results": stats_records,
+            },
+            f,
+            indent=2,
+        )
+
+    # 결과 저장소에 추가 (반복 측정값은 중앙값으로 기록)
+    median_of = lambda summary: summary["median"] if summary else None
+    save_rows(
+        "benchmark",
+        [
+            {
+                "solver": record["algorithm"],
+                "dataset": record["dataset"],
+                "Nodes": record.get("nodes"),
+                "Time_ms": median_of(record.get("solver_time_ms")),
+                "WallTimeMs": median_of(record.get("wall_time_ms")),
+                "Distance": record.get("distance"),
+                "Status": record["status"],
+                "PeakRSSKB": median_of(record.get("max_rss_kb")),
+                "GraphBytes": record.get("graph_bytes"),
+                "AllocatedBytes": record.get("allocated_bytes"),
+                "Repeats": repeats,
+                "GitCommit": git_commit,
+            }
+            for record in stats_records
+        ],
+    )
+
     print("\n" + "=" * 60)
     print(f"🏁 Benchmark Complete!")
     print(f"   Total tests: {total_tests}")
     print(f"   Successful: {successful_tests}")
     print(f"   Failed: {total_tests - successful_tests}")
     print(f"   Results saved to: {csv_file}")
+    print(f"   Statistics saved to: {stats_file}")
+    print("=" * 60)
+
+
+def run_scaling_sweep(
+    distributions,
+    sizes,
+    solvers,
+    repeats=1,
+    warmup=0,
+    fmt="tsp",
+    timeout=7200,
+    max_dense_nodes=20000,
+    seed=0,
+    profile=False,
+    partition_cell_size=20000,
+):
+    """
+    합성 인스턴스(uniform/clustered/grid/circle)를 크기별로 생성하여 솔버를 실행하고
+    실행 시간과 Spatial 알고리즘의 단계별 시간을 scaling_sweep.csv에 기록합니다.
+    solvers의 "spatial_partition"은 spatial_solver --partition (분할 후 이어붙이기) 실행입니다.
+    """
+    from generate_instances import generate_instance
+
+    base_dir = Path(__file__).parent.parent
+    build_dir = base_dir / "build"
+    results_dir = base_dir / "results"
+    generated_dir = base_dir / "data" / "generated"
+    sweep_dir = results_dir / "scaling_sweep"
+    sweep_dir.mkdir(parents=True, exist_ok=True)
+
+    sweep_csv = results_dir / "scaling_sweep.csv"
+    phase_columns = [
+        "Phase1TimeMs",
+        "Phase2TimeMs",
+        "Phase3TimeMs",
+        "Phase4TimeMs",
+        "TotalTimeMs",
+        "Phase1AllocBytes",
+        "Phase2AllocBytes",
+        "Phase3AllocBytes",
+        "Phase4AllocBytes",
+        "KDTreeBytes",
+        "CandidateBytes",
+    ]
+    with open(sweep_csv, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["Algorithm", "Distribution", "Dataset", "Nodes", "Run"]
+            + ["SolverTimeMs", "WallTimeMs", "Distance"]
+            + ["PeakRSSKB", "GraphBytes", "AllocatedBytes"]
+            + phase_columns
+            + ["Status"]
+        )
+    # 솔버는 파일이 없을 때만 헤더를 쓰므로, 이전 스윕의 행이 쌓이지 않도록 여기서 새로 만듦
+    analysis_csv = sweep_dir / "spatial_analysis.csv"
+    init_csv(analysis_csv, SPATIAL_COLUMNS)
+
+    algorithms = {
+        "spatial_solver": "Spatial-Algorithm",
+        "greedy_solver": "Greedy-TSP",
+        "mst_solver": "MST-2-Approximation",
+        "spatial_partition": "Spatial-Partition",
+    }
+    # 실행 파일이 아닌 솔버 이름: 이름 -> (실행 파일, 추가 인자)
+    pseudo_solvers = {
+        "spatial_partition": (
+            "spatial_solver",
+            [f"--partition={partition_cell_size}"],
+        ),
+    }
+
+    stored_rows = []
+    print("📈 Starting Scaling Sweep")
+    print(f"   Distributions: {', '.join(distributions)}")
+    print(f"   Sizes: {', '.join(str(n) for n in sizes)}")
     print("=" * 60)
 
+    for distribution in distributions:
+        for n in sorted(sizes):
+            dataset = generate_instance(distribution, n, generated_dir, fmt, seed)
+            print(f"\n📊 {dataset.name} ({n} nodes)")
+
+            for solver in solvers:
+                algorithm_name = algorithms.get(solver, solver)
+                executable, solver_options = pseudo_solvers.get(solver, (solver, []))
+                solver_path = build_dir / executable
+                if not solver_path.exists():
+                    print(f"  ❌ Solver not found: {solver_path}")
+                    continue
+
+                def write_row(run, parsed, wall_ms, max_rss_kb, phases, status):
+                    with open(sweep_csv, "a", newline="") as f:
+                        writer = csv.writer(f)
+                        writer.writerow(
+                            [algorithm_name, distribution, dataset.stem, n, run]
+                            + [parsed.get("solver_time_ms"), wall_ms]
+                            + [parsed.get("distance"), max_rss_kb]
+                            + [parsed.get("graph_bytes"), parsed.get("allocated_bytes")]
+                            + [phases.get(col) for col in phase_columns]
+                            + [status]
+                        )
+                    record = parsed.get("record") or {}
+                    stored_rows.append(
+                        {
+                            "solver": algorithm_name,
+                            "dataset": dataset.stem,
+                            "Distribution": distribution,
+                            "Nodes": n,
+                            "Run": run,
+                            "SolverTimeMs": parsed.get("solver_time_ms"),
+                            "WallTimeMs": wall_ms,
+                            "Distance": parsed.get("distance"),
+                            "PeakRSSKB": max_rss_kb,
+                            "GraphBytes": parsed.get("graph_bytes"),
+                            "AllocatedBytes": parsed.get("allocated_bytes"),
+                            **{col: phases.get(col) for col in phase_columns},
+                            "Status": status,
+                            "params": record.get("parameters", {}),
+                        }
+                    )
+
+                # 완전 그래프(n^2 메모리)를 만드는 솔버는 큰 인스턴스에서 제외
+                if executable != "spatial_solver" and n > max_dense_nodes:
+                    print(f"  {algorithm_name:<20} ⏭️  SKIPPED (dense graph)")
+                    write_row(0, {}, None, None, {}, "SKIPPED")
+                    continue
+
+                output_file = sweep_dir / f"{algorithm_name}_{dataset.stem}.txt"
+
+                print(f"  Running {algorithm_name:<20} ... ", end="", flush=True)
+                wall_samples = []
+                for run in range(warmup + repeats):
+                    # 워밍업 실행에서 실패하면 측정 실행이 없으므로 0번 실행으로 기록
+                    row_index = max(run - warmup, 0)
+                    command = [str(solver_path), str(dataset), str(output_file)]
+                    # 분석 CSV에는 측정 실행만 기록 (워밍업 실행 제외)
+                    if solver == "spatial_solver" and run >= warmup:
+                        command += ["", str(analysis_csv)]
+                        if profile:
+                            command.append("--profile")
+                    command += solver_options
+                    command.append("--json")
+
+                    try:
+                        result, wall_ms, max_rss_kb = run_with_rusage(
+                            command, timeout=timeout, cwd=base_dir
+                        )
+                    except subprocess.TimeoutExpired:
+                        print("⏰ TIMEOUT")
+                        write_row(row_index, {}, None, None, {}, "TIMEOUT")
+                        break
+
+                    if result.returncode != 0:
+                        print("❌ FAILED")
+                        write_row(row_index, {}, None, None, {}, "FAILED")
+                        break
+
+                    if run < warmup:
+                        continue
+
+                    wall_samples.append(wall_ms)
+                    parsed = parse_solver_output(result.stdout)
+                    max_rss_kb = parsed["peak_rss_kb"] or max_rss_kb
+                    write_row(
+                        row_index,
+                        parsed,
+                        wall_ms,
+                        max_rss_kb,
+                        parsed["phases"],
+                        "SUCCESS",
+                    )
+                else:
+                    median = percentile(sorted(wall_samples), 50)
+                    print(
+                        f"✅ SUCCESS ({median:.1f}ms median wall, "
+                        f"{max_rss_kb / 1024:.1f} MB peak RSS)"
+                    )
+
+    save_rows("scaling_sweep", stored_rows, params={"format": fmt, "seed": seed})
+
+    print("\n" + "=" * 60)
+    print(f"🏁 Scaling sweep complete: {sweep_csv}")
+    print("=" * 60)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TSP solver benchmark")
+    parser.add_argument(
+        "--repeats", type=int, default=1, help="measured runs per (solver, dataset)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=0, help="unmeasured runs before measuring"
+    )
+    parser.add_argument(
+        "--bootstrap", type=int, default=2000, help="bootstrap resamples for CIs"
+    )
+    parser.add_argument(
+        "--confidence", type=float, default=0.95, help="confidence level for CIs"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="bootstrap random seed")
+    parser.add_argument(
+        "--stats-file", type=Path, default=None, help="JSON statistics output path"
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="run the synthetic-instance scaling sweep instead of data/*.tsp",
+    )
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        default=["uniform", "clustered", "grid", "circle"],
+        help="sweep: instance distributions",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000],
+        help="sweep: node counts (up to 10M)",
+    )
+    parser.add_argument(
+        "--solvers",
+        nargs="+",
+        default=["spatial_solver", "greedy_solver", "mst_solver"],
+        help="sweep: solver executables, or spatial_partition "
+        "for spatial_solver --partition",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["tsp", "binary"],
+        default="binary",
+        help="sweep: generated instance format",
+    )
+    parser.add_argument(
+        "--max-dense-nodes",
+        type=int,
+        default=20000,
+        help="sweep: largest n for solvers that build the dense graph",
+    )
+    parser.add_argument(
+        "--partition-cell-size",
+        type=int,
+        default=20000,
+        help="sweep: cell size for spatial_partition",
+    )
+    parser.add_argument(
+        "--timeout", type=int, default=7200, help="sweep: per-run timeout (s)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="sweep: record hardware counters and operation counts in the spatial analysis CSV",
+    )
+    args = parser.parse_args(argv)
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative")
+
+    if args.sweep:
+        run_scaling_sweep(
+            args.distributions,
+            args.sizes,
+            args.solvers,
+            repeats=args.repeats,
+            warmup=args.warmup,
+            fmt=args.format,
+            timeout=args.timeout,
+            max_dense_nodes=args.max_dense_nodes,
+            seed=args.seed,
+            profile=args.profile,
+            partition_cell_size=args.partition_cell_size,
+        )
+        return
+
+    run_benchmark(
+        repeats=args.repeats,
+        warmup=args.warmup,
+        resamples=args.bootstrap,
+        confidence=args.confidence,
+        seed=args.seed,
+        stats_file=args.stats_file,
+    )
+
 
 if __name__ == "__main__":
-    run_benchmark()
+    main()
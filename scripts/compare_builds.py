@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+두 솔버 빌드(baseline / candidate)의 성능 회귀 검사 스크립트
+같은 데이터셋에서 두 빌드를 번갈아 실행하여 실행 시간, Spatial 알고리즘의
+단계별 시간, 최대 RSS, 투어 길이를 비교하고 임계값을 넘으면 0이 아닌 코드로 종료합니다.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmark import (
+    parse_solver_output,
+    percentile,
+    run_with_rusage,
+    summarize_samples,
+)
+from solver_records import failure_message, parse_solver_record
+
+# Spatial 솔버 --json 레코드에서 비교하는 단계별 시간 컬럼
+PHASE_COLUMNS = [
+    "Phase1TimeMs",
+    "Phase2TimeMs",
+    "Phase3TimeMs",
+    "Phase4TimeMs",
+    "TotalTimeMs",
+]
+
+DEFAULT_SOLVERS = ["spatial_solver", "greedy_solver", "mst_solver"]
+LARGE_DATASETS = ["kz9976", "mona-lisa100K"]
+
+
+def run_once(solver_path, dataset, work_dir, timeout):
+    """
+    솔버를 --json 모드로 한 번 실행하고 (솔버 시간, 벽시계 시간, 최대 RSS, 거리, 단계별 시간)을 반환합니다.
+    --json을 모르는 이전 빌드는 텍스트 출력으로 파싱되며 단계별 시간은 비교하지 않습니다.
+    """
+    output_file = work_dir / f"{solver_path.name}_{dataset.stem}.txt"
+    command = [
+        str(solver_path.resolve()),
+        str(dataset.resolve()),
+        str(output_file),
+        "--json",
+    ]
+
+    # 이전 빌드가 --json을 CSV 경로로 해석해도 파일이 작업 디렉토리에만 생기도록 cwd 지정
+    result, wall_ms, max_rss_kb = run_with_rusage(command, timeout=timeout, cwd=work_dir)
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            failure_message(parse_solver_record(result.stdout), result)
+        )
+
+    parsed = parse_solver_output(result.stdout)
+    parsed["wall_time_ms"] = wall_ms
+    parsed["max_rss_kb"] = parsed["peak_rss_kb"] or max_rss_kb
+    parsed["phases"] = {
+        col: parsed["phases"][col] for col in PHASE_COLUMNS if col in parsed["phases"]
+    }
+    return parsed
+
+
+def collect_samples(builds, solver, dataset, repeats, warmup, timeout, work_dir):
+    """
+    두 빌드를 같은 데이터셋에서 번갈아(ABBA 순서) 실행하여 측정값을 모읍니다.
+    """
+    samples = {
+        name: {
+            "solver_time_ms": [],
+            "wall_time_ms": [],
+            "max_rss_kb": [],
+            "distance": None,
+            "phases": {},
+        }
+        for name in builds
+    }
+    names = list(builds.keys())
+
+    for run in range(warmup + repeats):
+        # 실행 순서를 번갈아 바꿔 시간에 따른 시스템 잡음(열, 캐시)을 양쪽에 고르게 분산
+        order = names if run % 2 == 0 else names[::-1]
+        for name in order:
+            parsed = run_once(builds[name] / solver, dataset, work_dir, timeout)
+            if run < warmup:
+                continue
+
+            entry = samples[name]
+            if parsed["solver_time_ms"] is not None:
+                entry["solver_time_ms"].append(parsed["solver_time_ms"])
+            entry["wall_time_ms"].append(parsed["wall_time_ms"])
+            entry["max_rss_kb"].append(parsed["max_rss_kb"])
+            entry["distance"] = parsed["distance"]
+            for col, value in parsed["phases"].items():
+                entry["phases"].setdefault(col, []).append(value)
+
+    return samples
+
+
+def compare_metric(base, cand, max_slowdown, min_time_ms, resamples, seed):
+    """
+    두 빌드의 시간 샘플을 비교합니다. 중앙값 기준 slowdown이 임계값을 넘고
+    중앙값 신뢰구간이 겹치지 않을 때만 회귀로 판정합니다.
+    """
+    base_stats = summarize_samples(base, resamples, seed=seed)
+    cand_stats = summarize_samples(cand, resamples, seed=seed)
+
+    slowdown = None
+    regression = False
+    if base_stats["median"] and cand_stats["median"] is not None:
+        slowdown = cand_stats["median"] / base_stats["median"] - 1
+        significant = cand_stats["median_ci"][0] > base_stats["median_ci"][1]
+        measurable = max(base_stats["median"], cand_stats["median"]) >= min_time_ms
+        regression = slowdown > max_slowdown and significant and measurable
+
+    return {
+        "baseline": base_stats,
+        "candidate": cand_stats,
+        "slowdown": slowdown,
+        "regression": regression,
+    }
+
+
+def compare_memory(base, cand, max_growth, min_growth_kb):
+    """
+    두 빌드의 최대 RSS(KB)를 중앙값으로 비교합니다. RSS는 실행마다 거의 같으므로
+    증가율과 절대 증가량이 모두 임계값을 넘을 때 회귀로 판정합니다.
+    """
+    base_median = percentile(sorted(base), 50) if base else None
+    cand_median = percentile(sorted(cand), 50) if cand else None
+
+    growth = None
+    regression = False
+    if base_median and cand_median is not None:
+        growth = cand_median / base_median - 1
+        regression = growth > max_growth and cand_median - base_median >= min_growth_kb
+
+    return {
+        "baseline_kb": base_median,
+        "candidate_kb": cand_median,
+        "growth": growth,
+        "regression": regression,
+    }
+
+
+def compare_builds(args):
+    base_dir = Path(__file__).parent.parent
+    data_dir = base_dir / "data"
+    builds = {
+        "baseline": Path(args.baseline).resolve(),
+        "candidate": Path(args.candidate).resolve(),
+    }
+
+    for name, build_dir in builds.items():
+        for solver in args.solvers:
+            if not (build_dir / solver).exists():
+                print(f"❌ {name} solver not found: {build_dir / solver}")
+                return 2
+
+    if args.datasets:
+        datasets = [data_dir / f"{name}.tsp" for name in args.datasets]
+    else:
+        datasets = [
+            tsp_file
+            for tsp_file in data_dir.glob("*.tsp")
+            if tsp_file.stem not in LARGE_DATASETS
+        ]
+    datasets.sort(key=lambda x: x.stat().st_size)
+
+    print("⚖️  Solver Build Comparison")
+    print(f"   Baseline:  {builds['baseline']}")
+    print(f"   Candidate: {builds['candidate']}")
+    print(
+        f"   Repeats: {args.repeats}, Warmup: {args.warmup}, "
+        f"Max slowdown: {args.max_slowdown*100:.1f}%, "
+        f"Max quality loss: {args.max_quality_loss*100:.2f}%"
+    )
+    print("=" * 80)
+
+    report = []
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+
+        for dataset in datasets:
+            print(f"\n📊 Dataset: {dataset.name}")
+            print("-" * 80)
+
+            for solver in args.solvers:
+                try:
+                    samples = collect_samples(
+                        builds,
+                        solver,
+                        dataset,
+                        args.repeats,
+                        args.warmup,
+                        args.timeout,
+                        work_dir,
+                    )
+                except Exception as e:
+                    print(f"  ❌ {solver}: {e}")
+                    failures.append(f"{solver}/{dataset.stem}: run failed")
+                    continue
+
+                base, cand = samples["baseline"], samples["candidate"]
+                metrics = {}
+                metrics["solver_time_ms"] = compare_metric(
+                    base["solver_time_ms"],
+                    cand["solver_time_ms"],
+                    args.max_slowdown,
+                    args.min_time_ms,
+                    args.bootstrap,
+                    args.seed,
+                )
+                metrics["wall_time_ms"] = compare_metric(
+                    base["wall_time_ms"],
+                    cand["wall_time_ms"],
+                    args.max_slowdown,
+                    args.min_time_ms,
+                    args.bootstrap,
+                    args.seed,
+                )
+                for col in PHASE_COLUMNS:
+                    if col in base["phases"] and col in cand["phases"]:
+                        metrics[col] = compare_metric(
+                            base["phases"][col],
+                            cand["phases"][col],
+                            args.max_slowdown,
+                            args.min_time_ms,
+                            args.bootstrap,
+                            args.seed,
+                        )
+
+                memory = compare_memory(
+                    base["max_rss_kb"],
+                    cand["max_rss_kb"],
+                    args.max_memory_growth,
+                    args.min_memory_kb,
+                )
+
+                # 투어 길이 비교 (결정적이므로 단일 값 비교)
+                quality_loss = None
+                quality_regression = False
+                if base["distance"] and cand["distance"] is not None:
+                    quality_loss = (cand["distance"] - base["distance"]) / base[
+                        "distance"
+                    ]
+                    quality_regression = quality_loss > args.max_quality_loss
+
+                for metric_name, result in metrics.items():
+                    if result["slowdown"] is None:
+                        continue
+                    status = "❌ SLOWER" if result["regression"] else "✅"
+                    print(
+                        f"  {solver:<16} {metric_name:<16} "
+                        f"{result['baseline']['median']:>12.3f} -> "
+                        f"{result['candidate']['median']:>12.3f} ms "
+                        f"({result['slowdown']*100:+6.1f}%) {status}"
+                    )
+                    if result["regression"]:
+                        failures.append(
+                            f"{solver}/{dataset.stem}/{metric_name}: "
+                            f"{result['slowdown']*100:+.1f}% slower"
+                        )
+
+                if memory["growth"] is not None:
+                    status = "❌ LARGER" if memory["regression"] else "✅"
+                    print(
+                        f"  {solver:<16} {'PeakRSS':<16} "
+                        f"{memory['baseline_kb']:>12.0f} -> "
+                        f"{memory['candidate_kb']:>12.0f} KB "
+                        f"({memory['growth']*100:+6.1f}%) {status}"
+                    )
+                    if memory["regression"]:
+                        failures.append(
+                            f"{solver}/{dataset.stem}/PeakRSS: "
+                            f"{memory['growth']*100:+.1f}% more memory"
+                        )
+
+                if quality_loss is not None:
+                    status = "❌ WORSE" if quality_regression else "✅"
+                    print(
+                        f"  {solver:<16} {'Distance':<16} "
+                        f"{base['distance']:>12} -> {cand['distance']:>12}    "
+                        f"({quality_loss*100:+6.2f}%) {status}"
+                    )
+                    if quality_regression:
+                        failures.append(
+                            f"{solver}/{dataset.stem}/Distance: "
+                            f"{quality_loss*100:+.2f}% longer tour"
+                        )
+
+                report.append(
+                    {
+                        "solver": solver,
+                        "dataset": dataset.stem,
+                        "baseline_distance": base["distance"],
+                        "candidate_distance": cand["distance"],
+                        "quality_loss": quality_loss,
+                        "quality_regression": quality_regression,
+                        "metrics": metrics,
+                        "memory": memory,
+                    }
+                )
+
+    report_file = Path(args.report)
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_file, "w") as f:
+        json.dump(
+            {
+                "baseline": str(builds["baseline"]),
+                "candidate": str(builds["candidate"]),
+                "repeats": args.repeats,
+                "warmup": args.warmup,
+                "max_slowdown": args.max_slowdown,
+                "max_quality_loss": args.max_quality_loss,
+                "min_time_ms": args.min_time_ms,
+                "max_memory_growth": args.max_memory_growth,
+                "failures": failures,
+                "results": report,
+            },
+            f,
+            indent=2,
+        )
+
+    print("\n" + "=" * 80)
+    print(f"   Report saved to: {report_file}")
+    if failures:
+        print(f"❌ {len(failures)} regression(s) detected:")
+        for failure in failures:
+            print(f"   • {failure}")
+        print("=" * 80)
+        return 1
+
+    print("✅ No regressions detected")
+    print("=" * 80)
+    return 0
+
+
+def main():
+    base_dir = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(
+        description="Compare two solver builds and fail on performance regressions"
+    )
+    parser.add_argument("--baseline", required=True, help="baseline build directory")
+    parser.add_argument("--candidate", required=True, help="candidate build directory")
+    parser.add_argument(
+        "--datasets", nargs="+", help="dataset names in data/ (default: all but large)"
+    )
+    parser.add_argument(
+        "--solvers", nargs="+", default=DEFAULT_SOLVERS, help="solver executables"
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=0.10,
+        help="allowed median slowdown ratio (0.10 = 10%%)",
+    )
+    parser.add_argument(
+        "--max-quality-loss",
+        type=float,
+        default=0.0,
+        help="allowed tour length increase ratio (0.01 = 1%%)",
+    )
+    parser.add_argument(
+        "--min-time-ms",
+        type=float,
+        default=1.0,
+        help="ignore slowdowns of timings below this value",
+    )
+    parser.add_argument(
+        "--max-memory-growth",
+        type=float,
+        default=0.10,
+        help="allowed peak RSS increase ratio (0.10 = 10%%)",
+    )
+    parser.add_argument(
+        "--min-memory-kb",
+        type=int,
+        default=1024,
+        help="ignore peak RSS increases smaller than this many KB",
+    )
+    parser.add_argument("--bootstrap", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=int, default=7200)
+    parser.add_argument(
+        "--report",
+        default=str(base_dir / "results" / "build_comparison.json"),
+        help="JSON report path",
+    )
+    args = parser.parse_args()
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    sys.exit(compare_builds(args))
+
+
+if __name__ == "__main__":
+    main()
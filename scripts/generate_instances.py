@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+스케일링 벤치마크용 합성 TSP 인스턴스 생성 스크립트
+uniform / clustered / grid / circle 분포의 인스턴스를 1K~10M 노드 규모로
+TSPLIB 텍스트(.tsp) 또는 바이너리(.tspb) 형식으로 생성합니다.
+
+바이너리 형식 (little-endian, tsp_common.cpp의 parseBinaryCoordinates와 동일):
+    "TSPB" | int32 version(=1) | int32 dimension | float64 x, y * dimension
+"""
+
+import argparse
+import math
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+DISTRIBUTIONS = ["uniform", "clustered", "grid", "circle"]
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000, 10000000]
+
+# 평균 최근접 이웃 거리가 노드 수와 무관하게 일정하도록 좌표 범위를 sqrt(n)에 비례시킴
+NODE_SPACING = 100.0
+
+BINARY_MAGIC = b"TSPB"
+BINARY_VERSION = 1
+
+
+def side_length(n):
+    return NODE_SPACING * math.sqrt(n)
+
+
+def uniform_points(n, rng):
+    side = side_length(n)
+    for _ in range(n):
+        yield rng.random() * side, rng.random() * side
+
+
+def clustered_points(n, rng, points_per_cluster=1000):
+    """
+    가우시안 클러스터 분포 (클러스터당 평균 points_per_cluster개)
+    """
+    side = side_length(n)
+    num_clusters = max(1, n // points_per_cluster)
+    centers = [(rng.random() * side, rng.random() * side) for _ in range(num_clusters)]
+    sigma = side / (4.0 * math.sqrt(num_clusters))
+    for _ in range(n):
+        cx, cy = centers[rng.randrange(num_clusters)]
+        x = min(max(rng.gauss(cx, sigma), 0.0), side)
+        y = min(max(rng.gauss(cy, sigma), 0.0), side)
+        yield x, y
+
+
+def grid_points(n, rng=None):
+    columns = int(math.ceil(math.sqrt(n)))
+    for i in range(n):
+        yield (i % columns) * NODE_SPACING, (i // columns) * NODE_SPACING
+
+
+def circle_points(n, rng=None):
+    radius = NODE_SPACING * n / (2 * math.pi)
+    for i in range(n):
+        angle = 2 * math.pi * i / n
+        yield radius * math.cos(angle), radius * math.sin(angle)
+
+
+GENERATORS = {
+    "uniform": uniform_points,
+    "clustered": clustered_points,
+    "grid": grid_points,
+    "circle": circle_points,
+}
+
+
+def instance_name(distribution, n):
+    return f"{distribution}{n}"
+
+
+def write_tsplib(path, name, comment, points, n, chunk_size=100000):
+    """
+    TSPLIB EUC_2D 형식으로 저장합니다. 좌표는 소수점 이하 2자리로 기록합니다.
+    """
+    with open(path, "w") as f:
+        f.write(f"NAME: {name}\n")
+        f.write(f"COMMENT: {comment}\n")
+        f.write("TYPE: TSP\n")
+        f.write(f"DIMENSION: {n}\n")
+        f.write("EDGE_WEIGHT_TYPE: EUC_2D\n")
+        f.write("NODE_COORD_SECTION\n")
+
+        lines = []
+        for i, (x, y) in enumerate(points, 1):
+            lines.append(f"{i} {x:.2f} {y:.2f}\n")
+            if len(lines) >= chunk_size:
+                f.writelines(lines)
+                lines = []
+        f.writelines(lines)
+        f.write("EOF\n")
+
+
+def write_binary(path, points, n, chunk_size=100000):
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sii", BINARY_MAGIC, BINARY_VERSION, n))
+
+        buffer = array("d")
+        for x, y in points:
+            buffer.append(x)
+            buffer.append(y)
+            if len(buffer) >= 2 * chunk_size:
+                if sys.byteorder != "little":
+                    buffer.byteswap()
+                buffer.tofile(f)
+                buffer = array("d")
+        if sys.byteorder != "little":
+            buffer.byteswap()
+        buffer.tofile(f)
+
+
+def generate_instance(distribution, n, output_dir, fmt="tsp", seed=0, overwrite=False):
+    """
+    인스턴스 하나를 생성하고 파일 경로를 반환합니다.
+    이미 존재하는 파일은 overwrite=True가 아니면 다시 생성하지 않습니다.
+    """
+    if distribution not in GENERATORS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    name = instance_name(distribution, n)
+    extension = "tspb" if fmt == "binary" else "tsp"
+    path = output_dir / f"{name}.{extension}"
+    if path.exists() and not overwrite:
+        return path
+
+    # 분포와 크기마다 고정된 시드로 재현 가능하게 생성
+    rng = random.Random(f"{seed}-{distribution}-{n}")
+    points = GENERATORS[distribution](n, rng)
+
+    if fmt == "binary":
+        write_binary(path, points, n)
+    else:
+        comment = f"Synthetic {distribution} instance (seed {seed})"
+        write_tsplib(path, name, comment, points, n)
+
+    return path
+
+
+def main():
+    base_dir = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic TSP instances for scaling benchmarks"
+    )
+    parser.add_argument(
+        "--distributions", nargs="+", default=DISTRIBUTIONS, choices=DISTRIBUTIONS
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--format", choices=["tsp", "binary"], default="tsp")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output-dir", type=Path, default=base_dir / "data" / "generated"
+    )
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args()
+
+    print("🧪 Generating synthetic TSP instances")
+    print("=" * 60)
+    for distribution in args.distributions:
+        for n in args.sizes:
+            path = generate_instance(
+                distribution, n, args.output_dir, args.format, args.seed, args.overwrite
+            )
+            size_mb = path.stat().st_size / (1024 * 1024)
+            print(f"   {path.name:<30} ({size_mb:.1f} MB)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+후보 이웃 수(K) 실험
+spatial_solver --k-sweep으로 데이터셋마다 K 값별 거리와 시간을 측정합니다.
+
+솔버는 KD-tree 구축과 kNN 질의(Phase 1)를 가장 큰 K로 한 번만 수행하고,
+작은 K의 후보 목록은 거리순으로 정렬된 목록의 앞부분을 잘라 만든 뒤 Phase 2~4만 K마다 실행합니다.
+따라서 Time_ms는 K별 (후보 목록 잘라내기 + Phase 2~4) 시간이고,
+공유된 Phase 1 시간은 Phase1SharedTimeMs 컬럼에 따로 기록됩니다.
+
+출력:
+- results/k_value_experiment_results.csv: Dataset, K, Distance, Time_ms, Phase1SharedTimeMs
+- results/k_value_summary_table.csv: 데이터셋별 최단 거리 K, 최단 시간 K, K=20 기준 대비 개선율
+- 결과 저장소 "k_value" 테이블 (params k)
+
+사용법: python3 k_value_experiment.py [데이터셋...] [--k-values 5,8,10,...] [--repeats N]
+"""
+
+import argparse
+from pathlib import Path
+
+from results_store import save_rows
+from solver_records import append_row, failure_message, init_csv, run_solver_json
+
+BASE_DIR = Path(__file__).parent.parent
+
+# 기존 k_value_experiment_results.csv와 같은 K 범위
+K_VALUES = [5, 8, 10, 12, 15, 18, 20, 25, 30, 35, 40, 50]
+BASELINE_K = 20
+
+RESULT_COLUMNS = ["Dataset", "K", "Distance", "Time_ms", "Phase1SharedTimeMs"]
+SUMMARY_COLUMNS = [
+    "Dataset",
+    "Nodes",
+    "Best_K_Distance",
+    "Best_Distance",
+    "Fastest_K",
+    "Fastest_Time_ms",
+    "K20_Baseline_Distance",
+    "K20_Baseline_Time_ms",
+    "Distance_Improvement_Percent",
+    "Time_Improvement_Percent",
+]
+
+
+def parse_k_values(text):
+    try:
+        values = sorted({int(item) for item in text.split(",") if item.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid K list: {text}")
+    if not values or values[0] < 1:
+        raise argparse.ArgumentTypeError(f"invalid K list: {text}")
+    return values
+
+
+def run_sweep(solver_path, dataset, output_file, k_values, repeats=1):
+    """
+    --k-sweep을 repeats번 실행해 (노드 수, 공유 Phase 1 시간, K별 결과 목록)을 반환합니다.
+    시간은 반복 중 최솟값을 사용합니다 (거리는 K마다 결정적).
+    """
+    k_arg = "--k-sweep=" + ",".join(str(k) for k in k_values)
+    nodes = None
+    phase1_times = []
+    results = {}
+    for _ in range(repeats):
+        record, result = run_solver_json(
+            [solver_path, dataset, output_file, k_arg], cwd=BASE_DIR
+        )
+        if (
+            result.returncode != 0
+            or record is None
+            or record.get("status") != "SUCCESS"
+        ):
+            raise RuntimeError(failure_message(record, result))
+        nodes = record["n"]
+        phase1_times.append(record["phase1"]["time_ms"])
+        for entry in record["k_sweep"]:
+            previous = results.get(entry["k"])
+            if previous is None or entry["time_ms"] < previous["time_ms"]:
+                results[entry["k"]] = entry
+    return nodes, min(phase1_times), [results[k] for k in sorted(results)]
+
+
+def improvement_percent(baseline, value):
+    return f"{(baseline - value) / baseline * 100:.1f}%" if baseline else ""
+
+
+def summary_row(dataset_name, nodes, results):
+    """K별 결과로 요약 테이블 행을 만듭니다 (동률이면 작은 K)."""
+    best = min(results, key=lambda r: (r["distance"], r["k"]))
+    fastest = min(results, key=lambda r: (r["time_ms"], r["k"]))
+    row = {
+        "Dataset": dataset_name,
+        "Nodes": nodes,
+        "Best_K_Distance": best["k"],
+        "Best_Distance": best["distance"],
+        "Fastest_K": fastest["k"],
+        "Fastest_Time_ms": round(fastest["time_ms"], 1),
+    }
+    baseline = next((r for r in results if r["k"] == BASELINE_K), None)
+    if baseline is not None:
+        row.update(
+            {
+                "K20_Baseline_Distance": baseline["distance"],
+                "K20_Baseline_Time_ms": round(baseline["time_ms"], 1),
+                "Distance_Improvement_Percent": improvement_percent(
+                    baseline["distance"], best["distance"]
+                ),
+                "Time_Improvement_Percent": improvement_percent(
+                    baseline["time_ms"], fastest["time_ms"]
+                ),
+            }
+        )
+    return row
+
+
+def run_k_value_experiment(
+    datasets=None, k_values=K_VALUES, repeats=1, solver_path=None
+):
+    build_dir = BASE_DIR / "build"
+    results_dir = BASE_DIR / "results"
+    results_dir.mkdir(exist_ok=True)
+    solver_path = solver_path or build_dir / "spatial_solver"
+
+    if not solver_path.exists():
+        print(f"❌ Spatial solver not found: {solver_path}")
+        print("   Please run 'make spatial' first.")
+        return
+
+    datasets = datasets or sorted(
+        (BASE_DIR / "data").glob("*.tsp"), key=lambda p: p.stat().st_size
+    )
+    results_csv = results_dir / "k_value_experiment_results.csv"
+    summary_csv = results_dir / "k_value_summary_table.csv"
+
+    print("🔢 Starting K-value experiment")
+    k_list = ", ".join(str(k) for k in k_values)
+    print(f"   K values: {k_list} (shared phase 1 at K={max(k_values)})")
+    print("=" * 60)
+
+    init_csv(results_csv, RESULT_COLUMNS)
+    init_csv(summary_csv, SUMMARY_COLUMNS)
+    stored_rows = []
+
+    for dataset in datasets:
+        print(f"📊 Sweeping: {dataset.name}")
+        output_file = results_dir / f"k_sweep_{dataset.stem}.txt"
+        try:
+            nodes, phase1_ms, results = run_sweep(
+                solver_path, dataset, output_file, k_values, repeats
+            )
+        except Exception as e:
+            print(f"   ❌ FAILED: {e}")
+            continue
+
+        for entry in results:
+            row = {
+                "Dataset": dataset.stem,
+                "K": entry["k"],
+                "Distance": entry["distance"],
+                "Time_ms": entry["time_ms"],
+                "Phase1SharedTimeMs": phase1_ms,
+            }
+            append_row(results_csv, RESULT_COLUMNS, row)
+            stored = dict(row)
+            stored["solver"] = "Spatial-Algorithm"
+            stored["dataset"] = stored.pop("Dataset")
+            stored["params"] = {"k": stored.pop("K")}
+            stored["Nodes"] = nodes
+            stored_rows.append(stored)
+
+        summary = summary_row(dataset.stem, nodes, results)
+        append_row(summary_csv, SUMMARY_COLUMNS, summary)
+        print(
+            f"   ✅ Best K={summary['Best_K_Distance']} ({summary['Best_Distance']}), "
+            f"fastest K={summary['Fastest_K']} ({summary['Fastest_Time_ms']} ms), "
+            f"shared phase 1 {phase1_ms:.1f} ms"
+        )
+
+    save_rows("k_value", stored_rows)
+    print("=" * 60)
+    print(f"📄 Results: {results_csv}")
+    print(f"📄 Summary: {summary_csv}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Sweep the spatial solver's candidate K "
+        "with one shared kNN query per dataset"
+    )
+    parser.add_argument(
+        "datasets", nargs="*", type=Path, help="instances to sweep (default: data/*.tsp)"
+    )
+    parser.add_argument(
+        "--k-values",
+        type=parse_k_values,
+        default=K_VALUES,
+        help="comma-separated K values (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="runs per dataset; the minimum time is kept",
+    )
+    parser.add_argument("--solver", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    run_k_value_experiment(
+        args.datasets, args.k_values, max(1, args.repeats), args.solver
+    )
+
+
+if __name__ == "__main__":
+    main()
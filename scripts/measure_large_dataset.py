@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
-import subprocess
 import time
 from pathlib import Path
 
+from solver_records import failure_message, run_solver_json
+
 
 def measure_large_dataset():
     base_dir = Path(__file__).parent.parent
@@ -42,31 +43,24 @@ def measure_large_dataset():
         try:
             start_time = time.time()
 
-            result = subprocess.run(
-                [str(solver_path), str(dataset), str(output_file)],
-                capture_output=True,
-                text=True,
-                cwd=base_dir,
+            record, result = run_solver_json(
+                [solver_path, dataset, output_file], cwd=base_dir
             )
 
             end_time = time.time()
             execution_time = end_time - start_time
 
-            if result.returncode == 0:
+            if result.returncode == 0 and record is not None:
                 print(f"✅ SUCCESS!")
                 print(
                     f"   Execution time: {execution_time:.2f} seconds ({execution_time/60:.2f} minutes)"
                 )
 
-                # 결과에서 거리 추출
-                output_lines = result.stdout.split("\n")
-                distance = None
-                for line in output_lines:
-                    if "Tour distance:" in line:
-                        distance = int(line.split(":")[1].strip())
-                        break
-
+                distance = record["distance"]
+                peak_rss_mb = record["memory"]["peak_rss_kb"] / 1024
+                print(f"   Solver time: {record['time_ms'] / 1000:.2f} seconds")
                 print(f"   Tour distance: {distance}")
+                print(f"   Peak RSS: {peak_rss_mb:.1f} MB")
                 results.append(
                     {
                         "algorithm": algorithm_name,
@@ -77,7 +71,7 @@ def measure_large_dataset():
 
             else:
                 print(f"❌ FAILED")
-                print(f"   Error: {result.stderr.strip()}")
+                print(f"   Error: {failure_message(record, result)}")
 
         except Exception as e:
             print(f"❌ ERROR: {str(e)}")
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 
 import subprocess
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-import numpy as np
+
+from report_builder import build_reports, report_job
+from results_store import save_rows
+from solver_records import (
+    SPATIAL_COLUMNS,
+    append_row,
+    failure_message,
+    init_csv,
+    run_solver_json,
+    store_row,
+    spatial_row,
+)
+from tune_k import tuned_k_args
 
 
 def run_mst_vs_greedy_analysis():
@@ -36,6 +45,10 @@ def run_mst_vs_greedy_analysis():
     print("🔬 MST vs Greedy Performance Analysis")
     print("=" * 60)
 
+    # Build the analysis CSV from the solver's --json records
+    init_csv(analysis_csv, SPATIAL_COLUMNS)
+    stored_rows = []
+
     # Run analysis for each dataset
     for i, dataset in enumerate(datasets):
         print(f"📊 Analyzing ({i+1}/{len(datasets)}): {dataset.name}")
@@ -43,30 +56,28 @@ def run_mst_vs_greedy_analysis():
         output_file = results_dir / f"analysis_{dataset.stem}.txt"
 
         try:
-            result = subprocess.run(
-                [
-                    str(solver_path),
-                    str(dataset),
-                    str(output_file),
-                    "",
-                    str(analysis_csv),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=base_dir,
+            record, result = run_solver_json(
+                [solver_path, dataset, output_file, *tuned_k_args(dataset)],
                 timeout=300,  # 5 minute timeout
+                cwd=base_dir,
             )
 
-            if result.returncode == 0:
+            if result.returncode == 0 and record is not None:
                 print(f"   ✅ Success")
+                row = spatial_row(record)
+                append_row(analysis_csv, SPATIAL_COLUMNS, row)
+                stored_rows.append(store_row(record, row))
             else:
-                print(f"   ❌ Failed: {result.stderr.strip()}")
+                print(f"   ❌ Failed: {failure_message(record, result)}")
 
         except subprocess.TimeoutExpired:
             print(f"   ⏰ Timeout (over 5 minutes)")
         except Exception as e:
             print(f"   ❌ Error: {str(e)}")
 
+    # Append to the results store
+    save_rows("spatial_analysis", stored_rows)
+
     # Analyze results and generate graphs
     if analysis_csv.exists():
         analyze_mst_vs_greedy(analysis_csv, results_dir)
@@ -74,21 +85,53 @@ def run_mst_vs_greedy_analysis():
         print("❌ No analysis results found.")
 
 
-def analyze_mst_vs_greedy(csv_file, output_dir):
-    print("\n📈 Generating MST vs Greedy Analysis Results...")
+def load_analysis_results(csv_file):
+    import pandas as pd
 
     try:
         df = pd.read_csv(csv_file)
         print(f"   📝 Total {len(df)} datasets analyzed")
     except Exception as e:
         print(f"❌ Failed to read CSV file: {e}")
-        return
+        return None
 
     if df.empty:
         print("❌ No analysis data found.")
-        return
+        return None
+    return df
+
+
+def report_jobs(csv_file, output_dir):
+    """Figure and report jobs, rendered in parallel by report_builder"""
+    df = load_analysis_results(csv_file)
+    if df is None:
+        return []
+    return [
+        report_job(
+            "mst_vs_greedy_analysis_en.png",
+            plot_mst_vs_greedy,
+            [df],
+            ["mst_vs_greedy_analysis_en.png"],
+        ),
+        report_job(
+            "mst_vs_greedy_report_en.txt",
+            generate_detailed_report,
+            [df],
+            ["mst_vs_greedy_report_en.txt"],
+        ),
+    ]
+
+
+def analyze_mst_vs_greedy(csv_file, output_dir):
+    print("\n📈 Generating MST vs Greedy Analysis Results...")
+    build_reports(report_jobs(csv_file, output_dir), output_dir)
+
 
+def plot_mst_vs_greedy(df, output_dir):
     # Color settings
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     plt.style.use("default")
     colors = ["#2E86AB", "#A23B72", "#F18F01", "#C73E1D"]
 
@@ -230,11 +273,9 @@ def analyze_mst_vs_greedy(csv_file, output_dir):
     plt.savefig(
         output_dir / "mst_vs_greedy_analysis_en.png", dpi=300, bbox_inches="tight"
     )
+    plt.close(fig)
     print(f"   📊 Graph saved: {output_dir / 'mst_vs_greedy_analysis_en.png'}")
 
-    # Generate detailed report
-    generate_detailed_report(df, output_dir)
-
 
 def generate_detailed_report(df, output_dir):
     report_file = output_dir / "mst_vs_greedy_report_en.txt"
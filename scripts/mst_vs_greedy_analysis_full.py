@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 
 import subprocess
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-import numpy as np
+
+from report_builder import build_reports, report_job
+from results_store import save_rows
+from solver_records import (
+    COUNTER_FIELDS,
+    COUNTER_SECTIONS,
+    SPATIAL_COLUMNS,
+    append_row,
+    failure_message,
+    init_csv,
+    run_solver_json,
+    store_row,
+    spatial_row,
+)
+from tune_k import tuned_k_args
 
 
 def run_mst_vs_greedy_analysis():
@@ -41,6 +52,10 @@ def run_mst_vs_greedy_analysis():
         print(f"   {i+1:2d}. {dataset.name:<20} ({size_mb:.2f} MB)")
     print("=" * 80)
 
+    # 솔버의 --json 레코드로 분석 CSV를 새로 작성
+    init_csv(analysis_csv, SPATIAL_COLUMNS)
+    stored_rows = []
+
     # 각 데이터셋에 대해 분석 실행
     for i, dataset in enumerate(datasets):
         print(f"\n📊 Analyzing ({i+1}/{len(datasets)}): {dataset.name}")
@@ -56,39 +71,38 @@ def run_mst_vs_greedy_analysis():
 
         try:
             print(f"   🚀 Starting analysis...")
-            result = subprocess.run(
-                [
-                    str(solver_path),
-                    str(dataset),
-                    str(output_file),
-                    "",
-                    str(analysis_csv),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=base_dir,
+            record, result = run_solver_json(
+                [solver_path, dataset, output_file, *tuned_k_args(dataset)],
                 timeout=timeout,
+                cwd=base_dir,
             )
 
-            if result.returncode == 0:
+            if result.returncode == 0 and record is not None:
                 print(f"   ✅ Success")
+                row = spatial_row(record)
+                append_row(analysis_csv, SPATIAL_COLUMNS, row)
+                stored_rows.append(store_row(record, row))
                 # 결과 미리보기
-                if output_file.exists():
-                    with open(output_file, "r") as f:
-                        lines = f.readlines()
-                        if len(lines) >= 2:
-                            print(f"   📋 Result preview: {lines[1].strip()}")
+                distances = record["distances"]
+                print(
+                    f"   📋 Result preview: {distances['winner']} wins, "
+                    f"final distance {distances['final']}, "
+                    f"{record['time_ms']:.1f} ms"
+                )
             else:
-                print(f"   ❌ Failed: {result.stderr.strip()}")
+                print(f"   ❌ Failed: {failure_message(record, result)}")
 
         except subprocess.TimeoutExpired:
             print(f"   ⏰ Timeout ({timeout//3600} hours exceeded)")
             print(f"   📝 Marking as timeout in results...")
             # 타임아웃된 경우에도 CSV에 기록
-            mark_timeout_result(analysis_csv, dataset.name)
+            mark_timeout_result(analysis_csv, dataset.stem)
         except Exception as e:
             print(f"   ❌ Error: {str(e)}")
 
+    # 결과 저장소에 추가
+    save_rows("spatial_analysis", stored_rows)
+
     # 결과 분석 및 그래프 생성
     if analysis_csv.exists():
         analyze_mst_vs_greedy_full(analysis_csv, results_dir)
@@ -98,22 +112,28 @@ def run_mst_vs_greedy_analysis():
 
 def mark_timeout_result(csv_file, dataset_name):
     """타임아웃된 결과를 CSV에 기록"""
-    import os
-
-    # CSV 파일이 없으면 헤더 생성
-    if not os.path.exists(csv_file):
-        with open(csv_file, "w") as f:
-            f.write(
-                "Dataset,Nodes,GreedyDistance,MSTDistance,Winner,ImprovementRatio,Phase1TimeMs,Phase2TimeMs,Phase3TimeMs,Phase4TimeMs,TotalTimeMs,GreedyOnlyDistance,MSTOnlyDistance,FinalDistance\n"
-            )
-
-    # 타임아웃 기록 추가
-    with open(csv_file, "a") as f:
-        f.write(f"{dataset_name},-1,-1,-1,TIMEOUT,0,0,0,0,0,0,-1,-1,-1\n")
+    row = {column: 0 for column in SPATIAL_COLUMNS}
+    row.update(
+        {
+            "Dataset": dataset_name,
+            "Nodes": -1,
+            "GreedyDistance": -1,
+            "MSTDistance": -1,
+            "Winner": "TIMEOUT",
+            "GreedyOnlyDistance": -1,
+            "MSTOnlyDistance": -1,
+            "FinalDistance": -1,
+        }
+    )
+    for section, _ in COUNTER_SECTIONS:
+        for field, _ in COUNTER_FIELDS:
+            row[f"{section}{field}"] = -1
+    append_row(csv_file, SPATIAL_COLUMNS, row)
 
 
-def analyze_mst_vs_greedy_full(csv_file, output_dir):
-    print("\n📈 Generating Complete MST vs Greedy Analysis Results...")
+def load_full_results(csv_file):
+    """분석 CSV를 읽어 (성공, 타임아웃) DataFrame으로 나눕니다. 실패하면 None."""
+    import pandas as pd
 
     try:
         df = pd.read_csv(csv_file)
@@ -133,13 +153,64 @@ def analyze_mst_vs_greedy_full(csv_file, output_dir):
 
     except Exception as e:
         print(f"❌ Failed to read CSV file: {e}")
-        return
+        return None
 
     if df_success.empty:
         print("❌ No successful analysis data found.")
-        return
+        return None
+    return df_success, df_timeout
+
+
+def dataset_inventory(df_success):
+    """data 폴더의 전체 데이터셋 크기와 분석 성공 여부"""
+    import pandas as pd
+
+    all_datasets_info = []
+    for dataset in Path(__file__).parent.parent.glob("data/*.tsp"):
+        if not dataset.name.startswith("."):
+            all_datasets_info.append(
+                {
+                    "name": dataset.stem,
+                    "size_mb": dataset.stat().st_size / (1024 * 1024),
+                    "success": dataset.stem in df_success["Dataset"].values,
+                }
+            )
+    return pd.DataFrame(all_datasets_info)
+
+
+def report_jobs(csv_file, output_dir):
+    """그래프와 보고서 작업 목록 (report_builder에서 병렬로 생성)"""
+    results = load_full_results(csv_file)
+    if results is None:
+        return []
+    df_success, df_timeout = results
+    all_datasets_df = dataset_inventory(df_success)
+    return [
+        report_job(
+            "mst_vs_greedy_analysis_complete.png",
+            plot_mst_vs_greedy_full,
+            [df_success, all_datasets_df],
+            ["mst_vs_greedy_analysis_complete.png"],
+        ),
+        report_job(
+            "mst_vs_greedy_complete_report.txt",
+            generate_comprehensive_report,
+            [df_success, df_timeout, all_datasets_df],
+            ["mst_vs_greedy_complete_report.txt"],
+        ),
+    ]
+
 
+def analyze_mst_vs_greedy_full(csv_file, output_dir):
+    print("\n📈 Generating Complete MST vs Greedy Analysis Results...")
+    build_reports(report_jobs(csv_file, output_dir), output_dir)
+
+
+def plot_mst_vs_greedy_full(df_success, all_datasets_df, output_dir):
     # Color settings
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     plt.style.use("default")
     colors = ["#2E86AB", "#A23B72", "#F18F01", "#C73E1D", "#6A994E"]
 
@@ -300,20 +371,6 @@ def analyze_mst_vs_greedy_full(csv_file, output_dir):
     # 6. Dataset size distribution and success rate
     ax6 = plt.subplot(3, 2, 6)
 
-    # 전체 데이터셋 정보
-    all_datasets_info = []
-    for dataset in Path(__file__).parent.parent.glob("data/*.tsp"):
-        if not dataset.name.startswith("."):
-            all_datasets_info.append(
-                {
-                    "name": dataset.stem,
-                    "size_mb": dataset.stat().st_size / (1024 * 1024),
-                    "success": dataset.stem in df_success["Dataset"].values,
-                }
-            )
-
-    all_datasets_df = pd.DataFrame(all_datasets_info)
-
     # 성공/실패로 색상 구분
     colors_success = [
         colors[2] if success else colors[3] for success in all_datasets_df["success"]
@@ -346,13 +403,11 @@ def analyze_mst_vs_greedy_full(csv_file, output_dir):
     plt.savefig(
         output_dir / "mst_vs_greedy_analysis_complete.png", dpi=300, bbox_inches="tight"
     )
+    plt.close(fig)
     print(
         f"   📊 Complete analysis graph saved: {output_dir / 'mst_vs_greedy_analysis_complete.png'}"
     )
 
-    # Generate comprehensive report
-    generate_comprehensive_report(df_success, df_timeout, all_datasets_df, output_dir)
-
 
 def generate_comprehensive_report(df_success, df_timeout, all_datasets_df, output_dir):
     report_file = output_dir / "mst_vs_greedy_complete_report.txt"
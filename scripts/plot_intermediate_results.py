@@ -5,22 +5,51 @@ import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+import results_store
+
+
+def load_from_store(algorithms):
+    """
+    결과 저장소의 intermediate 테이블에서 필요한 컬럼만 읽어
+    기존 intermediate_result.csv와 같은 wide 형식으로 변환합니다.
+    """
+    if not results_store.is_available():
+        return None
+    tidy = results_store.query(
+        "intermediate",
+        columns=["dataset", "solver", "Nodes", "Optimal", "Distance", "Time_ms"],
+        solver=algorithms,
+    )
+    if tidy.empty:
+        return None
+
+    wide = tidy.pivot_table(
+        index=["dataset", "Nodes", "Optimal"],
+        columns="solver",
+        values=["Distance", "Time_ms"],
+        aggfunc="last",
+    )
+    wide.columns = [f"{value}_{solver}" for value, solver in wide.columns]
+    wide = wide.reset_index().rename(columns={"dataset": "Dataset"})
+    return wide.sort_values("Nodes").reset_index(drop=True)
+
 
 def plot_intermediate_results():
     # 데이터 로드
     base_dir = Path(__file__).parent.parent
     csv_file = base_dir / "results" / "intermediate_result.csv"
+    algorithms = ["Greedy-TSP", "MST-2-Approximation", "Spatial-Algorithm"]
 
-    if not csv_file.exists():
-        print(f"❌ File not found: {csv_file}")
-        return
-
-    # CSV 파일 읽기 (Average 행 제외)
-    df = pd.read_csv(csv_file, sep="\t")
-    df = df[df["Dataset"] != "Average"].copy()  # Average 행 제거
+    # 결과 저장소가 있으면 사용하고, 없으면 CSV 파일 읽기 (Average 행 제외)
+    df = load_from_store(algorithms)
+    if df is None:
+        if not csv_file.exists():
+            print(f"❌ File not found: {csv_file}")
+            return
+        df = pd.read_csv(csv_file, sep="\t")
+        df = df[df["Dataset"] != "Average"].copy()  # Average 행 제거
 
     # 데이터 정리
-    algorithms = ["Greedy-TSP", "MST-2-Approximation", "Spatial-Algorithm"]
     colors = ["#1f77b4", "#ff7f0e", "#2ca02c"]  # Blue, Orange, Green
 
     # OOM 값들을 NaN으로 변환
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+분석 리포트 빌더
+분석 스크립트의 그래프(300 dpi PNG)와 텍스트 보고서를 프로세스 풀에서 병렬로 생성합니다.
+
+- 각 스크립트는 report_jobs(csv_file, output_dir)로 작업 목록을 만듭니다.
+  CSV는 부모 프로세스에서 한 번만 읽고, 같은 DataFrame을 모든 작업이 공유합니다.
+- 작업은 (이름, 함수, 인자, 출력 파일)이며 함수는 func(*args, output_dir)로 호출됩니다.
+  프로세스 풀에서 실행되므로 함수는 모듈 최상위 함수여야 합니다.
+- 워커는 비대화형 Agg 백엔드를 사용합니다.
+- 입력 데이터, 작업 함수, 함수가 정의된 소스 파일의 지문이 이전 빌드와 같고
+  출력 파일이 모두 있으면 다시 그리지 않습니다 (지문은 results/cache/reports.json).
+
+사용법: python3 report_builder.py [--force] [--workers N]  (모든 분석 출력 다시 생성)
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+RESULTS_DIR = BASE_DIR / "results"
+MANIFEST_PATH = RESULTS_DIR / "cache" / "reports.json"
+
+# 전체 재생성 대상: (모듈, 분석 CSV)
+REPORT_SOURCES = [
+    ("spatial_analysis", "spatial_analysis.csv"),
+    ("run_ablation_study", "spatial_ablation_study.csv"),
+    ("run_ablation_study", "ablation_matrix.csv"),
+    ("mst_vs_greedy_analysis_en", "mst_vs_greedy_analysis.csv"),
+    ("mst_vs_greedy_analysis_full", "mst_vs_greedy_analysis_full.csv"),
+]
+
+
+def report_job(name, func, args, outputs):
+    return {"name": name, "func": func, "args": tuple(args), "outputs": list(outputs)}
+
+
+def _hash_value(digest, value):
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        digest.update(json.dumps([str(c) for c in value.columns]).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+def fingerprint(job):
+    """입력 데이터 + 함수 이름 + 함수 소스 파일 내용의 sha1"""
+    func = job["func"]
+    source = Path(inspect.getfile(func))
+    digest = hashlib.sha1()
+    # 스크립트로 직접 실행하면 __module__이 "__main__"이므로 파일 이름을 사용
+    digest.update(f"{source.stem}.{func.__qualname__}".encode())
+    digest.update(source.read_bytes())
+    for value in job["args"]:
+        _hash_value(digest, value)
+    return digest.hexdigest()
+
+
+def _manifest_key(job, output_dir):
+    return f"{Path(output_dir).resolve()}:{job['name']}"
+
+
+def _load_manifest():
+    try:
+        with open(MANIFEST_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_suffix(f".tmp.{os.getpid()}")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def _init_worker():
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+
+
+def _run_job(func, args, output_dir):
+    start = time.perf_counter()
+    func(*args, output_dir)
+    return time.perf_counter() - start
+
+
+def build_reports(jobs, output_dir, force=False, workers=None):
+    """
+    작업 목록을 output_dir에 생성하고 (생성한 작업 수, 건너뛴 작업 수)를 반환합니다.
+    """
+    manifest = _load_manifest()
+    output_dir = Path(output_dir)
+    pending = []
+    skipped = 0
+    for job in jobs:
+        key = _manifest_key(job, output_dir)
+        job_fingerprint = fingerprint(job)
+        outputs_exist = all((output_dir / name).exists() for name in job["outputs"])
+        if not force and outputs_exist and manifest.get(key) == job_fingerprint:
+            skipped += 1
+            continue
+        pending.append((job, key, job_fingerprint))
+
+    if skipped:
+        print(f"   ♻️  {skipped} report outputs unchanged - skipped")
+    if not pending:
+        return 0, skipped
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+    print(f"   🎨 Rendering {len(pending)} report outputs with {workers} workers")
+
+    built = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            (pool.submit(_run_job, job["func"], job["args"], output_dir), job, key, fp)
+            for job, key, fp in pending
+        ]
+        for future, job, key, job_fingerprint in futures:
+            try:
+                elapsed = future.result()
+            except Exception as e:
+                print(f"   ❌ {job['name']} failed: {e}")
+                manifest.pop(key, None)
+                continue
+            print(f"   ✅ {job['name']} ({elapsed:.1f} s)")
+            manifest[key] = job_fingerprint
+            built += 1
+
+    _save_manifest(manifest)
+    return built, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Regenerate all analysis figures and reports from their CSV files"
+    )
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR)
+    parser.add_argument(
+        "--force", action="store_true", help="re-render even if inputs are unchanged"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    print("📈 Building analysis reports")
+    start = time.perf_counter()
+    jobs = []
+    for module_name, csv_name in REPORT_SOURCES:
+        csv_file = args.results_dir / csv_name
+        if not csv_file.exists():
+            print(f"   ⏭️  {csv_name} not found - skipping {module_name}")
+            continue
+        module = importlib.import_module(module_name)
+        jobs.extend(module.report_jobs(csv_file, args.results_dir))
+
+    built, skipped = build_reports(jobs, args.results_dir, args.force, args.workers)
+    print(
+        f"✅ {built} built, {skipped} unchanged in {time.perf_counter() - start:.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
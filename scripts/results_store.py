@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+컬럼 기반 결과 저장소 (Parquet)
+벤치마크/분석 결과를 results/store 아래의 append-only 파티션 데이터셋으로 저장합니다.
+
+레이아웃 (hive 파티셔닝):
+    results/store/<table>/solver=<solver>/dataset=<dataset>/<run_id>-<uuid>.parquet
+
+- 한 번의 실행(run_id)은 (solver, dataset) 파티션마다 파일 하나를 새로 추가하며 기존 파일은 수정하지 않습니다.
+- 각 행에는 run_id, 파라미터 키(params, 정렬된 JSON)와 param_<이름> 컬럼이 함께 기록됩니다.
+- 조회 시 필요한 컬럼만 읽고, solver/dataset 필터는 디렉토리 단위로 건너뜁니다.
+
+pyarrow는 저장소를 실제로 읽거나 쓸 때만 import합니다.
+pyarrow가 없으면 save_rows는 경고만 출력하고 기존 CSV 출력은 그대로 동작합니다.
+"""
+
+import argparse
+import csv
+import json
+import math
+import uuid
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote
+
+BASE_DIR = Path(__file__).parent.parent
+STORE_DIR = BASE_DIR / "results" / "store"
+PARTITION_KEYS = ["solver", "dataset"]
+
+_warned_unavailable = False
+
+
+def is_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def new_run_id():
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def params_key(params):
+    return json.dumps(params or {}, sort_keys=True)
+
+
+def _column_values(rows, column):
+    """
+    컬럼 타입 규칙: 모든 값이 bool이면 bool, 숫자면 float64, 그 외는 문자열.
+    파일마다 타입이 달라지지 않도록 정수도 float64로 저장하고,
+    값이 모두 비어 있으면 다른 파일의 타입과 합쳐질 수 있도록 null 타입으로 둡니다.
+    """
+    values = [row.get(column) for row in rows]
+    present = [v for v in values if v is not None and v != ""]
+    if not present:
+        return "null", [None] * len(values)
+    if present and all(isinstance(v, bool) for v in present):
+        return "bool", [v if v != "" else None for v in values]
+    if present and all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in present
+    ):
+        return "float64", [float(v) if v not in (None, "") else None for v in values]
+    return "string", [str(v) if v not in (None, "") else None for v in values]
+
+
+def _to_arrow_table(rows):
+    import pyarrow as pa
+
+    columns = []
+    for row in rows:
+        for column in row:
+            if column not in columns and column not in PARTITION_KEYS:
+                columns.append(column)
+
+    arrays = {}
+    for column in columns:
+        type_name, values = _column_values(rows, column)
+        arrays[column] = pa.array(values, type=getattr(pa, type_name)())
+    return pa.table(arrays)
+
+
+def append(table, rows, run_id=None, params=None, store_dir=None):
+    """
+    행(dict) 목록을 테이블에 추가하고 run_id를 반환합니다.
+    각 행은 solver와 dataset 키를 가져야 하며, 행별 파라미터는 "params" 키(dict)로 전달합니다.
+    """
+    import pyarrow.parquet as pq
+
+    store_dir = Path(store_dir or STORE_DIR)
+    run_id = run_id or new_run_id()
+
+    partitions = {}
+    for row in rows:
+        row_params = dict(params or {})
+        row_params.update(row.get("params") or {})
+        flat = {key: value for key, value in row.items() if key != "params"}
+        flat["run_id"] = run_id
+        flat["params"] = params_key(row_params)
+        for name, value in row_params.items():
+            flat[f"param_{name}"] = value
+        key = tuple(str(flat.get(k) or "unknown") for k in PARTITION_KEYS)
+        partitions.setdefault(key, []).append(flat)
+
+    for key, partition_rows in partitions.items():
+        partition_dir = store_dir / table
+        for name, value in zip(PARTITION_KEYS, key):
+            partition_dir = partition_dir / f"{name}={quote(value, safe='')}"
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        path = partition_dir / f"{run_id}-{uuid.uuid4().hex[:8]}.parquet"
+        pq.write_table(_to_arrow_table(partition_rows), path)
+
+    return run_id
+
+
+def save_rows(table, rows, run_id=None, params=None, store_dir=None):
+    """
+    드라이버 스크립트용 append: pyarrow가 없으면 한 번만 경고하고 건너뜁니다.
+    """
+    global _warned_unavailable
+
+    if not rows:
+        return None
+    if not is_available():
+        if not _warned_unavailable:
+            print("⚠️  pyarrow not installed - skipping results store (CSV only)")
+            _warned_unavailable = True
+        return None
+    run_id = append(table, rows, run_id, params, store_dir)
+    print(f"🗄️  Stored {len(rows)} rows in results store: {table} (run {run_id})")
+    return run_id
+
+
+def list_tables(store_dir=None):
+    store_dir = Path(store_dir or STORE_DIR)
+    if not store_dir.exists():
+        return []
+    return sorted(p.name for p in store_dir.iterdir() if p.is_dir())
+
+
+def _open_dataset(table, store_dir=None):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    table_dir = Path(store_dir or STORE_DIR) / table
+    files = sorted(str(p) for p in table_dir.rglob("*.parquet"))
+    if not files:
+        return None
+
+    # 실행마다 컬럼이 추가될 수 있으므로 파일 footer의 스키마를 합쳐서 사용
+    partition_schema = pa.schema([(key, pa.string()) for key in PARTITION_KEYS])
+    schema = pa.unify_schemas([pq.read_schema(f) for f in files] + [partition_schema])
+    return ds.dataset(
+        files,
+        schema=schema,
+        format="parquet",
+        partitioning=ds.partitioning(partition_schema, flavor="hive"),
+        partition_base_dir=str(table_dir),
+    )
+
+
+def query(table, columns=None, store_dir=None, **filters):
+    """
+    테이블에서 필요한 컬럼만 읽어 pandas DataFrame으로 반환합니다.
+    filters: 컬럼=값 (리스트/튜플/집합이면 isin). 예) query("benchmark", ["dataset", "Time_ms"], solver="Greedy-TSP")
+    """
+    import pyarrow.dataset as ds
+
+    dataset = _open_dataset(table, store_dir)
+    if dataset is None:
+        import pandas as pd
+
+        return pd.DataFrame(columns=columns or [])
+
+    expression = None
+    for name, value in filters.items():
+        if isinstance(value, (list, tuple, set)):
+            condition = ds.field(name).isin(list(value))
+        else:
+            condition = ds.field(name) == value
+        expression = condition if expression is None else expression & condition
+
+    if columns is not None:
+        columns = [c for c in columns if c in dataset.schema.names]
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+
+# 기존 results/benchmark_data CSV 가져오기 설정: 파일 -> (테이블, solver)
+LEGACY_SPATIAL_SOLVER = "Spatial-Algorithm"
+LEGACY_FILES = {
+    "benchmark_results.csv": ("benchmark", None),
+    "mst_vs_greedy_analysis.csv": ("spatial_analysis", LEGACY_SPATIAL_SOLVER),
+    "mst_vs_greedy_analysis_full2.csv": ("spatial_analysis", LEGACY_SPATIAL_SOLVER),
+    "spatial_analysis.csv": ("spatial_analysis", LEGACY_SPATIAL_SOLVER),
+    "spatial_ablation_study.csv": ("ablation", LEGACY_SPATIAL_SOLVER),
+    "spatial_ablation_study2.csv": ("ablation", LEGACY_SPATIAL_SOLVER),
+    "k_value_experiment_results.csv": ("k_value", LEGACY_SPATIAL_SOLVER),
+}
+
+
+def _parse_value(text):
+    """CSV 문자열을 숫자로 변환 (OOM, 빈 값 등은 문자열/None 유지)"""
+    if text is None or text == "":
+        return None
+    try:
+        value = float(text)
+    except ValueError:
+        return text
+    return None if math.isnan(value) else value
+
+
+def _parse_number(text):
+    """숫자가 아닌 값(OOM 등)은 None으로 처리"""
+    value = _parse_value(text)
+    return value if isinstance(value, float) else None
+
+
+def _legacy_rows(path, solver):
+    rows = []
+    with open(path, "r", newline="") as f:
+        for record in csv.DictReader(f):
+            row = {k: _parse_value(v) for k, v in record.items() if k is not None}
+            row["solver"] = row.pop("Algorithm", None) or solver
+            row["dataset"] = row.pop("Dataset")
+            row["source"] = path.name
+            if "K" in row:
+                row["params"] = {"k": int(row.pop("K"))}
+            rows.append(row)
+    return rows
+
+
+def _legacy_intermediate_rows(path):
+    """탭 구분 wide 형식(intermediate_result.csv)을 (solver, dataset) 행으로 변환"""
+    rows = []
+    with open(path, "r", newline="") as f:
+        for record in csv.DictReader(f, delimiter="\t"):
+            if record["Dataset"] == "Average":
+                continue
+            solvers = [c[len("Distance_") :] for c in record if c.startswith("Distance_")]
+            for solver in solvers:
+                rows.append(
+                    {
+                        "solver": solver,
+                        "dataset": record["Dataset"],
+                        "Nodes": _parse_number(record["Nodes"]),
+                        "Optimal": _parse_number(record["Optimal"]),
+                        "Distance": _parse_number(record[f"Distance_{solver}"]),
+                        "Time_ms": _parse_number(record[f"Time_ms_{solver}"]),
+                        "source": path.name,
+                    }
+                )
+    return rows
+
+
+def import_legacy(benchmark_dir, store_dir=None):
+    """
+    results/benchmark_data의 CSV들을 저장소로 가져옵니다. 파일마다 run_id가 하나씩 생성됩니다.
+    """
+    benchmark_dir = Path(benchmark_dir)
+    imported = []
+    for name, (table, solver) in LEGACY_FILES.items():
+        path = benchmark_dir / name
+        if path.exists():
+            run_id = append(table, _legacy_rows(path, solver), store_dir=store_dir)
+            imported.append((name, table, run_id))
+
+    path = benchmark_dir / "intermediate_result.csv"
+    if path.exists():
+        run_id = append(
+            "intermediate", _legacy_intermediate_rows(path), store_dir=store_dir
+        )
+        imported.append((path.name, "intermediate", run_id))
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar results store")
+    parser.add_argument("--store-dir", type=Path, default=STORE_DIR)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("tables", help="list stored tables")
+
+    import_parser = subparsers.add_parser(
+        "import-legacy", help="import results/benchmark_data CSV files"
+    )
+    import_parser.add_argument(
+        "--benchmark-dir", type=Path, default=BASE_DIR / "results" / "benchmark_data"
+    )
+
+    query_parser = subparsers.add_parser("query", help="print rows of a table")
+    query_parser.add_argument("table")
+    query_parser.add_argument("--columns", nargs="+")
+    query_parser.add_argument("--solver")
+    query_parser.add_argument("--dataset")
+    query_parser.add_argument("--run-id")
+    args = parser.parse_args()
+
+    if args.command == "tables":
+        for table in list_tables(args.store_dir):
+            print(table)
+        return
+
+    if not is_available():
+        print("❌ pyarrow is required for the results store (pip install pyarrow)")
+        return
+
+    if args.command == "import-legacy":
+        print("🗄️  Importing legacy CSV results")
+        for name, table, run_id in import_legacy(args.benchmark_dir, args.store_dir):
+            print(f"   {name:<35} -> {table} (run {run_id})")
+    elif args.command == "query":
+        filters = {}
+        if args.solver:
+            filters["solver"] = args.solver
+        if args.dataset:
+            filters["dataset"] = args.dataset
+        if args.run_id:
+            filters["run_id"] = args.run_id
+        df = query(args.table, args.columns, args.store_dir, **filters)
+        print(df.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
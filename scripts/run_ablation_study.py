@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
 
+import argparse
 import subprocess
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-import numpy as np
 
-
-def run_spatial_ablation_study():
+from report_builder import build_reports, report_job
+from results_store import save_rows
+from solver_records import (
+    ABLATION_COLUMNS,
+    ablation_row,
+    append_row,
+    failure_message,
+    init_csv,
+    run_solver_json,
+    store_row,
+)
+
+
+# ablation_matrix.py tidy 테이블의 구성 요소 축 (컬럼, 그래프 라벨)
+MATRIX_COMPONENTS = [
+    ("Candidates", "Candidate backend"),
+    ("K", "Candidate K"),
+    ("Construction", "Construction"),
+    ("TwoOptIterations", "2-opt iterations"),
+    ("Threads", "Threads"),
+]
+
+
+def run_spatial_ablation_study(bf_sample=None, threads=None):
+    """
+    bf_sample: brute-force 기준선을 질의 점 bf_sample개로 추정 (노드 수가 더 많은 데이터셋만)
+    threads: brute-force KNN 스레드 수 (기본값: 솔버가 하드웨어 스레드 수 사용)
+    """
     base_dir = Path(__file__).parent.parent
     build_dir = base_dir / "build"
     data_dir = base_dir / "data"
@@ -45,6 +68,10 @@ def run_spatial_ablation_study():
             print(f"   {i+1:2d}. {dataset.name:<20} ({size_kb:.1f} KB)")
     print("=" * 60)
 
+    # 솔버의 --json 레코드로 ablation CSV를 새로 작성
+    init_csv(ablation_csv, ABLATION_COLUMNS)
+    stored_rows = []
+
     # 각 데이터셋에 대해 ablation study 실행
     for i, dataset in enumerate(datasets):
         print(f"\n🔬 Ablation Study ({i+1}/{len(datasets)}): {dataset.name}")
@@ -65,35 +92,42 @@ def run_spatial_ablation_study():
 
         try:
             print(f"   🚀 Running ablation analysis...")
-            result = subprocess.run(
-                [
-                    str(solver_path),
-                    str(dataset),
-                    str(output_file),
-                    str(ablation_csv),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=base_dir,
+            options = []
+            if bf_sample:
+                options.append(f"--bf-sample={bf_sample}")
+            if threads:
+                options.append(f"--threads={threads}")
+            record, result = run_solver_json(
+                [solver_path, dataset, output_file, *options],
                 timeout=timeout,
+                cwd=base_dir,
             )
 
-            if result.returncode == 0:
+            if result.returncode == 0 and record is not None:
                 print(f"   ✅ Success")
+                row = ablation_row(record)
+                append_row(ablation_csv, ABLATION_COLUMNS, row)
+                stored_rows.append(store_row(record, row))
                 # 결과 미리보기
-                if output_file.exists():
-                    with open(output_file, "r") as f:
-                        lines = f.readlines()
-                        if len(lines) >= 2:
-                            print(f"   📋 Tour saved: {lines[1].strip()}")
+                phase1 = record["phase1"]
+                estimated = phase1["bruteforce_mode"] == "sampled"
+                print(
+                    f"   📋 Phase 1 KD-tree {phase1['kdtree_time_ms']:.1f} ms vs "
+                    f"brute force {phase1['bruteforce_time_ms']:.1f} ms"
+                    f"{' (estimated)' if estimated else ''}, "
+                    f"distance {record['totals']['kdtree_distance']}"
+                )
             else:
-                print(f"   ❌ Failed: {result.stderr.strip()}")
+                print(f"   ❌ Failed: {failure_message(record, result)}")
 
         except subprocess.TimeoutExpired:
             print(f"   ⏰ Timeout ({timeout//60} minutes exceeded)")
         except Exception as e:
             print(f"   ❌ Error: {str(e)}")
 
+    # 결과 저장소에 추가
+    save_rows("ablation", stored_rows)
+
     # 결과 분석 및 시각화
     if ablation_csv.exists():
         analyze_ablation_results(ablation_csv, results_dir)
@@ -101,21 +135,77 @@ def run_spatial_ablation_study():
         print("❌ No ablation study results found.")
 
 
-def analyze_ablation_results(csv_file, output_dir):
-    print("\n📈 Analyzing Ablation Study Results...")
+def load_ablation_results(csv_file):
+    import pandas as pd
 
     try:
         df = pd.read_csv(csv_file)
-        print(f"   📝 {len(df)} datasets analyzed")
+        unit = "variant runs" if is_matrix_table(df) else "datasets"
+        print(f"   📝 {len(df)} {unit} analyzed")
     except Exception as e:
         print(f"❌ Failed to read CSV file: {e}")
-        return
+        return None
 
     if df.empty:
         print("❌ No ablation study data found.")
-        return
+        return None
+    return df
+
+
+def is_matrix_table(df):
+    """ablation_matrix.py가 만든 tidy 테이블(변형 하나당 한 행)인지 여부"""
+    return all(column in df.columns for column, _ in MATRIX_COMPONENTS)
+
+
+def report_jobs(csv_file, output_dir):
+    """
+    그래프와 보고서 작업 목록 (report_builder에서 병렬로 생성)
+    ablation 매트릭스 테이블이면 구성 요소별 기여도 그래프와 보고서를 만듭니다.
+    """
+    df = load_ablation_results(csv_file)
+    if df is None:
+        return []
+    if is_matrix_table(df):
+        return [
+            report_job(
+                "ablation_components.png",
+                plot_component_contributions,
+                [df],
+                ["ablation_components.png"],
+            ),
+            report_job(
+                "ablation_components_report.txt",
+                generate_component_report,
+                [df],
+                ["ablation_components_report.txt"],
+            ),
+        ]
+    return [
+        report_job(
+            "spatial_ablation_study.png",
+            plot_ablation_results,
+            [df],
+            ["spatial_ablation_study.png"],
+        ),
+        report_job(
+            "spatial_ablation_report.txt",
+            generate_ablation_report,
+            [df],
+            ["spatial_ablation_report.txt"],
+        ),
+    ]
+
+
+def analyze_ablation_results(csv_file, output_dir):
+    print("\n📈 Analyzing Ablation Study Results...")
+    build_reports(report_jobs(csv_file, output_dir), output_dir)
+
 
+def plot_ablation_results(df, output_dir):
     # 스타일 설정
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     plt.style.use("default")
     colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"]
 
@@ -282,15 +372,15 @@ def analyze_ablation_results(csv_file, output_dir):
 
     plt.tight_layout()
     plt.savefig(output_dir / "spatial_ablation_study.png", dpi=300, bbox_inches="tight")
+    plt.close(fig)
     print(
         f"   📊 Ablation study graphs saved: {output_dir / 'spatial_ablation_study.png'}"
     )
 
-    # 상세 보고서 생성
-    generate_ablation_report(df, output_dir)
-
 
 def generate_ablation_report(df, output_dir):
+    import pandas as pd
+
     report_file = output_dir / "spatial_ablation_report.txt"
 
     with open(report_file, "w", encoding="utf-8") as f:
@@ -305,6 +395,12 @@ def generate_ablation_report(df, output_dir):
             f"   • Average speedup (KD-tree): {df['TimeComplexityRatio'].mean():.2f}x\n"
         )
         f.write(f"   • Maximum speedup: {df['TimeComplexityRatio'].max():.2f}x\n")
+        if "BruteForceThreads" in df:
+            # 속도 향상 비율은 brute-force 스레드 수에 따라 달라짐
+            threads = ", ".join(
+                str(int(t)) for t in sorted(df["BruteForceThreads"].dropna().unique())
+            )
+            f.write(f"   • Brute-force threads: {threads} (KD-tree: 1)\n")
         f.write(
             f"   • Average 2-opt improvement: {df['ImprovementRatio2Opt'].mean()*100:.2f}%\n"
         )
@@ -324,7 +420,16 @@ def generate_ablation_report(df, output_dir):
             speedup = row["TimeComplexityRatio"]
             f.write(f"• {row['Dataset']} ({row['Nodes']} nodes):\n")
             f.write(f"   - KD-tree time: {row['KDTreePhase1TimeMs']:.2f} ms\n")
-            f.write(f"   - Brute-force time: {row['BruteForcePhase1TimeMs']:.2f} ms\n")
+            f.write(f"   - Brute-force time: {row['BruteForcePhase1TimeMs']:.2f} ms")
+            if row.get("BruteForceMode") == "sampled":
+                f.write(
+                    f" (estimated from {row['BruteForceSampleQueries']:.0f} "
+                    f"sampled queries)"
+                )
+            f.write("\n")
+            if "CandidateAgreement" in row and not pd.isna(row["CandidateAgreement"]):
+                agreement = row["CandidateAgreement"] * 100
+                f.write(f"   - Candidate agreement (BF in KD): {agreement:.2f}%\n")
             f.write(f"   - Speedup: {speedup:.2f}x\n")
             f.write(
                 f"   - Candidate edges: {row['KDTreeCandidateEdges']:.0f} (KD) vs {row['BruteForceCandidateEdges']:.0f} (BF)\n\n"
@@ -416,5 +521,142 @@ def generate_ablation_report(df, output_dir):
     print(f"   📄 Detailed ablation report saved: {report_file}")
 
 
+def component_effects(df):
+    """
+    구성 요소 축별 주효과: 축의 값마다 평균 품질 손실(%)과 평균 상대 시간
+    품질 손실은 데이터셋별 최단 거리 대비, 상대 시간은 데이터셋별 시간 중앙값 대비이므로
+    크기가 다른 데이터셋을 함께 평균할 수 있습니다. 값이 하나뿐인 축은 제외합니다.
+    """
+    df = df.copy()
+    by_dataset = df.groupby("Dataset")
+    best_distance = by_dataset["Distance"].transform("min")
+    df["GapPercent"] = (df["Distance"] / best_distance - 1) * 100
+    df["RelativeTime"] = df["TimeMs"] / by_dataset["TimeMs"].transform("median")
+
+    effects = []
+    for column, label in MATRIX_COMPONENTS:
+        if df[column].nunique() < 2:
+            continue
+        summary = df.groupby(column).agg(
+            GapPercent=("GapPercent", "mean"),
+            RelativeTime=("RelativeTime", "mean"),
+            Runs=("Distance", "size"),
+        )
+        effects.append((column, label, summary))
+    return effects
+
+
+def plot_component_contributions(df, output_dir):
+    import matplotlib.pyplot as plt
+
+    effects = component_effects(df)
+    output_file = output_dir / "ablation_components.png"
+    columns = max(1, len(effects))
+    fig, axes = plt.subplots(2, columns, figsize=(4.5 * columns, 8), squeeze=False)
+
+    if not effects:
+        for ax in axes[:, 0]:
+            ax.axis("off")
+        axes[0, 0].text(
+            0.5, 0.5, "Only one configuration per component", ha="center", va="center"
+        )
+
+    # 위: 품질 손실, 아래: 상대 시간 (축마다 한 열)
+    for i, (column, label, summary) in enumerate(effects):
+        names = [str(value) for value in summary.index]
+        quality_ax = axes[0, i]
+        quality_ax.bar(names, summary["GapPercent"], color="#d62728", alpha=0.8)
+        quality_ax.set_title(label, fontsize=13, fontweight="bold")
+        quality_ax.set_ylabel("Gap to best tour (%)")
+        quality_ax.grid(True, alpha=0.3, axis="y")
+
+        time_ax = axes[1, i]
+        time_ax.bar(names, summary["RelativeTime"], color="#1f77b4", alpha=0.8)
+        time_ax.axhline(1.0, color="gray", linestyle="--", linewidth=1)
+        time_ax.set_ylabel("Time / dataset median")
+        time_ax.set_xlabel(label)
+        time_ax.grid(True, alpha=0.3, axis="y")
+        for ax in (quality_ax, time_ax):
+            ax.tick_params(axis="x", rotation=30)
+
+    fig.suptitle(
+        "Ablation Matrix: Time and Quality Contribution per Component",
+        fontsize=15,
+        fontweight="bold",
+    )
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300, bbox_inches="tight")
+    plt.close(fig)
+    print(f"   📊 Component contribution graphs saved: {output_file}")
+
+
+def generate_component_report(df, output_dir):
+    report_file = output_dir / "ablation_components_report.txt"
+    effects = component_effects(df)
+
+    with open(report_file, "w", encoding="utf-8") as f:
+        f.write("=" * 80 + "\n")
+        f.write("Spatial Algorithm Ablation Matrix Report\n")
+        f.write("=" * 80 + "\n\n")
+
+        f.write("📊 Overall Statistics:\n")
+        f.write(f"   • Datasets: {df['Dataset'].nunique()}\n")
+        f.write(f"   • Variant runs: {len(df)}\n")
+        f.write(f"   • Phases computed: {int(df['ComputedPhases'].sum())}\n")
+        f.write(
+            f"   • Phases reused: {int(df['ReusedPhases'].sum())} "
+            f"({df['ReusedTimeMs'].sum():.1f} ms not recomputed)\n\n"
+        )
+
+        # 축별 주효과
+        f.write("🧩 Component Effects (mean over all other settings):\n")
+        f.write("-" * 50 + "\n")
+        if not effects:
+            f.write("   Only one configuration per component\n")
+        for column, label, summary in effects:
+            f.write(f"\n   {label}:\n")
+            for value, row in summary.iterrows():
+                f.write(
+                    f"   - {str(value):<12} gap {row['GapPercent']:6.2f}%  "
+                    f"time x{row['RelativeTime']:.2f}  ({int(row['Runs'])} runs)\n"
+                )
+
+        # 데이터셋별 최단 거리 구성과 최단 시간 구성
+        f.write("\n🏆 Best Configuration per Dataset:\n")
+        f.write("-" * 50 + "\n")
+        for dataset, group in df.sort_values("Nodes").groupby("Dataset", sort=False):
+            best = group.loc[group["Distance"].idxmin()]
+            fastest = group.loc[group["TimeMs"].idxmin()]
+            f.write(f"\n   {dataset} ({int(best['Nodes'])} nodes):\n")
+            for title, row in (("Shortest", best), ("Fastest", fastest)):
+                f.write(
+                    f"   - {title}: {row['Candidates']}, K={int(row['K'])}, "
+                    f"{row['Construction']}, 2-opt x{int(row['TwoOptIterations'])}, "
+                    f"{int(row['Threads'])} threads - distance {row['Distance']:.0f}, "
+                    f"{row['TimeMs']:.2f} ms\n"
+                )
+
+        f.write("\n" + "=" * 80 + "\n")
+        f.write("Ablation Matrix Complete\n")
+        f.write("=" * 80 + "\n")
+
+    print(f"   📄 Component report saved: {report_file}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spatial algorithm ablation study")
+    parser.add_argument(
+        "--bf-sample",
+        type=int,
+        default=None,
+        help="estimate the brute-force baseline from this many random query points",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=None, help="brute-force KNN threads"
+    )
+    args = parser.parse_args(argv)
+    run_spatial_ablation_study(args.bf_sample, args.threads)
+
+
 if __name__ == "__main__":
-    run_spatial_ablation_study()
+    main()
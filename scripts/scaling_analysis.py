@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+경험적 시간 복잡도 분석 스크립트
+벤치마크 CSV에서 솔버/단계별로 time ≈ c·n^α (power law)와 time ≈ c·n·log n 모델을
+적합하고, 기대 지수보다 나쁜 단계를 표시하며, 목표 n에서의 실행 시간과 메모리를 예측합니다.
+"""
+
+import argparse
+import csv
+import math
+from collections import defaultdict
+from pathlib import Path
+
+# 솔버별 기대 지수 (n log n은 지수 1로 취급하고 tolerance로 log 항을 흡수)
+EXPECTED_EXPONENTS = {
+    "Spatial-Algorithm": 1.0,
+    "Spatial-Ablation": 1.0,
+    "Greedy-TSP": 2.0,
+    "MST-2-Approximation": 2.0,
+}
+
+# 알고리즘 내부에서 의도적으로 더 비싼 지표 (ablation의 brute-force 비교 기준)
+EXPECTED_METRIC_EXPONENTS = {
+    "BruteForcePhase1TimeMs": 2.0,
+    "TotalTimeBruteForceMs": 2.0,
+}
+
+# 지수 시간 알고리즘은 다항식 모델 적합 대상에서 제외
+EXCLUDED_ALGORITHMS = {"Held-Karp"}
+
+# 메모리 지표 (KB 단위, 그 외 *Bytes 컬럼은 바이트 단위)
+MEMORY_COLUMNS = ["PeakRSSKB"]
+
+# 지표로 사용하지 않는 숫자 컬럼
+NON_METRIC_COLUMNS = {"Nodes", "Run", "Distance"}
+
+
+def is_metric_column(column):
+    if column in NON_METRIC_COLUMNS:
+        return False
+    return (
+        column.endswith("TimeMs")
+        or column.endswith("Time_ms")
+        or is_memory_column(column)
+    )
+
+
+def is_memory_column(column):
+    return column in MEMORY_COLUMNS or column.endswith("Bytes")
+
+
+def default_algorithm(csv_file, columns):
+    """
+    Algorithm 컬럼이 없는 CSV(분석/ablation CSV)의 알고리즘 이름을 추정합니다.
+    """
+    if "KDTreePhase1TimeMs" in columns:
+        return "Spatial-Ablation"
+    return "Spatial-Algorithm"
+
+
+def load_measurements(csv_files):
+    """
+    여러 벤치마크 CSV를 (algorithm, group, metric) -> {n: [values]} 형태로 읽습니다.
+    쉼표/탭 구분자를 모두 지원하고, 실패·타임아웃 행과 0 이하 값은 제외합니다.
+    """
+    measurements = defaultdict(lambda: defaultdict(list))
+
+    for csv_file in csv_files:
+        csv_file = Path(csv_file)
+        if not csv_file.exists():
+            print(f"⚠️  File not found, skipped: {csv_file}")
+            continue
+
+        with open(csv_file, "r") as f:
+            sample = f.readline()
+            f.seek(0)
+            delimiter = "\t" if "\t" in sample else ","
+            reader = csv.DictReader(f, delimiter=delimiter)
+            columns = reader.fieldnames or []
+            metrics = [col for col in columns if is_metric_column(col)]
+            fallback_algorithm = default_algorithm(csv_file, columns)
+
+            for row in reader:
+                if row.get("Status") not in (None, "", "SUCCESS"):
+                    continue
+                if row.get("Winner") == "TIMEOUT":
+                    continue
+                try:
+                    n = int(float(row["Nodes"]))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if n <= 1:
+                    continue
+
+                algorithm = row.get("Algorithm") or fallback_algorithm
+                if algorithm in EXCLUDED_ALGORITHMS:
+                    continue
+                group = row.get("Distribution") or "all"
+                for metric in metrics:
+                    try:
+                        value = float(row[metric])
+                    except (TypeError, ValueError):
+                        continue
+                    if value > 0:
+                        measurements[(algorithm, group, metric)][n].append(value)
+
+    return measurements
+
+
+def median(values):
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def linear_regression(xs, ys):
+    """
+    최소제곱 직선 y = a + b·x 와 결정계수 R²를 반환합니다.
+    """
+    count = len(xs)
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    ss_res = sum((y - (intercept + slope * x)) ** 2 for x, y in zip(xs, ys))
+    r_squared = 1 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    return intercept, slope, r_squared
+
+
+def fit_power_law(ns, values):
+    """
+    log-log 회귀로 value ≈ c·n^α 를 적합합니다.
+    """
+    log_n = [math.log(n) for n in ns]
+    log_v = [math.log(v) for v in values]
+    intercept, alpha, r_squared = linear_regression(log_n, log_v)
+    rmse = math.sqrt(
+        sum((lv - (intercept + alpha * ln)) ** 2 for ln, lv in zip(log_n, log_v))
+        / len(ns)
+    )
+    return {"c": math.exp(intercept), "alpha": alpha, "r2": r_squared, "rmse": rmse}
+
+
+def fit_n_log_n(ns, values):
+    """
+    value ≈ c·n·log2(n) 를 로그 공간에서 적합합니다 (c의 기하평균).
+    """
+    features = [n * math.log2(n) for n in ns]
+    log_ratio = [math.log(v / f) for v, f in zip(values, features)]
+    log_c = sum(log_ratio) / len(log_ratio)
+
+    log_v = [math.log(v) for v in values]
+    mean_log_v = sum(log_v) / len(log_v)
+    ss_tot = sum((lv - mean_log_v) ** 2 for lv in log_v)
+    ss_res = sum((lr - log_c) ** 2 for lr in log_ratio)
+    r_squared = 1 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    rmse = math.sqrt(ss_res / len(ns))
+    return {"c": math.exp(log_c), "r2": r_squared, "rmse": rmse}
+
+
+def expected_exponent(algorithm, metric):
+    if metric in EXPECTED_METRIC_EXPONENTS:
+        return EXPECTED_METRIC_EXPONENTS[metric]
+    return EXPECTED_EXPONENTS.get(algorithm)
+
+
+def fit_all(measurements, tolerance=0.25, target_n=None, min_points=3):
+    fits = []
+    for (algorithm, group, metric), by_n in sorted(measurements.items()):
+        ns = sorted(by_n.keys())
+        if len(ns) < min_points:
+            continue
+        values = [median(by_n[n]) for n in ns]
+
+        power = fit_power_law(ns, values)
+        nlogn = fit_n_log_n(ns, values)
+        expected = expected_exponent(algorithm, metric)
+
+        fit = {
+            "Algorithm": algorithm,
+            "Group": group,
+            "Metric": metric,
+            "Points": len(ns),
+            "MinNodes": ns[0],
+            "MaxNodes": ns[-1],
+            "Alpha": power["alpha"],
+            "PowerC": power["c"],
+            "PowerR2": power["r2"],
+            "PowerRMSE": power["rmse"],
+            "NLogNC": nlogn["c"],
+            "NLogNR2": nlogn["r2"],
+            "NLogNRMSE": nlogn["rmse"],
+            "BestModel": "n^alpha" if power["rmse"] <= nlogn["rmse"] else "n log n",
+            "ExpectedAlpha": expected,
+            "Flagged": expected is not None and power["alpha"] > expected + tolerance,
+        }
+
+        if target_n is not None:
+            fit["TargetNodes"] = target_n
+            fit["PredictedPower"] = power["c"] * target_n ** power["alpha"]
+            fit["PredictedNLogN"] = nlogn["c"] * target_n * math.log2(target_n)
+
+        fits.append(fit)
+    return fits
+
+
+def format_value(metric, value):
+    if is_memory_column(metric):
+        kb = value if metric in MEMORY_COLUMNS else value / 1024
+        if kb >= 1024 * 1024:
+            return f"{kb / (1024 * 1024):.2f} GB"
+        return f"{kb / 1024:.1f} MB"
+    if value >= 3600000:
+        return f"{value / 3600000:.1f} h"
+    if value >= 60000:
+        return f"{value / 60000:.1f} min"
+    if value >= 1000:
+        return f"{value / 1000:.2f} s"
+    return f"{value:.3f} ms"
+
+
+def save_fits_csv(fits, csv_file):
+    if not fits:
+        return
+    columns = list(fits[0].keys())
+    with open(csv_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(fits)
+
+
+def generate_scaling_report(fits, report_file, tolerance):
+    with open(report_file, "w", encoding="utf-8") as f:
+        f.write("=" * 80 + "\n")
+        f.write("Empirical Complexity Scaling Report\n")
+        f.write("=" * 80 + "\n\n")
+        f.write("Model 1: value ≈ c · n^α   (log-log least squares)\n")
+        f.write("Model 2: value ≈ c · n·log2(n)\n")
+        f.write(f"Flag: α > expected + {tolerance:.2f}\n\n")
+
+        current = None
+        for fit in fits:
+            header = (fit["Algorithm"], fit["Group"])
+            if header != current:
+                current = header
+                f.write(f"📈 {fit['Algorithm']} ({fit['Group']})\n")
+                f.write("-" * 60 + "\n")
+
+            flag = "  ⚠️  WORSE THAN EXPECTED" if fit["Flagged"] else ""
+            expected = (
+                f"{fit['ExpectedAlpha']:.1f}"
+                if fit["ExpectedAlpha"] is not None
+                else "n/a"
+            )
+            f.write(f"• {fit['Metric']}{flag}\n")
+            f.write(
+                f"   - n range: {fit['MinNodes']} - {fit['MaxNodes']} "
+                f"({fit['Points']} sizes)\n"
+            )
+            f.write(
+                f"   - α = {fit['Alpha']:.3f} (expected {expected}), "
+                f"R² = {fit['PowerR2']:.4f}\n"
+            )
+            f.write(
+                f"   - n log n: c = {fit['NLogNC']:.3e}, R² = {fit['NLogNR2']:.4f}"
+                f" → best model: {fit['BestModel']}\n"
+            )
+            if "TargetNodes" in fit:
+                f.write(
+                    f"   - Predicted at n={fit['TargetNodes']}: "
+                    f"{format_value(fit['Metric'], fit['PredictedPower'])} (n^α), "
+                    f"{format_value(fit['Metric'], fit['PredictedNLogN'])} (n log n)\n"
+                )
+            f.write("\n")
+
+        flagged = [fit for fit in fits if fit["Flagged"]]
+        f.write("🎯 Flagged Metrics:\n")
+        f.write("-" * 20 + "\n")
+        if flagged:
+            for fit in flagged:
+                f.write(
+                    f"• {fit['Algorithm']} / {fit['Metric']} ({fit['Group']}): "
+                    f"α = {fit['Alpha']:.2f} > {fit['ExpectedAlpha']:.1f}\n"
+                )
+        else:
+            f.write("• None - all metrics scale as expected\n")
+
+        f.write("\n" + "=" * 80 + "\n")
+
+
+def plot_scaling_fits(measurements, fits, output_file):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    algorithms = sorted({fit["Algorithm"] for fit in fits})
+    fig, axes = plt.subplots(
+        1, len(algorithms), figsize=(7 * len(algorithms), 6), squeeze=False
+    )
+
+    for ax, algorithm in zip(axes[0], algorithms):
+        for fit in fits:
+            if fit["Algorithm"] != algorithm or is_memory_column(fit["Metric"]):
+                continue
+            by_n = measurements[(fit["Algorithm"], fit["Group"], fit["Metric"])]
+            ns = sorted(by_n.keys())
+            values = [median(by_n[n]) for n in ns]
+            label = f"{fit['Metric']} [{fit['Group']}] α={fit['Alpha']:.2f}"
+            line = ax.loglog(ns, values, "o", markersize=5)[0]
+            ax.loglog(
+                ns,
+                [fit["PowerC"] * n ** fit["Alpha"] for n in ns],
+                "-",
+                color=line.get_color(),
+                alpha=0.7,
+                label=label,
+            )
+
+        ax.set_xlabel("Number of Nodes (log scale)", fontsize=12)
+        ax.set_ylabel("Time (ms, log scale)", fontsize=12)
+        ax.set_title(f"{algorithm} Scaling Fits", fontsize=14, fontweight="bold")
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize=8)
+
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300, bbox_inches="tight")
+    plt.close(fig)
+    print(f"   📊 Scaling fit plot saved: {output_file}")
+
+
+def run_scaling_analysis(
+    csv_files, output_dir, target_n=None, tolerance=0.25, plot=False
+):
+    print("📐 Empirical Complexity Analysis")
+    print("=" * 60)
+
+    measurements = load_measurements(csv_files)
+    fits = fit_all(measurements, tolerance=tolerance, target_n=target_n)
+    if not fits:
+        print("❌ Not enough sizes to fit (need at least 3 distinct n per metric)")
+        return []
+
+    for fit in fits:
+        flag = " ⚠️" if fit["Flagged"] else ""
+        prediction = ""
+        if "TargetNodes" in fit:
+            prediction = (
+                f"  → n={fit['TargetNodes']}: "
+                f"{format_value(fit['Metric'], fit['PredictedPower'])}"
+            )
+        print(
+            f"  {fit['Algorithm']:<20} {fit['Group']:<10} {fit['Metric']:<24} "
+            f"α={fit['Alpha']:5.2f} R²={fit['PowerR2']:.3f}{flag}{prediction}"
+        )
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    fits_csv = output_dir / "scaling_fits.csv"
+    report_file = output_dir / "scaling_report.txt"
+    save_fits_csv(fits, fits_csv)
+    generate_scaling_report(fits, report_file, tolerance)
+    print(f"\n   📝 Fit table saved: {fits_csv}")
+    print(f"   📄 Scaling report saved: {report_file}")
+
+    if plot:
+        plot_scaling_fits(measurements, fits, output_dir / "scaling_fits.png")
+
+    flagged = sum(1 for fit in fits if fit["Flagged"])
+    if flagged:
+        print(f"   ⚠️  {flagged} metric(s) scale worse than expected")
+    print("=" * 60)
+    return fits
+
+
+def main():
+    base_dir = Path(__file__).parent.parent
+    results_dir = base_dir / "results"
+    parser = argparse.ArgumentParser(
+        description="Fit empirical complexity exponents from benchmark CSVs"
+    )
+    parser.add_argument(
+        "csv_files",
+        nargs="*",
+        default=[str(results_dir / "scaling_sweep.csv")],
+        help="benchmark CSVs (default: results/scaling_sweep.csv)",
+    )
+    parser.add_argument(
+        "--predict-n", type=int, default=None, help="predict time/memory at this n"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed exponent above the expected value before flagging",
+    )
+    parser.add_argument("--output-dir", type=Path, default=results_dir)
+    parser.add_argument("--plot", action="store_true", help="save log-log fit plot")
+    args = parser.parse_args()
+
+    run_scaling_analysis(
+        args.csv_files, args.output_dir, args.predict_n, args.tolerance, args.plot
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+솔버 --json 출력 처리 유틸리티
+모든 솔버는 --json 옵션을 주면 stdout에 결과 레코드(JSON) 한 줄만 출력하고
+나머지 진행 메시지는 stderr로 보냅니다. 드라이버 스크립트는 stdout 문자열이나
+C++이 쓰는 CSV의 컬럼 순서 대신 이 레코드를 읽어 CSV 행을 직접 만듭니다.
+"""
+
+import csv
+import json
+import subprocess
+
+# 하드웨어 카운터 컬럼 (CSV 접두어, JSON 키)
+COUNTER_SECTIONS = [
+    ("Phase1", "phase1"),
+    ("KDQuery", "kd_query"),
+    ("Phase2", "phase2"),
+    ("Phase3", "phase3"),
+    ("Phase4", "phase4"),
+]
+COUNTER_FIELDS = [
+    ("Cycles", "cycles"),
+    ("Instructions", "instructions"),
+    ("CacheMisses", "cache_misses"),
+    ("BranchMisses", "branch_misses"),
+]
+
+# spatial_analysis.h의 initSpatialStatsCSV와 같은 컬럼 순서
+SPATIAL_COLUMNS = [
+    "Dataset",
+    "Nodes",
+    "GreedyDistance",
+    "MSTDistance",
+    "Winner",
+    "ImprovementRatio",
+    "Phase1TimeMs",
+    "Phase2TimeMs",
+    "Phase3TimeMs",
+    "Phase4TimeMs",
+    "TotalTimeMs",
+    "GreedyOnlyDistance",
+    "MSTOnlyDistance",
+    "FinalDistance",
+    "Phase1AllocBytes",
+    "Phase2AllocBytes",
+    "Phase3AllocBytes",
+    "Phase4AllocBytes",
+    "PeakHeapBytes",
+    "KDTreeBytes",
+    "CandidateBytes",
+    "PeakRSSKB",
+    "KDQueries",
+    "KDNodesVisited",
+    "HeapOps",
+    "TwoOptEvaluations",
+] + [
+    f"{section}{field}"
+    for section, _ in COUNTER_SECTIONS
+    for field, _ in COUNTER_FIELDS
+] + [
+    "Starts",
+    "BestStart",
+    "StartMinDistance",
+    "StartMeanDistance",
+    "StartMaxDistance",
+    "StartStdDistance",
+    "MultiStartWaitMs",
+]
+
+# ablation_study.h의 initAblationStatsCSV와 같은 컬럼 순서
+# TimeComplexityRatio는 단일 스레드 KD-tree 시간 대비 BruteForceThreads개 스레드의
+# brute-force 시간이므로 스레드 수에 따라 달라짐 (같은 BruteForceThreads끼리 비교)
+ABLATION_COLUMNS = [
+    "Dataset",
+    "Nodes",
+    "KDTreePhase1TimeMs",
+    "BruteForcePhase1TimeMs",
+    "KDTreeCandidateEdges",
+    "BruteForceCandidateEdges",
+    "DistanceBefore2Opt",
+    "DistanceAfter2Opt",
+    "Phase4_2OptTimeMs",
+    "ImprovementRatio2Opt",
+    "TotalTimeKDTreeMs",
+    "TotalTimeBruteForceMs",
+    "FinalDistanceKDTree",
+    "FinalDistanceBruteForce",
+    "TimeComplexityRatio",
+    "QualityDifference",
+    "KDTreePhase1AllocBytes",
+    "BruteForcePhase1AllocBytes",
+    "KDTreeBytes",
+    "CandidateBytes",
+    "PeakRSSKB",
+    "BruteForceMode",
+    "BruteForceSampleQueries",
+    "CandidateAgreement",
+    "BruteForceThreads",
+]
+
+# ablation_matrix.py의 tidy 테이블: 변형 하나당 한 행
+ABLATION_MATRIX_COLUMNS = [
+    "Dataset",
+    "Nodes",
+    "K",
+    "Threads",
+    "Candidates",
+    "Construction",
+    "TwoOptIterations",
+    "Source",
+    "DistanceBefore2Opt",
+    "Distance",
+    "TimeMs",
+    "Phase1TimeMs",
+    "TwoOptTimeMs",
+    "ReusedTimeMs",
+    "ComputedPhases",
+    "ReusedPhases",
+    "GraphId",
+    "BruteForceMode",
+    "CandidateAgreement",
+    "PeakRSSKB",
+]
+
+
+def parse_solver_record(stdout):
+    """
+    --json 모드 솔버 출력에서 결과 레코드를 찾아 dict로 반환합니다. 없으면 None.
+    """
+    for line in reversed(stdout.splitlines()):
+        line = line.strip()
+        if line.startswith("{"):
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                return None
+    return None
+
+
+def run_solver_json(command, timeout=None, cwd=None):
+    """
+    솔버를 --json 모드로 실행하고 (record, result)를 반환합니다.
+    """
+    result = subprocess.run(
+        [str(arg) for arg in command] + ["--json"],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        cwd=cwd,
+    )
+    return parse_solver_record(result.stdout), result
+
+
+def failure_message(record, result):
+    """
+    실패 원인: 레코드의 error 항목, 없으면 stderr 마지막 줄
+    (--json 모드에서는 진행 메시지가 모두 stderr로 가므로 전체를 출력하지 않음)
+    """
+    if record and record.get("error"):
+        return record["error"]
+    lines = result.stderr.strip().splitlines()
+    return lines[-1] if lines else f"exit code {result.returncode}"
+
+
+def spatial_phase_columns(record):
+    """
+    Spatial 레코드의 단계별 시간/할당량을 분석 CSV 컬럼 이름으로 반환합니다.
+    """
+    phases = record.get("phases", {})
+    memory = record.get("memory", {})
+    columns = {}
+    for i in range(1, 5):
+        phase = phases.get(f"phase{i}", {})
+        columns[f"Phase{i}TimeMs"] = phase.get("time_ms")
+        columns[f"Phase{i}AllocBytes"] = phase.get("alloc_bytes")
+    columns["TotalTimeMs"] = phases.get("total_time_ms")
+    columns["KDTreeBytes"] = memory.get("kdtree_bytes")
+    columns["CandidateBytes"] = memory.get("candidate_bytes")
+    return columns
+
+
+def spatial_row(record):
+    """
+    spatial_solver --json 레코드를 분석 CSV 행(dict)으로 변환합니다.
+    """
+    distances = record.get("distances", {})
+    memory = record.get("memory", {})
+    counts = record.get("counts", {})
+    counters = record.get("counters", {})
+
+    row = {
+        "Dataset": record.get("dataset"),
+        "Nodes": record.get("n"),
+        "GreedyDistance": distances.get("greedy"),
+        "MSTDistance": distances.get("mst"),
+        "Winner": distances.get("winner"),
+        "ImprovementRatio": distances.get("improvement_ratio"),
+        "GreedyOnlyDistance": distances.get("greedy"),
+        "MSTOnlyDistance": distances.get("mst"),
+        "FinalDistance": distances.get("final"),
+        "PeakHeapBytes": memory.get("peak_heap_bytes"),
+        "PeakRSSKB": memory.get("peak_rss_kb"),
+        "KDQueries": counts.get("kd_queries"),
+        "KDNodesVisited": counts.get("kd_nodes_visited"),
+        "HeapOps": counts.get("heap_ops"),
+        "TwoOptEvaluations": counts.get("two_opt_evaluations"),
+    }
+    row.update(spatial_phase_columns(record))
+    for section, section_key in COUNTER_SECTIONS:
+        values = counters.get(section_key, {})
+        for field, field_key in COUNTER_FIELDS:
+            row[f"{section}{field}"] = values.get(field_key, -1)
+    row.update(multi_start_columns(record))
+    return row
+
+
+def multi_start_columns(record):
+    """
+    다중 시작(--starts) 분포 컬럼. multi_start 항목이 없으면 시작점 하나(0번 노드)의 결과입니다.
+    """
+    final = record.get("distances", {}).get("final")
+    spread = record.get(
+        "multi_start",
+        {
+            "starts": 1,
+            "best_start": 0,
+            "min_length": final,
+            "mean_length": final,
+            "max_length": final,
+            "std_length": 0,
+        },
+    )
+    return {
+        "Starts": spread.get("starts"),
+        "BestStart": spread.get("best_start"),
+        "StartMinDistance": spread.get("min_length"),
+        "StartMeanDistance": spread.get("mean_length"),
+        "StartMaxDistance": spread.get("max_length"),
+        "StartStdDistance": spread.get("std_length"),
+        "MultiStartWaitMs": spread.get("wait_time_ms", 0),
+    }
+
+
+def ablation_row(record):
+    """
+    spatial_ablation --json 레코드를 ablation CSV 행(dict)으로 변환합니다.
+    """
+    phase1 = record.get("phase1", {})
+    phase4 = record.get("phase4", {})
+    totals = record.get("totals", {})
+    memory = record.get("memory", {})
+    return {
+        "Dataset": record.get("dataset"),
+        "Nodes": record.get("n"),
+        "KDTreePhase1TimeMs": phase1.get("kdtree_time_ms"),
+        "BruteForcePhase1TimeMs": phase1.get("bruteforce_time_ms"),
+        "KDTreeCandidateEdges": phase1.get("kdtree_candidate_edges"),
+        "BruteForceCandidateEdges": phase1.get("bruteforce_candidate_edges"),
+        "DistanceBefore2Opt": phase4.get("distance_before"),
+        "DistanceAfter2Opt": phase4.get("distance_after"),
+        "Phase4_2OptTimeMs": phase4.get("time_ms"),
+        "ImprovementRatio2Opt": phase4.get("improvement_ratio"),
+        "TotalTimeKDTreeMs": totals.get("kdtree_time_ms"),
+        "TotalTimeBruteForceMs": totals.get("bruteforce_time_ms"),
+        "FinalDistanceKDTree": totals.get("kdtree_distance"),
+        "FinalDistanceBruteForce": totals.get("bruteforce_distance"),
+        "TimeComplexityRatio": totals.get("time_complexity_ratio"),
+        "QualityDifference": totals.get("quality_difference"),
+        "KDTreePhase1AllocBytes": phase1.get("kdtree_alloc_bytes"),
+        "BruteForcePhase1AllocBytes": phase1.get("bruteforce_alloc_bytes"),
+        "KDTreeBytes": memory.get("kdtree_bytes"),
+        "CandidateBytes": memory.get("candidate_bytes"),
+        "PeakRSSKB": memory.get("peak_rss_kb"),
+        "BruteForceMode": phase1.get("bruteforce_mode"),
+        "BruteForceSampleQueries": phase1.get("bruteforce_sample_queries"),
+        "CandidateAgreement": phase1.get("candidate_agreement"),
+        "BruteForceThreads": phase1.get("bruteforce_threads"),
+    }
+
+
+def ablation_matrix_rows(record, threads):
+    """
+    spatial_ablation --json 레코드의 variants 항목을 tidy 테이블 행(dict) 목록으로 변환합니다.
+    """
+    phase1 = record.get("phase1", {})
+    rows = []
+    for variant in record.get("variants", []):
+        backend = variant["candidates"]
+        rows.append(
+            {
+                "Dataset": record.get("dataset"),
+                "Nodes": record.get("n"),
+                "K": record.get("parameters", {}).get("k"),
+                "Threads": threads,
+                "Candidates": backend,
+                "Construction": variant["construction"],
+                "TwoOptIterations": variant["two_opt_iterations"],
+                "Source": variant["source"],
+                "DistanceBefore2Opt": variant["distance_before_2opt"],
+                "Distance": variant["distance"],
+                "TimeMs": variant["time_ms"],
+                "Phase1TimeMs": phase1.get(f"{backend}_time_ms"),
+                "TwoOptTimeMs": variant["two_opt_time_ms"],
+                "ReusedTimeMs": variant["reused_time_ms"],
+                "ComputedPhases": variant["computed_phases"],
+                "ReusedPhases": variant["reused_phases"],
+                "GraphId": variant["graph_id"],
+                "BruteForceMode": phase1.get("bruteforce_mode"),
+                "CandidateAgreement": phase1.get("candidate_agreement"),
+                "PeakRSSKB": record.get("memory", {}).get("peak_rss_kb"),
+            }
+        )
+    return rows
+
+
+def store_row(record, row):
+    """
+    CSV 행을 결과 저장소 행으로 변환합니다 (solver/dataset 파티션 키와 솔버 파라미터 추가).
+    """
+    row = dict(row)
+    row["solver"] = record.get("algorithm")
+    row["dataset"] = row.pop("Dataset")
+    row["params"] = record.get("parameters", {})
+    return row
+
+
+def init_csv(csv_file, columns):
+    with open(csv_file, "w", newline="") as f:
+        csv.writer(f).writerow(columns)
+
+
+def append_row(csv_file, columns, row):
+    with open(csv_file, "a", newline="") as f:
+        csv.DictWriter(f, fieldnames=columns, restval="").writerow(row)
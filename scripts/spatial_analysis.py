@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 
-import subprocess
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-import numpy as np
+
+from report_builder import build_reports, report_job
+from results_store import save_rows
+from solver_records import (
+    SPATIAL_COLUMNS,
+    append_row,
+    failure_message,
+    init_csv,
+    run_solver_json,
+    store_row,
+    spatial_row,
+)
+from tune_k import tuned_k_args
 
 
 def run_spatial_analysis():
@@ -38,6 +46,10 @@ def run_spatial_analysis():
     print("🔬 Starting Spatial Algorithm Analysis")
     print("=" * 60)
 
+    # 솔버의 --json 레코드로 분석 CSV를 새로 작성
+    init_csv(analysis_csv, SPATIAL_COLUMNS)
+    stored_rows = []
+
     # 각 데이터셋에 대해 분석 실행
     for dataset in datasets:
         print(f"📊 Analyzing: {dataset.name}")
@@ -45,27 +57,25 @@ def run_spatial_analysis():
         output_file = results_dir / f"analysis_{dataset.stem}.txt"
 
         try:
-            result = subprocess.run(
-                [
-                    str(solver_path),
-                    str(dataset),
-                    str(output_file),
-                    "",
-                    str(analysis_csv),
-                ],
-                capture_output=True,
-                text=True,
+            record, result = run_solver_json(
+                [solver_path, dataset, output_file, *tuned_k_args(dataset)],
                 cwd=base_dir,
             )
 
-            if result.returncode == 0:
+            if result.returncode == 0 and record is not None:
                 print(f"   ✅ SUCCESS")
+                row = spatial_row(record)
+                append_row(analysis_csv, SPATIAL_COLUMNS, row)
+                stored_rows.append(store_row(record, row))
             else:
-                print(f"   ❌ FAILED: {result.stderr.strip()}")
+                print(f"   ❌ FAILED: {failure_message(record, result)}")
 
         except Exception as e:
             print(f"   ❌ ERROR: {str(e)}")
 
+    # 결과 저장소에 추가
+    save_rows("spatial_analysis", stored_rows)
+
     # 결과 분석 및 그래프 생성
     if analysis_csv.exists():
         analyze_results(analysis_csv, results_dir)
@@ -73,19 +83,61 @@ def run_spatial_analysis():
         print("❌ No analysis results found")
 
 
-def analyze_results(csv_file, output_dir):
-    print("\n📈 Generating Analysis Graphs...")
+PHASE_COLUMNS = ["Phase1TimeMs", "Phase2TimeMs", "Phase3TimeMs", "Phase4TimeMs"]
+COLORS = ["#2E86C1", "#E74C3C", "#F39C12", "#27AE60"]
 
-    # 데이터 로드
-    df = pd.read_csv(csv_file)
 
+def load_results(csv_file):
+    import pandas as pd
+
+    df = pd.read_csv(csv_file)
     if df.empty:
         print("❌ No data found in analysis file")
+        return None
+    return df
+
+
+def report_jobs(csv_file, output_dir, df=None):
+    """그래프 작업 목록 (report_builder에서 병렬로 생성)"""
+    if df is None:
+        df = load_results(csv_file)
+    if df is None:
+        return []
+    return [
+        report_job(
+            "spatial_analysis_plots.png",
+            plot_analysis,
+            [df],
+            ["spatial_analysis_plots.png"],
+        ),
+        report_job(
+            "ablation_study_plots.png",
+            plot_phase_ablation,
+            [df],
+            ["ablation_study_plots.png"],
+        ),
+    ]
+
+
+def analyze_results(csv_file, output_dir):
+    print("\n📈 Generating Analysis Graphs...")
+
+    # 데이터는 한 번만 로드해 그래프 작업과 요약에 함께 사용
+    df = load_results(csv_file)
+    if df is None:
         return
 
+    build_reports(report_jobs(csv_file, output_dir, df), output_dir)
+    print_summary(df)
+
+
+def plot_analysis(df, output_dir):
     # 스타일 설정
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     plt.style.use("seaborn-v0_8")
-    colors = ["#2E86C1", "#E74C3C", "#F39C12", "#27AE60"]
+    colors = COLORS
 
     # 1. MST vs Greedy Winner Analysis
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
@@ -126,7 +178,7 @@ def analyze_results(csv_file, output_dir):
     ax2.legend(handles=legend_elements, loc="upper right")
 
     # Phase timing analysis
-    phase_cols = ["Phase1TimeMs", "Phase2TimeMs", "Phase3TimeMs", "Phase4TimeMs"]
+    phase_cols = PHASE_COLUMNS
     phase_data = df[phase_cols].mean()
 
     bars = ax3.bar(range(len(phase_data)), phase_data.values, color=colors)
@@ -180,8 +232,18 @@ def analyze_results(csv_file, output_dir):
 
     plt.tight_layout()
     plt.savefig(output_dir / "spatial_analysis_plots.png", dpi=300, bbox_inches="tight")
+    plt.close(fig)
     print(f"   📊 Saved: {output_dir / 'spatial_analysis_plots.png'}")
 
+
+def plot_phase_ablation(df, output_dir):
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    plt.style.use("seaborn-v0_8")
+    colors = COLORS
+    phase_cols = PHASE_COLUMNS
+
     # 2. Ablation Study Visualization
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
 
@@ -250,8 +312,13 @@ def analyze_results(csv_file, output_dir):
 
     plt.tight_layout()
     plt.savefig(output_dir / "ablation_study_plots.png", dpi=300, bbox_inches="tight")
+    plt.close(fig)
     print(f"   📊 Saved: {output_dir / 'ablation_study_plots.png'}")
 
+
+def print_summary(df):
+    phase_cols = PHASE_COLUMNS
+
     # 3. Summary Statistics
     print("\n📋 ANALYSIS SUMMARY:")
     print("=" * 40)
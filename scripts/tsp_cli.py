@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+TSP 실험 통합 명령줄 도구
+하나의 진입점에서 벤치마크, ablation, 분석, 시각화, 대형 데이터셋 측정을 실행합니다.
+
+    python3 tsp_cli.py bench [benchmark.py 옵션...]
+    python3 tsp_cli.py ablation
+    python3 tsp_cli.py ablation-matrix [ablation_matrix.py 옵션...]
+    python3 tsp_cli.py analyze {spatial,mst-greedy,mst-greedy-full,reports} [report_builder 옵션...]
+    python3 tsp_cli.py visualize <tour_파일> [출력_이미지] [visualize_tsp.py 옵션...]
+    python3 tsp_cli.py large
+    python3 tsp_cli.py tune-k [tune_k.py 옵션...]
+    python3 tsp_cli.py k-sweep [k_value_experiment.py 옵션...]
+
+각 서브커맨드의 모듈은 실행할 때만 import합니다. bench와 large는 표준 라이브러리만 사용하고,
+pandas/matplotlib은 그래프나 보고서를 실제로 그리는 함수 안에서만 import됩니다.
+"""
+
+import argparse
+import sys
+
+# analyze 대상: 이름 -> (모듈, 실행 함수)
+ANALYSES = {
+    "spatial": ("spatial_analysis", "run_spatial_analysis"),
+    "mst-greedy": ("mst_vs_greedy_analysis_en", "run_mst_vs_greedy_analysis"),
+    "mst-greedy-full": ("mst_vs_greedy_analysis_full", "run_mst_vs_greedy_analysis"),
+}
+
+
+def run_bench(extra):
+    import benchmark
+
+    benchmark.main(extra)
+
+
+def run_ablation():
+    import run_ablation_study
+
+    run_ablation_study.run_spatial_ablation_study()
+
+
+def run_ablation_matrix(extra):
+    import ablation_matrix
+
+    ablation_matrix.main(extra)
+
+
+def run_analyze(args, extra):
+    if args.analysis == "reports":
+        import report_builder
+
+        report_builder.main(extra)
+        return
+
+    import importlib
+
+    module_name, function_name = ANALYSES[args.analysis]
+    getattr(importlib.import_module(module_name), function_name)()
+
+
+def run_visualize(extra):
+    import visualize_tsp
+
+    visualize_tsp.main(extra)
+
+
+def run_large():
+    import measure_large_dataset
+
+    measure_large_dataset.measure_large_dataset()
+
+
+def run_tune_k(extra):
+    import tune_k
+
+    tune_k.main(extra)
+
+
+def run_k_sweep(extra):
+    import k_value_experiment
+
+    k_value_experiment.main(extra)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="TSP experiment toolkit",
+        epilog="Options after bench, ablation-matrix, visualize, tune-k, k-sweep and "
+        "'analyze reports' are passed to benchmark.py, ablation_matrix.py, "
+        "visualize_tsp.py, tune_k.py, k_value_experiment.py and report_builder.py.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # 옵션을 하위 스크립트로 그대로 넘기는 서브커맨드는 -h도 넘김
+    subparsers.add_parser(
+        "bench", add_help=False, help="benchmark solvers (benchmark.py, incl. --sweep)"
+    )
+    subparsers.add_parser("ablation", help="run the spatial ablation study")
+    subparsers.add_parser(
+        "ablation-matrix",
+        add_help=False,
+        help="run a grid of ablation settings (ablation_matrix.py)",
+    )
+    analyze_parser = subparsers.add_parser(
+        "analyze", help="run an analysis driver or rebuild its reports"
+    )
+    analyze_parser.add_argument("analysis", choices=list(ANALYSES) + ["reports"])
+    subparsers.add_parser(
+        "visualize", add_help=False, help="draw a tour file (visualize_tsp.py)"
+    )
+    subparsers.add_parser("large", help="time MST and Greedy on mona-lisa100K")
+    subparsers.add_parser(
+        "tune-k", add_help=False, help="tune the spatial solver's K per dataset (tune_k.py)"
+    )
+    subparsers.add_parser(
+        "k-sweep",
+        add_help=False,
+        help="measure distance and time per K (k_value_experiment.py)",
+    )
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+
+    if args.command == "bench":
+        run_bench(extra)
+    elif args.command == "ablation-matrix":
+        run_ablation_matrix(extra)
+    elif args.command == "visualize":
+        run_visualize(extra)
+    elif args.command == "tune-k":
+        run_tune_k(extra)
+    elif args.command == "k-sweep":
+        run_k_sweep(extra)
+    elif args.command == "analyze" and args.analysis == "reports":
+        run_analyze(args, extra)
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    elif args.command == "ablation":
+        run_ablation()
+    elif args.command == "analyze":
+        run_analyze(args, extra)
+    elif args.command == "large":
+        run_large()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
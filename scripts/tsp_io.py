@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+TSP 파일 로더 (NumPy)
+인스턴스(.tsp / .tspb), tour 결과 파일, 좌표 파일을 연속된 NumPy 배열로 읽습니다.
+줄 단위 Python 파싱 대신 np.loadtxt / np.fromstring / np.memmap을 사용하고,
+텍스트 좌표 파일은 한 번 파싱하면 results/cache 아래에 .npy로 저장해 이후에는 memory-map으로 읽습니다.
+
+헤더 함수(read_tsp_header, read_tsp_dimension)는 표준 라이브러리만 사용하므로
+benchmark.py처럼 numpy가 없는 환경에서도 쓸 수 있고, numpy는 배열 로더 안에서만 import합니다.
+"""
+
+import hashlib
+import struct
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = BASE_DIR / "results" / "cache" / "coordinates"
+
+# generate_instances.py / tsp_common.cpp의 바이너리 인스턴스 헤더: "TSPB" | int32 version | int32 dimension
+BINARY_INSTANCE_MAGIC = b"TSPB"
+BINARY_INSTANCE_HEADER_BYTES = 12
+
+# tsp_common.cpp의 바이너리 tour 헤더 (.tourb):
+# "TOUR" | int32 version | int32 length | int32 reserved | int64 total_distance | uint64 coordinates_hash
+BINARY_TOUR_MAGIC = b"TOUR"
+BINARY_TOUR_HEADER = "<4siiiqQ"
+BINARY_TOUR_HEADER_BYTES = struct.calcsize(BINARY_TOUR_HEADER)
+
+
+def read_tsp_header(path):
+    """
+    TSPLIB 헤더(NAME, DIMENSION, EDGE_WEIGHT_TYPE 등)를 dict로 반환합니다.
+    좌표 섹션 시작 줄 번호는 "coord_section_line"에 기록됩니다. 좌표 본문은 읽지 않습니다.
+    """
+    header = {}
+    with open(path, "r") as f:
+        for line_number, line in enumerate(f):
+            line = line.strip()
+            if line.startswith("NODE_COORD_SECTION"):
+                header["coord_section_line"] = line_number
+                break
+            if ":" in line:
+                key, value = line.split(":", 1)
+                header[key.strip()] = value.strip()
+    if "DIMENSION" in header:
+        header["DIMENSION"] = int(header["DIMENSION"])
+    return header
+
+
+def read_tsp_dimension(path):
+    """
+    인스턴스의 노드 수 (.tspb는 헤더에서, .tsp는 DIMENSION 항목에서)
+    """
+    path = Path(path)
+    if path.suffix == ".tspb":
+        with open(path, "rb") as f:
+            _, _, dimension = struct.unpack("<4sii", f.read(BINARY_INSTANCE_HEADER_BYTES))
+        return dimension
+    return read_tsp_header(path).get("DIMENSION")
+
+
+def load_instance(path):
+    """
+    인스턴스 좌표를 (n, 2) float64 배열로 반환합니다. .tspb는 memory-map으로 읽습니다.
+    """
+    import numpy as np
+
+    path = Path(path)
+    if path.suffix == ".tspb":
+        with open(path, "rb") as f:
+            magic = f.read(4)
+        if magic != BINARY_INSTANCE_MAGIC:
+            raise ValueError(f"{path}: not a TSPB binary instance")
+        n = read_tsp_dimension(path)
+        return np.memmap(
+            path,
+            dtype="<f8",
+            mode="r",
+            offset=BINARY_INSTANCE_HEADER_BYTES,
+            shape=(n, 2),
+        )
+
+    header = read_tsp_header(path)
+    if "coord_section_line" not in header:
+        raise ValueError(f"{path}: NODE_COORD_SECTION not found")
+    return np.ascontiguousarray(
+        np.loadtxt(
+            path,
+            skiprows=header["coord_section_line"] + 1,
+            max_rows=header.get("DIMENSION"),
+            usecols=(1, 2),
+            ndmin=2,
+            dtype=np.float64,
+        )
+    )
+
+
+def read_tour_header(path):
+    """
+    tour 파일 헤더를 dict로 반환합니다: total_distance, coordinates(좌표 파일 상대 경로, 없으면 None),
+    바이너리 tour는 length와 coordinates_hash도 포함합니다.
+    """
+    path = Path(path)
+    if path.suffix == ".tourb":
+        with open(path, "rb") as f:
+            magic, version, length, _, total_distance, coordinates_hash = struct.unpack(
+                BINARY_TOUR_HEADER, f.read(BINARY_TOUR_HEADER_BYTES)
+            )
+        if magic != BINARY_TOUR_MAGIC or version != 1:
+            raise ValueError(f"{path}: invalid binary tour header")
+        return {
+            "total_distance": total_distance,
+            "length": length,
+            "coordinates_hash": f"{coordinates_hash:016x}",
+            "coordinates": f"coordinates/{coordinates_hash:016x}.tspb",
+        }
+
+    header = {"total_distance": 0, "coordinates": None}
+    with open(path, "r") as f:
+        for line in f:
+            if not line.startswith("#"):
+                break
+            if line.startswith("# Total Distance:"):
+                header["total_distance"] = int(line.split(":")[1].strip())
+            elif line.startswith("# Coordinates:"):
+                header["coordinates"] = line.split(":", 1)[1].strip()
+    return header
+
+
+def load_tour(path):
+    """
+    tour 결과 파일을 읽어 (int32 tour 배열, 총 거리)를 반환합니다.
+    바이너리 tour(.tourb)는 memory-map으로 읽습니다.
+    """
+    import numpy as np
+
+    path = Path(path)
+    header = read_tour_header(path)
+    if path.suffix == ".tourb":
+        tour = np.memmap(
+            path,
+            dtype="<i4",
+            mode="r",
+            offset=BINARY_TOUR_HEADER_BYTES,
+            shape=(header["length"],),
+        )
+        return tour, header["total_distance"]
+
+    tour = None
+    with open(path, "r") as f:
+        for line in f:
+            if not line.startswith("#") and line.strip():
+                tour = np.fromstring(line, dtype=np.int64, sep=" ").astype(np.int32)
+                break
+    if tour is None:
+        raise ValueError(f"{path}: no tour line found")
+    return tour, header["total_distance"]
+
+
+def coordinates_path_for(tour_path):
+    """
+    tour 파일이 참조하는 좌표 파일 경로
+    헤더의 해시 참조(coordinates/<hash>.tspb)를 우선 사용하고,
+    이전 형식의 결과는 tour 파일 옆의 <tour>_coordinates.txt를 사용합니다.
+    """
+    tour_path = Path(tour_path)
+    reference = read_tour_header(tour_path).get("coordinates")
+    if reference:
+        return tour_path.parent / reference
+    return tour_path.with_name(tour_path.stem + "_coordinates.txt")
+
+
+def _cache_path(path):
+    stat = path.stat()
+    key = f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    return CACHE_DIR / (hashlib.sha1(key.encode()).hexdigest() + ".npy")
+
+
+def load_coordinates(path, use_cache=True):
+    """
+    좌표 파일(node_id x y)을 읽어 노드 번호로 인덱싱되는 (max_id + 1, 2) 배열을 반환합니다.
+    파일에 없는 노드 번호의 행은 NaN입니다. 해시로 참조되는 .tspb 좌표 파일은 바로 memory-map합니다.
+    use_cache=True이면 텍스트 파싱 결과를 .npy로 저장하고 다음부터 memory-map으로 읽습니다.
+    """
+    import numpy as np
+
+    path = Path(path)
+    if path.suffix == ".tspb":
+        return load_instance(path)
+
+    cache_path = _cache_path(path) if use_cache else None
+    if cache_path is not None and cache_path.exists():
+        return np.load(cache_path, mmap_mode="r")
+
+    data = np.loadtxt(path, comments="#", usecols=(0, 1, 2), ndmin=2, dtype=np.float64)
+    if len(data) == 0:
+        raise ValueError(f"{path}: no coordinates found")
+
+    node_ids = data[:, 0].astype(np.int64)
+    coordinates = np.full((node_ids.max() + 1, 2), np.nan)
+    coordinates[node_ids] = data[:, 1:3]
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(cache_path, coordinates)
+    return coordinates
+
+
+def validate_tour(tour, n):
+    """
+    tour가 0..n-1의 순열인지 확인합니다 (마지막에 시작 노드로 돌아오는 닫힌 tour 허용).
+    유효하지 않으면 ValueError를 발생시킵니다.
+    """
+    import numpy as np
+
+    tour = np.asarray(tour)
+    if len(tour) == n + 1:
+        if tour[0] != tour[-1]:
+            raise ValueError(
+                f"closed tour must end at its start node ({tour[0]} != {tour[-1]})"
+            )
+        tour = tour[:-1]
+    if len(tour) != n:
+        raise ValueError(f"tour visits {len(tour)} nodes, expected {n}")
+    if n == 0:
+        return
+    if tour.min() < 0 or tour.max() >= n:
+        raise ValueError(f"tour contains node ids outside 0..{n - 1}")
+
+    visits = np.bincount(tour, minlength=n)
+    if np.any(visits != 1):
+        missing = np.flatnonzero(visits == 0)
+        repeated = np.flatnonzero(visits > 1)
+        raise ValueError(
+            f"tour is not a permutation: {len(missing)} missing nodes "
+            f"(e.g. {missing[:5].tolist()}), {len(repeated)} repeated nodes "
+            f"(e.g. {repeated[:5].tolist()})"
+        )
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+후보 이웃 수(K) 자동 튜닝
+인스턴스에서 노드를 무작위 샘플링한 파일럿 인스턴스로 spatial_solver를 K 값마다 실행하고,
+최고 품질(최단 거리)과의 차이가 허용 오차 이내인 K 중 가장 빠른 값을 고릅니다.
+
+선택된 K는 데이터셋 파일 내용의 해시별로 results/cache/k_tuning.json에 저장됩니다.
+드라이버 스크립트는 tuned_k_args(dataset)로 캐시된 값을 spatial_solver에 --k=N으로 전달하고,
+캐시에 없으면 솔버의 기본값 min(30, max(10, n/10))을 그대로 사용합니다.
+캐시 조회 함수는 표준 라이브러리만 사용하고, numpy는 파일럿 인스턴스를 만들 때만 import합니다.
+
+사용법: python3 tune_k.py [데이터셋...] [--pilot-nodes N] [--tolerance 0.005] [--repeats 3] [--force]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from solver_records import failure_message, run_solver_json
+
+BASE_DIR = Path(__file__).parent.parent
+CACHE_PATH = BASE_DIR / "results" / "cache" / "k_tuning.json"
+
+# k_value_experiment_results.csv와 같은 K 범위
+K_GRID = [5, 8, 10, 12, 15, 20, 25, 30, 40]
+DEFAULT_PILOT_NODES = 2000
+DEFAULT_TOLERANCE = 0.005
+
+
+def dataset_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix(f".tmp.{os.getpid()}")
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def cached_k(dataset):
+    """캐시에 저장된 튜닝 K (없으면 None)"""
+    entry = load_cache().get(dataset_hash(dataset))
+    return entry["k"] if entry else None
+
+
+def tuned_k_args(dataset):
+    """spatial_solver 명령에 덧붙일 인자: 튜닝된 K가 있으면 ["--k=N"], 없으면 []"""
+    k = cached_k(dataset)
+    return [f"--k={k}"] if k is not None else []
+
+
+def write_pilot_instance(dataset, path, pilot_nodes, seed):
+    """
+    인스턴스 노드를 pilot_nodes개 샘플링해 .tspb로 저장하고 (전체 노드 수, 파일럿 노드 수)를 반환합니다.
+    노드 수가 pilot_nodes 이하이면 전체 노드를 그대로 사용합니다.
+    """
+    import numpy as np
+
+    from generate_instances import BINARY_MAGIC, BINARY_VERSION
+    from tsp_io import load_instance
+
+    points = load_instance(dataset)
+    n = len(points)
+    if n > pilot_nodes:
+        rng = np.random.default_rng(seed)
+        points = points[np.sort(rng.choice(n, pilot_nodes, replace=False))]
+
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sii", BINARY_MAGIC, BINARY_VERSION, len(points)))
+        np.ascontiguousarray(points, dtype="<f8").tofile(f)
+    return n, len(points)
+
+
+def choose_k(results, tolerance):
+    """최단 거리 대비 tolerance 이내인 K 중 가장 빠른 K (같으면 작은 K)"""
+    best_distance = min(r["distance"] for r in results)
+    eligible = [r for r in results if r["distance"] <= best_distance * (1 + tolerance)]
+    return min(eligible, key=lambda r: (r["time_ms"], r["k"]))["k"]
+
+
+def tune_dataset(
+    dataset,
+    solver_path,
+    pilot_nodes=DEFAULT_PILOT_NODES,
+    tolerance=DEFAULT_TOLERANCE,
+    repeats=3,
+    k_grid=K_GRID,
+    seed=0,
+):
+    """
+    파일럿 인스턴스로 K_GRID의 각 K를 repeats번 실행해 K를 고르고 캐시 항목(dict)을 반환합니다.
+    시간은 반복 중 최솟값을 사용합니다 (짧은 파일럿 실행의 잡음 제거).
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        pilot_path = Path(work_dir) / "pilot.tspb"
+        n, pilot_n = write_pilot_instance(dataset, pilot_path, pilot_nodes, seed)
+        print(f"   🧪 Pilot instance: {pilot_n} of {n} nodes")
+
+        results = []
+        for k in k_grid:
+            times = []
+            distance = None
+            for _ in range(repeats):
+                record, result = run_solver_json(
+                    [solver_path, pilot_path, Path(work_dir) / "pilot.tourb", f"--k={k}"],
+                    cwd=work_dir,
+                )
+                if result.returncode != 0 or record is None:
+                    raise RuntimeError(f"K={k}: {failure_message(record, result)}")
+                times.append(record["time_ms"])
+                distance = record["distance"]
+            results.append({"k": k, "distance": distance, "time_ms": min(times)})
+            print(f"      K={k:<3d} distance {distance:<10d} {min(times):8.2f} ms")
+
+    return {
+        "dataset": Path(dataset).stem,
+        "k": choose_k(results, tolerance),
+        "nodes": n,
+        "pilot_nodes": pilot_n,
+        "tolerance": tolerance,
+        "results": results,
+        "tuned_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Choose the spatial solver's candidate K per dataset from pilot solves"
+    )
+    parser.add_argument(
+        "datasets", nargs="*", type=Path, help="instances to tune (default: data/*.tsp)"
+    )
+    parser.add_argument("--solver", type=Path, default=BASE_DIR / "build" / "spatial_solver")
+    parser.add_argument("--pilot-nodes", type=int, default=DEFAULT_PILOT_NODES)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="accepted relative distance loss vs the best K (default 0.005)",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--force", action="store_true", help="re-tune cached datasets")
+    args = parser.parse_args(argv)
+
+    if not args.solver.exists():
+        print(f"❌ Spatial solver not found: {args.solver}")
+        print("   Please run 'make spatial' first.")
+        return
+
+    datasets = args.datasets or sorted(
+        (BASE_DIR / "data").glob("*.tsp"), key=lambda p: p.stat().st_size
+    )
+
+    print("🎛️  Tuning candidate K for the spatial solver")
+    print("=" * 60)
+    cache = load_cache()
+    for dataset in datasets:
+        key = dataset_hash(dataset)
+        if key in cache and not args.force:
+            print(f"♻️  {dataset.name}: cached K={cache[key]['k']}")
+            continue
+
+        print(f"\n📊 {dataset.name}")
+        try:
+            entry = tune_dataset(
+                dataset,
+                args.solver,
+                args.pilot_nodes,
+                args.tolerance,
+                args.repeats,
+                seed=args.seed,
+            )
+        except (RuntimeError, ValueError) as e:
+            print(f"   ❌ Skipped: {e}")
+            continue
+        cache[key] = entry
+        save_cache(cache)
+        print(f"   ✅ Chosen K={entry['k']}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
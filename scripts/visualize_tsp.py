@@ -2,71 +2,27 @@
 """
 TSP Tour 시각화 스크립트
 C++로 생성된 TSP tour 결과를 읽어서 시각화합니다.
+
+tour와 좌표는 NumPy 배열로 읽고 경로는 LineCollection 하나로 그립니다.
+노드 수가 --raster-threshold를 넘으면 경로를 고정 해상도 격자에 집계(픽셀당 통과 횟수)하여
+이미지 한 장으로 그리므로 10만~100만 노드 tour도 몇 초 안에 렌더링됩니다.
 """
 
 import matplotlib.pyplot as plt
 import numpy as np
 import sys
 import os
+from matplotlib.collections import LineCollection
+from matplotlib.colors import ListedColormap
 
+import tsp_io
 
-def read_tour_file(tour_filename):
-    """
-    tour 파일을 읽어서 tour 순서와 총 거리를 반환합니다.
-    """
-    tour = []
-    total_distance = 0
-
-    try:
-        with open(tour_filename, "r") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith("# Total Distance:"):
-                total_distance = int(line.split(":")[1].strip())
-            elif not line.startswith("#") and line:
-                tour = [int(x) for x in line.split()]
-                break
-
-    except FileNotFoundError:
-        print(f"Error: {tour_filename} 파일을 찾을 수 없습니다.")
-        return None, None
-    except Exception as e:
-        print(f"Error reading tour file: {e}")
-        return None, None
-
-    return tour, total_distance
-
-
-def read_coordinates_file(coord_filename):
-    """
-    좌표 파일을 읽어서 각 노드의 좌표를 반환합니다.
-    """
-    coordinates = {}
-
-    try:
-        with open(coord_filename, "r") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if not line.startswith("#") and line:
-                parts = line.split()
-                if len(parts) >= 3:
-                    node_id = int(parts[0])
-                    x = float(parts[1])
-                    y = float(parts[2])
-                    coordinates[node_id] = (x, y)
-
-    except FileNotFoundError:
-        print(f"Error: {coord_filename} 파일을 찾을 수 없습니다.")
-        return None
-    except Exception as e:
-        print(f"Error reading coordinates file: {e}")
-        return None
-
-    return coordinates
+# 이 노드 수를 넘으면 래스터 집계 경로 사용
+DEFAULT_RASTER_THRESHOLD = 200000
+# 래스터 이미지의 긴 변 픽셀 수
+DEFAULT_RASTER_SIZE = 2000
+# 벡터 경로에서도 이 노드 수를 넘으면 선/점을 비트맵으로 저장 (PDF/SVG 크기 제한)
+RASTERIZED_ARTIST_THRESHOLD = 10000
 
 
 def get_dynamic_sizes(node_count):
@@ -107,6 +63,45 @@ def get_dynamic_sizes(node_count):
     return node_size, line_width, start_node_size
 
 
+def rasterize_tour(path, extent, width, height, samples_per_chunk=4000000):
+    """
+    경로 선분을 width x height 격자에 집계하여 픽셀별 통과 횟수를 반환합니다.
+    선분마다 픽셀 길이만큼 점을 샘플링하며, 메모리 사용량이 일정하도록
+    샘플 수 기준으로 선분을 나누어 처리합니다.
+    """
+    counts = np.zeros(width * height, dtype=np.int64)
+    if len(path) < 2:
+        return counts.reshape(height, width)
+
+    x_min, x_max, y_min, y_max = extent
+    scale_x = (width - 1) / (x_max - x_min) if x_max > x_min else 0.0
+    scale_y = (height - 1) / (y_max - y_min) if y_max > y_min else 0.0
+    px = (path[:, 0] - x_min) * scale_x
+    py = (path[:, 1] - y_min) * scale_y
+
+    start_x, start_y = px[:-1], py[:-1]
+    delta_x, delta_y = px[1:] - start_x, py[1:] - start_y
+    steps = np.ceil(np.maximum(np.abs(delta_x), np.abs(delta_y))).astype(np.int64) + 1
+
+    cumulative = np.cumsum(steps)
+    boundaries = np.searchsorted(
+        cumulative, np.arange(samples_per_chunk, cumulative[-1], samples_per_chunk)
+    )
+    for chunk in np.split(np.arange(len(steps)), np.unique(boundaries + 1)):
+        if len(chunk) == 0:
+            continue
+        chunk_steps = steps[chunk]
+        segment = np.repeat(chunk, chunk_steps)
+        first = np.cumsum(chunk_steps) - chunk_steps
+        offset = np.arange(chunk_steps.sum()) - np.repeat(first, chunk_steps)
+        t = offset / np.maximum(steps[segment] - 1, 1)
+        xs = np.rint(start_x[segment] + delta_x[segment] * t).astype(np.int64)
+        ys = np.rint(start_y[segment] + delta_y[segment] * t).astype(np.int64)
+        counts += np.bincount(ys * width + xs, minlength=width * height)
+
+    return counts.reshape(height, width)
+
+
 def visualize_tsp_tour(
     tour,
     coordinates,
@@ -115,139 +110,173 @@ def visualize_tsp_tour(
     show_node_numbers=False,
     show_arrows=False,  # 기본값을 False로 변경
     path_only=False,  # 새로운 옵션 추가
+    raster_threshold=DEFAULT_RASTER_THRESHOLD,
+    raster_size=DEFAULT_RASTER_SIZE,
 ):
     """
     TSP tour를 시각화합니다.
+    tour: 노드 번호 배열, coordinates: tsp_io.load_coordinates가 반환한 좌표 배열
     """
-    if not tour or not coordinates:
+    if tour is None or coordinates is None or len(tour) == 0:
         print("Error: Invalid tour or coordinates data")
         return
 
+    # 좌표가 있는 노드만 사용
+    valid = ~np.isnan(coordinates[:, 0])
+    node_ids = np.flatnonzero(valid)
+    all_xy = coordinates[valid]
+    tour = tour[(tour >= 0) & (tour < len(coordinates))]
+    path = coordinates[tour]
+    path = path[~np.isnan(path[:, 0])]
+
     # 노드 수에 따른 동적 크기 설정
-    node_count = len(coordinates)
+    node_count = len(node_ids)
     node_size, line_width, start_node_size = get_dynamic_sizes(node_count)
+    use_raster = node_count > raster_threshold
+    rasterize_artists = node_count > RASTERIZED_ARTIST_THRESHOLD
 
     # path_only 모드에서는 경로를 더 두껍게
     if path_only:
         line_width *= 1.5
 
     # 그래프 설정
-    plt.figure(figsize=(14, 10))
+    fig, ax = plt.subplots(figsize=(14, 10))
     title_suffix = " (Path Only)" if path_only else ""
-    plt.title(
+    ax.set_title(
         f"TSP Tour Visualization (Nodes: {node_count}){title_suffix}\nTotal Distance: {total_distance}",
         fontsize=18,
         fontweight="bold",
         pad=20,
     )
 
-    # 좌표 리스트 생성
-    x_coords = []
-    y_coords = []
-
-    for node in tour:
-        if node in coordinates:
-            x, y = coordinates[node]
-            x_coords.append(x)
-            y_coords.append(y)
-
-    # 모든 노드 좌표
-    all_x = [coordinates[i][0] for i in coordinates.keys()]
-    all_y = [coordinates[i][1] for i in coordinates.keys()]
+    # 여백 포함 좌표 범위
+    margin = 0.03
+    x_min, y_min = all_xy.min(axis=0)
+    x_max, y_max = all_xy.max(axis=0)
+    x_range = x_max - x_min
+    y_range = y_max - y_min
+    extent = (
+        x_min - margin * x_range,
+        x_max + margin * x_range,
+        y_min - margin * y_range,
+        y_max + margin * y_range,
+    )
 
-    # Tour 경로 그리기 (동적 두께)
     path_color = "navy" if path_only else "dodgerblue"
     path_alpha = 0.9 if path_only else 0.8
-    plt.plot(
-        x_coords,
-        y_coords,
-        path_color,
-        linewidth=line_width,
-        alpha=path_alpha,
-        label="Tour Path",
-        zorder=2,
-    )
+    if use_raster:
+        # 대형 tour: 픽셀별 통과 횟수 이미지 (로그 스케일)
+        span_x = extent[1] - extent[0]
+        span_y = extent[3] - extent[2]
+        if span_x >= span_y:
+            width = raster_size
+            height = max(1, int(round(raster_size * span_y / span_x))) if span_x else 1
+        else:
+            height = raster_size
+            width = max(1, int(round(raster_size * span_x / span_y)))
+        counts = rasterize_tour(path, extent, width, height)
+        image = np.ma.masked_equal(np.log1p(counts), 0)
+        # 한 번만 지나간 픽셀도 보이도록 컬러맵의 밝은 구간은 사용하지 않음
+        base_cmap = plt.get_cmap("Greys" if path_only else "Blues")
+        cmap = ListedColormap(base_cmap(np.linspace(0.45, 1.0, 256)))
+        ax.imshow(
+            image,
+            origin="lower",
+            extent=extent,
+            cmap=cmap,
+            interpolation="nearest",
+            aspect="equal",
+            zorder=2,
+        )
+        ax.plot([], [], color=path_color, label="Tour Path (rasterized)")
+    else:
+        # Tour 경로 그리기 (동적 두께, LineCollection 하나)
+        segments = np.stack([path[:-1], path[1:]], axis=1)
+        ax.add_collection(
+            LineCollection(
+                segments,
+                colors=path_color,
+                linewidths=line_width,
+                alpha=path_alpha,
+                label="Tour Path",
+                zorder=2,
+                rasterized=rasterize_artists,
+            )
+        )
 
     # 방향 화살표 추가 (선택적)
-    if show_arrows and len(x_coords) > 1:
-        # 화살표 크기도 동적으로 조정
-        arrow_head_width = max(1, node_size / 15)
-        arrow_head_length = max(1.5, node_size / 10)
+    if show_arrows and len(path) > 1:
+        # 몇 개의 화살표만 표시 (너무 많으면 복잡해짐)
+        arrow_step = max(1, (len(path) - 1) // 20)  # 최대 20개 화살표
+        index = np.arange(0, len(path) - 1, arrow_step)
+        delta = path[index + 1] - path[index]
+        moving = np.any(delta != 0, axis=1)  # 같은 위치가 아닌 경우만
+        index, delta = index[moving], delta[moving]
+
+        # 화살표 크기도 동적으로 조정 (path_only 모드에서는 더 크게)
+        head_scale = 1.5 if path_only else 1.0
+        ax.quiver(
+            path[index, 0],
+            path[index, 1],
+            delta[:, 0] * 0.3,
+            delta[:, 1] * 0.3,
+            angles="xy",
+            scale_units="xy",
+            scale=1,
+            color="navy",
+            alpha=0.8,
+            width=0.002 * head_scale,
+            headwidth=4 * head_scale,
+            headlength=5 * head_scale,
+            zorder=3,
+        )
 
-        # path_only 모드에서는 화살표도 더 크게
-        if path_only:
-            arrow_head_width *= 1.5
-            arrow_head_length *= 1.5
+    start_xy = path[0] if len(path) else None
 
-        # 몇 개의 화살표만 표시 (너무 많으면 복잡해짐)
-        arrow_step = max(1, len(x_coords) // 20)  # 최대 20개 화살표
-        for i in range(0, len(x_coords) - 1, arrow_step):
-            dx = x_coords[i + 1] - x_coords[i]
-            dy = y_coords[i + 1] - y_coords[i]
-            if dx != 0 or dy != 0:  # 같은 위치가 아닌 경우만
-                plt.arrow(
-                    x_coords[i],
-                    y_coords[i],
-                    dx * 0.3,
-                    dy * 0.3,
-                    head_width=arrow_head_width,
-                    head_length=arrow_head_length,
-                    fc="navy",
-                    ec="navy",
-                    alpha=0.8,
-                    zorder=3,
-                )
-
-    # path_only 모드가 아닐 때만 노드들 표시
-    if not path_only:
+    # path_only 모드가 아니고 래스터 모드가 아닐 때만 노드들 표시
+    if not path_only and not use_raster:
         # 노드들 점으로 표시 (동적 크기)
-        plt.scatter(
-            all_x,
-            all_y,
+        ax.scatter(
+            all_xy[:, 0],
+            all_xy[:, 1],
             c="crimson",
             s=node_size,
             zorder=4,
             label="Cities",
-            edgecolors="darkred",
+            edgecolors="none" if rasterize_artists else "darkred",
             linewidth=max(0.5, node_size / 50),
             alpha=0.7,
+            rasterized=rasterize_artists,
         )
 
         # 시작점 강조 (동적 크기)
-        if tour:
-            start_node = tour[0]
-            if start_node in coordinates:
-                start_x, start_y = coordinates[start_node]
-                plt.scatter(
-                    start_x,
-                    start_y,
-                    c="limegreen",
-                    s=start_node_size,
-                    zorder=6,
-                    marker="s",
-                    label="Start/End",
-                    edgecolors="darkgreen",
-                    linewidth=max(1, node_size / 25),
-                    alpha=0.8,
-                )
-    else:
-        # path_only 모드에서는 시작점만 작은 점으로 표시
-        if tour:
-            start_node = tour[0]
-            if start_node in coordinates:
-                start_x, start_y = coordinates[start_node]
-                plt.scatter(
-                    start_x,
-                    start_y,
-                    c="red",
-                    s=max(20, node_size // 3),
-                    zorder=6,
-                    marker="o",
-                    label="Start/End",
-                    edgecolors="darkred",
-                    linewidth=1,
-                    alpha=0.9,
-                )
+        if start_xy is not None:
+            ax.scatter(
+                start_xy[0],
+                start_xy[1],
+                c="limegreen",
+                s=start_node_size,
+                zorder=6,
+                marker="s",
+                label="Start/End",
+                edgecolors="darkgreen",
+                linewidth=max(1, node_size / 25),
+                alpha=0.8,
+            )
+    elif start_xy is not None:
+        # path_only / 래스터 모드에서는 시작점만 작은 점으로 표시
+        ax.scatter(
+            start_xy[0],
+            start_xy[1],
+            c="red",
+            s=max(20, node_size // 3),
+            zorder=6,
+            marker="o",
+            label="Start/End",
+            edgecolors="darkred",
+            linewidth=1,
+            alpha=0.9,
+        )
 
     # 노드 번호 표시 (선택적, 일부만) - path_only 모드에서는 비활성화
     if show_node_numbers and not path_only:
@@ -255,53 +284,49 @@ def visualize_tsp_tour(
         font_size = max(6, min(12, node_size / 8))
 
         # 노드가 많으면 일부만 표시
-        nodes_to_show = list(coordinates.keys())
+        nodes_to_show = node_ids
         if len(nodes_to_show) > 50:
-            # 50개 이상이면 1/3만 표시
+            # 50개 이상이면 약 15개만 표시
             step = len(nodes_to_show) // 15
             nodes_to_show = nodes_to_show[::step]
 
         for node_id in nodes_to_show:
-            if node_id in coordinates:
-                x, y = coordinates[node_id]
-                plt.annotate(
-                    str(node_id),
-                    (x, y),
-                    xytext=(3, 3),
-                    textcoords="offset points",
-                    fontsize=font_size,
-                    alpha=0.8,
-                    color="black",
-                    bbox=dict(
-                        boxstyle="round,pad=0.2",
-                        facecolor="white",
-                        alpha=0.7,
-                        edgecolor="none",
-                    ),
-                )
+            x, y = coordinates[node_id]
+            ax.annotate(
+                str(node_id),
+                (x, y),
+                xytext=(3, 3),
+                textcoords="offset points",
+                fontsize=font_size,
+                alpha=0.8,
+                color="black",
+                bbox=dict(
+                    boxstyle="round,pad=0.2",
+                    facecolor="white",
+                    alpha=0.7,
+                    edgecolor="none",
+                ),
+            )
 
     # 축 라벨과 범례
-    plt.xlabel("X Coordinate", fontsize=12)
-    plt.ylabel("Y Coordinate", fontsize=12)
-    plt.legend(loc="upper right", fontsize=10)
+    ax.set_xlabel("X Coordinate", fontsize=12)
+    ax.set_ylabel("Y Coordinate", fontsize=12)
+    ax.legend(loc="upper right", fontsize=10)
 
     # 격자 (더 연하게)
-    plt.grid(True, alpha=0.2)
-    plt.axis("equal")
+    ax.grid(True, alpha=0.2)
+    ax.set_aspect("equal", adjustable="box")
 
     # 여백 조정
-    margin = 0.03
-    x_range = max(all_x) - min(all_x)
-    y_range = max(all_y) - min(all_y)
-    plt.xlim(min(all_x) - margin * x_range, max(all_x) + margin * x_range)
-    plt.ylim(min(all_y) - margin * y_range, max(all_y) + margin * y_range)
+    ax.set_xlim(extent[0], extent[1])
+    ax.set_ylim(extent[2], extent[3])
 
     # 배경색 설정
-    plt.gca().set_facecolor("whitesmoke")
+    ax.set_facecolor("whitesmoke")
 
     # 저장 또는 표시
     if output_filename:
-        plt.savefig(
+        fig.savefig(
             output_filename,
             dpi=300,
             bbox_inches="tight",
@@ -312,56 +337,73 @@ def visualize_tsp_tour(
     else:
         plt.show()
 
-    plt.close()
+    plt.close(fig)
 
 
-def main():
+def main(argv=None):
     """
-    메인 함수
+    메인 함수 (argv: 프로그램 이름을 제외한 인자 목록, 기본값은 sys.argv[1:])
     """
-    if len(sys.argv) < 2:
+    args = sys.argv[1:] if argv is None else list(argv)
+    if len(args) < 1:
         print("사용법: python visualize_tsp.py <tour_파일명> [출력_이미지명] [옵션]")
         print("예시: python visualize_tsp.py tour_result.txt tour_visualization.png")
         print("옵션:")
         print("  --show-numbers : 노드 번호 표시")
         print("  --show-arrows : 방향 화살표 표시")
         print("  --path-only   : 노드 없이 경로만 표시")
+        print(
+            f"  --raster-threshold=N : 노드 수가 N을 넘으면 래스터 집계로 그리기 (기본 {DEFAULT_RASTER_THRESHOLD})"
+        )
+        print(f"  --raster-size=N : 래스터 이미지 긴 변 픽셀 수 (기본 {DEFAULT_RASTER_SIZE})")
         sys.exit(1)
 
-    tour_filename = sys.argv[1]
+    tour_filename = args[0]
     output_filename = None
     show_node_numbers = False
     show_arrows = False
     path_only = False
+    raster_threshold = DEFAULT_RASTER_THRESHOLD
+    raster_size = DEFAULT_RASTER_SIZE
 
     # 인자 파싱
-    for i, arg in enumerate(sys.argv[2:], 2):
+    for i, arg in enumerate(args[1:], 2):
         if arg == "--show-numbers":
             show_node_numbers = True
         elif arg == "--show-arrows":  # 화살표를 켜는 옵션으로 변경
             show_arrows = True
         elif arg == "--path-only":
             path_only = True
+        elif arg.startswith("--raster-threshold="):
+            raster_threshold = int(arg.split("=", 1)[1])
+        elif arg.startswith("--raster-size="):
+            raster_size = int(arg.split("=", 1)[1])
         elif not arg.startswith("--"):
             output_filename = arg
 
-    # 좌표 파일명 생성 (tour 파일명에서 _coordinates.txt로)
-    base_name = tour_filename.rsplit(".", 1)[0]
-    coord_filename = base_name + "_coordinates.txt"
+    # tour 헤더가 참조하는 좌표 파일 (이전 결과는 <tour>_coordinates.txt)
+    coord_filename = tsp_io.coordinates_path_for(tour_filename)
 
     # 파일 읽기
-    print(f"Tour 파일 읽는 중: {tour_filename}")
-    tour, total_distance = read_tour_file(tour_filename)
+    try:
+        print(f"Tour 파일 읽는 중: {tour_filename}")
+        tour, total_distance = tsp_io.load_tour(tour_filename)
 
-    print(f"좌표 파일 읽는 중: {coord_filename}")
-    coordinates = read_coordinates_file(coord_filename)
+        print(f"좌표 파일 읽는 중: {coord_filename}")
+        coordinates = tsp_io.load_coordinates(coord_filename)
+    except (OSError, ValueError) as e:
+        print(f"파일 읽기 실패: {e}")
+        sys.exit(1)
 
-    if tour is None or coordinates is None:
-        print("파일 읽기 실패")
+    # tour가 좌표 파일의 노드 순열인지 확인
+    try:
+        tsp_io.validate_tour(tour, len(coordinates))
+    except ValueError as e:
+        print(f"잘못된 tour: {e}")
         sys.exit(1)
 
     # 정보 출력
-    print(f"노드 수: {len(coordinates)}")
+    print(f"노드 수: {int(np.count_nonzero(~np.isnan(coordinates[:, 0])))}")
     print(f"Tour 길이: {len(tour)}")
     print(f"총 거리: {total_distance}")
     print(
@@ -378,12 +420,16 @@ def main():
         show_node_numbers,
         show_arrows,
         path_only,
+        raster_threshold,
+        raster_size,
     )
 
     print("시각화 옵션:")
     print("  --show-numbers: 노드 번호 표시")
     print("  --show-arrows: 방향 화살표 표시")
     print("  --path-only: 노드 없이 경로만 표시")
+    print("  --raster-threshold=N: N개 초과 노드는 래스터 집계로 표시")
+    print("  --raster-size=N: 래스터 이미지 해상도")
 
 
 if __name__ == "__main__":
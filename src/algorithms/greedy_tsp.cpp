@@ -1,14 +1,17 @@
 #include "../../include/tsp_common.h"
 #include "../../include/benchmark_utils.h"
+#include "../../include/memory_utils.h"
+#include "../../include/json_output.h"
+#include "../../include/multi_start.h"
 
 // Greedy TSP 알고리즘 (Nearest Neighbor)
-vector<int> greedyTSP(const CompleteGraph& graph) {
+vector<int> greedyTSP(const CompleteGraph& graph, int start = 0) {
     int n = graph.getNodeNum();
     vector<bool> visited(n, false);
     vector<int> tour;
     
-    // 시작점은 0번 노드
-    int current = 0;
+    // 시작점 (기본값 0번 노드)
+    int current = start;
     tour.push_back(current);
     visited[current] = true;
     
@@ -37,20 +40,80 @@ vector<int> greedyTSP(const CompleteGraph& graph) {
     }
     
     // 시작점으로 돌아가기
-    tour.push_back(0);
+    tour.push_back(start);
     
     return tour;
 }
 
+int tourCost(const CompleteGraph& graph, const vector<int>& tour) {
+    int total = 0;
+    for (size_t i = 0; i + 1 < tour.size(); i++) {
+        total += graph.getCost(tour[i], tour[i + 1]);
+    }
+    return total;
+}
+
+// 다중 시작: multiStartNodes의 시작점마다 최근접 이웃 투어를 스레드로 병렬 생성하고 최단 투어 반환
+// (그래프는 읽기 전용으로 공유)
+vector<int> multiStartGreedyTSP(const CompleteGraph& graph, int starts, int threads, StartSpread& spread) {
+    vector<int> start_nodes = multiStartNodes(graph.getNodeNum(), starts);
+    int m = start_nodes.size();
+    vector<vector<int>> tours(m);
+    vector<double> lengths(m);
+    
+    parallelFor(m, threads, [&](int i) {
+        tours[i] = greedyTSP(graph, start_nodes[i]);
+        lengths[i] = tourCost(graph, tours[i]);
+    });
+    
+    spread = summarizeStarts(start_nodes, lengths);
+    int best = min_element(lengths.begin(), lengths.end()) - lengths.begin();
+    return tours[best];
+}
+
 int main(int argc, char* argv[]) {
-    if (argc < 3) {
-        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file]" << endl;
+    SolverArgs args = parseSolverArgs(argc, argv);
+    if (args.positional.size() < 2) {
+        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file] [--json] [--starts=M] [--threads=N]" << endl;
+        cout << "  --starts=M   build M nearest-neighbour tours from spread start nodes and keep the best" << endl;
+        cout << "  --threads=N  worker threads for --starts (default: hardware threads)" << endl;
         return 1;
     }
     
-    string tsp_filename = argv[1];
-    string output_filename = argv[2];
-    string csv_filename = (argc > 3) ? argv[3] : "";
+    string tsp_filename = args.positional[0];
+    string output_filename = args.positional[1];
+    string csv_filename = (args.positional.size() > 2) ? args.positional[2] : "";
+    
+    // --starts=M: 다중 시작 시작점 수, --threads=N: 작업 스레드 수
+    int starts = 1;
+    if (args.hasOption("starts")) {
+        string starts_option = args.getOption("starts");
+        char* end = nullptr;
+        long value = strtol(starts_option.c_str(), &end, 10);
+        if (starts_option.empty() || *end != '\0' || value < 1 || value > 100000) {
+            cout << "Invalid --starts value: " << starts_option << " (expected an integer in 1..100000)" << endl;
+            return 1;
+        }
+        starts = (int)value;
+    }
+    int threads = defaultThreadCount();
+    if (args.hasOption("threads")) {
+        string threads_option = args.getOption("threads");
+        char* end = nullptr;
+        long value = strtol(threads_option.c_str(), &end, 10);
+        if (threads_option.empty() || *end != '\0' || value < 1 || value > 1024) {
+            cout << "Invalid --threads value: " << threads_option << " (expected an integer in 1..1024)" << endl;
+            return 1;
+        }
+        threads = (int)value;
+    }
+    
+    // --json: stdout에 결과 레코드 한 줄만 출력
+    JsonOutputMode json(args.hasOption("json"));
+    JsonObject record;
+    record.add("algorithm", "Greedy-TSP")
+          .add("dataset", getDatasetName(tsp_filename))
+          .add("file", tsp_filename);
     
     try {
         // I/O 시간 제외하고 순수 계산 시간만 측정
@@ -58,24 +121,34 @@ int main(int argc, char* argv[]) {
         vector<pair<double, double>> coordinates = parseCoordinates(tsp_filename);
         
         BenchmarkTimer timer;
+        MemoryTracker memory;
         timer.start();
+        memory.start();
         
         // 순수 TSP 계산 시간만 측정
-        vector<int> tour = greedyTSP(graph);
+        StartSpread spread;
+        vector<int> tour = (starts > 1) ? multiStartGreedyTSP(graph, starts, threads, spread)
+                                        : greedyTSP(graph);
         
+        memory.stop();
         timer.stop();
         
         // 투어 길이 계산
-        int total_distance = 0;
-        for (int i = 0; i < tour.size() - 1; i++) {
-            total_distance += graph.getCost(tour[i], tour[i + 1]);
-        }
+        int total_distance = tourCost(graph, tour);
         
         cout << "Algorithm: Greedy-TSP" << endl;
         cout << "Dataset: " << tsp_filename << endl;
         cout << "Nodes: " << graph.getNodeNum() << endl;
         cout << "Execution time: " << timer.getMilliseconds() << " ms" << endl;
         cout << "Tour distance: " << total_distance << endl;
+        cout << "Graph memory: " << graph.getMemoryBytes() << " bytes" << endl;
+        cout << "Allocated during solve: " << memory.getAllocatedBytes() << " bytes" << endl;
+        cout << "Peak RSS: " << getPeakRSSKB() << " KB" << endl;
+        if (starts > 1) {
+            cout << "Starts: " << spread.starts << " (best start node " << spread.best_start
+                 << ", tour length min " << spread.min_length << " / mean " << spread.mean_length
+                 << " / max " << spread.max_length << ")" << endl;
+        }
         
         // 결과 저장
         saveTourToFile(tour, coordinates, output_filename, total_distance);
@@ -85,11 +158,33 @@ int main(int argc, char* argv[]) {
             string dataset_name = tsp_filename.substr(tsp_filename.find_last_of("/") + 1);
             dataset_name = dataset_name.substr(0, dataset_name.find_last_of("."));
             saveBenchmarkResult(csv_filename, "Greedy-TSP", dataset_name, 
-                              graph.getNodeNum(), timer.getMilliseconds(), total_distance);
+                              graph.getNodeNum(), timer.getMilliseconds(), total_distance,
+                              getPeakRSSKB(), graph.getMemoryBytes(), memory.getAllocatedBytes());
+        }
+        
+        JsonObject memory_json;
+        memory_json.add("peak_rss_kb", getPeakRSSKB())
+                   .add("graph_bytes", graph.getMemoryBytes())
+                   .add("allocated_bytes", memory.getAllocatedBytes());
+        JsonObject parameters;
+        if (starts > 1) {
+            parameters.add("starts", starts);
+        }
+        record.add("n", graph.getNodeNum())
+              .add("parameters", parameters)
+              .add("status", "SUCCESS")
+              .add("time_ms", timer.getMilliseconds())
+              .add("distance", total_distance)
+              .add("memory", memory_json);
+        if (starts > 1) {
+            record.add("multi_start", startSpreadToJson(spread, threads));
         }
+        json.emit(record);
         
     } catch (const exception& e) {
         cout << "Error: " << e.what() << endl;
+        record.add("status", "ERROR").add("error", e.what());
+        json.emit(record);
         return 1;
     }
     
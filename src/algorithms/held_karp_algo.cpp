@@ -1,5 +1,8 @@
 #include "../../include/tsp_common.h"
 #include "../../include/benchmark_utils.h"
+#include "../../include/memory_utils.h"
+#include "../../include/json_output.h"
+#include <algorithm>
 
 
 int popCount(int x) {
@@ -84,6 +87,12 @@ vector<int> solveHeldKarp(int n, vector<vector<float>> cost) {
     return tour;
 }
 
+// DP 테이블(g, parent) 메모리: 2^n * n * (float + int)
+size_t heldKarpTableBytes(int n) {
+    size_t S_size = (size_t)1 << n;
+    return S_size * (n * (sizeof(float) + sizeof(int)) + 2 * sizeof(vector<float>));
+}
+
 vector<int> tspHeldKarp(const CompleteGraph& graph) {
     int n = graph.getNodeNum();
 
@@ -99,14 +108,22 @@ vector<int> tspHeldKarp(const CompleteGraph& graph) {
 }
 
 int main(int argc, char* argv[]) {
-    if (argc < 3) {
-        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file]" << endl;
+    SolverArgs args = parseSolverArgs(argc, argv);
+    if (args.positional.size() < 2) {
+        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file] [--json]" << endl;
         return 1;
     }
     
-    string tsp_filename = argv[1];
-    string output_filename = argv[2];
-    string csv_filename = (argc > 3) ? argv[3] : "";
+    string tsp_filename = args.positional[0];
+    string output_filename = args.positional[1];
+    string csv_filename = (args.positional.size() > 2) ? args.positional[2] : "";
+    
+    // --json: stdout에 결과 레코드 한 줄만 출력
+    JsonOutputMode json(args.hasOption("json"));
+    JsonObject record;
+    record.add("algorithm", "Held-Karp")
+          .add("dataset", getDatasetName(tsp_filename))
+          .add("file", tsp_filename);
 
     try {
         // I/O 시간 제외하고 순수 계산 시간만 측정
@@ -114,11 +131,14 @@ int main(int argc, char* argv[]) {
         vector<pair<double, double>> coordinates = parseCoordinates(tsp_filename);
         
         BenchmarkTimer timer;
+        MemoryTracker memory;
         timer.start();
+        memory.start();
         
         // 순수 TSP 계산 시간만 측정
         vector<int> tour = tspHeldKarp(graph);
         
+        memory.stop();
         timer.stop();
         
         // 투어 길이 계산
@@ -132,6 +152,10 @@ int main(int argc, char* argv[]) {
         cout << "Nodes: " << graph.getNodeNum() << endl;
         cout << "Execution time: " << timer.getMilliseconds() << " ms" << endl;
         cout << "Tour distance: " << total_distance << endl;
+        cout << "Graph memory: " << graph.getMemoryBytes() << " bytes" << endl;
+        cout << "DP table memory: " << heldKarpTableBytes(graph.getNodeNum()) << " bytes" << endl;
+        cout << "Allocated during solve: " << memory.getAllocatedBytes() << " bytes" << endl;
+        cout << "Peak RSS: " << getPeakRSSKB() << " KB" << endl;
         
         // 결과 저장
         saveTourToFile(tour, coordinates, output_filename, total_distance);
@@ -141,11 +165,27 @@ int main(int argc, char* argv[]) {
             string dataset_name = tsp_filename.substr(tsp_filename.find_last_of("/") + 1);
             dataset_name = dataset_name.substr(0, dataset_name.find_last_of("."));
             saveBenchmarkResult(csv_filename, "Held-Karp", dataset_name, 
-                              graph.getNodeNum(), timer.getMilliseconds(), total_distance);
+                              graph.getNodeNum(), timer.getMilliseconds(), total_distance,
+                              getPeakRSSKB(), graph.getMemoryBytes(), memory.getAllocatedBytes());
         }
         
+        JsonObject memory_json;
+        memory_json.add("peak_rss_kb", getPeakRSSKB())
+                   .add("graph_bytes", graph.getMemoryBytes())
+                   .add("allocated_bytes", memory.getAllocatedBytes())
+                  .add("dp_table_bytes", heldKarpTableBytes(graph.getNodeNum()));
+        record.add("n", graph.getNodeNum())
+              .add("parameters", JsonObject())
+              .add("status", "SUCCESS")
+              .add("time_ms", timer.getMilliseconds())
+              .add("distance", total_distance)
+              .add("memory", memory_json);
+        json.emit(record);
+        
     } catch (const exception& e) {
         cout << "Error: " << e.what() << endl;
+        record.add("status", "ERROR").add("error", e.what());
+        json.emit(record);
         return 1;
     }
     
@@ -1,45 +1,24 @@
 #include "../../include/tsp_common.h"
 #include "../../include/heap_utils.h"
+#include "../../include/mst_utils.h"
 #include "../../include/benchmark_utils.h"
+#include "../../include/memory_utils.h"
+#include "../../include/json_output.h"
 
-// DFS를 통한 MST preorder traversal
-void dfs(int u, const vector<vector<int> >& mst, vector<bool>& visited, vector<int>& tour) {
-    visited[u] = true;
-    tour.push_back(u);
-
-    for (int i = 0; i < mst[u].size(); i++) {
-        int v = mst[u][i];
-        if (!visited[v]) {
-            dfs(v, mst, visited, tour);
-        }
-    }
-}
-
-// Priority Queue 기반 Prim 알고리즘으로 MST 구축
-vector<vector<int> > buildMST(const CompleteGraph& graph, int root) {
+// Priority Queue 기반 Prim 알고리즘으로 MST 구축 (자식 배열로 반환)
+MSTChildArray buildMST(const CompleteGraph& graph, int root) {
     int n = graph.getNodeNum();
-    vector<vector<int> > mst(n);
     vector<int> parent(n, -1);
     vector<bool> in_mst(n, false);
     vector<int> key(n, INT_MAX);
     
-    PQNodeInt* pq = new PQNodeInt[n];
-    int pq_size = n;
-    
-
-    // priority 큐 초기화
-    for (int i = 0; i < n; i++) {
-        pq[i] = PQNodeInt(i, INT_MAX);
-        key[i] = INT_MAX;
-    }
-    
-    pq[root].key = 0;
+    // priority 큐 초기화 (정점 위치 맵으로 decrease-key O(log n))
     key[root] = 0;
+    IndexedMinHeap<PQNodeInt> pq(n);
+    pq.build(key);
     
-    build_min_heap_int(pq, pq_size);
-    
-    while (pq_size > 0) {
-        PQNodeInt min_node = extract_min_int(pq, pq_size);
+    while (!pq.empty()) {
+        PQNodeInt min_node = pq.extractMin();
         int u = min_node.vertex;
         
         if (min_node.key == INT_MAX) {
@@ -54,36 +33,24 @@ vector<vector<int> > buildMST(const CompleteGraph& graph, int root) {
                 if (cost > 0 && cost < key[v]) {
                     key[v] = cost;
                     parent[v] = u;
-                    decrease_key_int(pq, pq_size, v, cost);
+                    pq.decreaseKey(v, cost);
                 }
             }
         }
     }
     
-    // MST 인접 리스트 구성
-    for (int i = 0; i < n; i++) {
-        if (parent[i] != -1) {
-            mst[parent[i]].push_back(i);
-            mst[i].push_back(parent[i]);
-        }
-    }
-    
-    delete[] pq;
-    return mst;
+    return buildMSTChildArray(parent);
 }
 
 // TSP 2-Approximation 알고리즘
 vector<int> tsp2Approximation(const CompleteGraph& graph) {
-    int n = graph.getNodeNum();
     int root = 0;
 
     // 1. MST 구축
-    vector<vector<int> > mst = buildMST(graph, root);
+    MSTChildArray mst = buildMST(graph, root);
 
-    // 2. DFS 전위 순회
-    vector<bool> visited(n, false);
-    vector<int> tour;
-    dfs(root, mst, visited, tour);
+    // 2. 전위 순회 (명시적 스택)
+    vector<int> tour = mstPreorder(mst, root);
 
     // 3. 시작점으로 돌아가기
     tour.push_back(root);
@@ -92,14 +59,22 @@ vector<int> tsp2Approximation(const CompleteGraph& graph) {
 }
 
 int main(int argc, char* argv[]) {
-    if (argc < 3) {
-        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file]" << endl;
+    SolverArgs args = parseSolverArgs(argc, argv);
+    if (args.positional.size() < 2) {
+        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file] [--json]" << endl;
         return 1;
     }
     
-    string tsp_filename = argv[1];
-    string output_filename = argv[2];
-    string csv_filename = (argc > 3) ? argv[3] : "";
+    string tsp_filename = args.positional[0];
+    string output_filename = args.positional[1];
+    string csv_filename = (args.positional.size() > 2) ? args.positional[2] : "";
+    
+    // --json: stdout에 결과 레코드 한 줄만 출력
+    JsonOutputMode json(args.hasOption("json"));
+    JsonObject record;
+    record.add("algorithm", "MST-2-Approximation")
+          .add("dataset", getDatasetName(tsp_filename))
+          .add("file", tsp_filename);
     
     try {
         // I/O 시간 제외하고 순수 계산 시간만 측정
@@ -107,11 +82,14 @@ int main(int argc, char* argv[]) {
         vector<pair<double, double>> coordinates = parseCoordinates(tsp_filename);
         
         BenchmarkTimer timer;
+        MemoryTracker memory;
         timer.start();
+        memory.start();
         
         // 순수 TSP 계산 시간만 측정
         vector<int> tour = tsp2Approximation(graph);
         
+        memory.stop();
         timer.stop();
         
         // 투어 길이 계산
@@ -125,6 +103,9 @@ int main(int argc, char* argv[]) {
         cout << "Nodes: " << graph.getNodeNum() << endl;
         cout << "Execution time: " << timer.getMilliseconds() << " ms" << endl;
         cout << "Tour distance: " << total_distance << endl;
+        cout << "Graph memory: " << graph.getMemoryBytes() << " bytes" << endl;
+        cout << "Allocated during solve: " << memory.getAllocatedBytes() << " bytes" << endl;
+        cout << "Peak RSS: " << getPeakRSSKB() << " KB" << endl;
         
         // 결과 저장
         saveTourToFile(tour, coordinates, output_filename, total_distance);
@@ -134,11 +115,26 @@ int main(int argc, char* argv[]) {
             string dataset_name = tsp_filename.substr(tsp_filename.find_last_of("/") + 1);
             dataset_name = dataset_name.substr(0, dataset_name.find_last_of("."));
             saveBenchmarkResult(csv_filename, "MST-2-Approximation", dataset_name, 
-                              graph.getNodeNum(), timer.getMilliseconds(), total_distance);
+                              graph.getNodeNum(), timer.getMilliseconds(), total_distance,
+                              getPeakRSSKB(), graph.getMemoryBytes(), memory.getAllocatedBytes());
         }
         
+        JsonObject memory_json;
+        memory_json.add("peak_rss_kb", getPeakRSSKB())
+                   .add("graph_bytes", graph.getMemoryBytes())
+                   .add("allocated_bytes", memory.getAllocatedBytes());
+        record.add("n", graph.getNodeNum())
+              .add("parameters", JsonObject())
+              .add("status", "SUCCESS")
+              .add("time_ms", timer.getMilliseconds())
+              .add("distance", total_distance)
+              .add("memory", memory_json);
+        json.emit(record);
+        
     } catch (const exception& e) {
         cout << "Error: " << e.what() << endl;
+        record.add("status", "ERROR").add("error", e.what());
+        json.emit(record);
         return 1;
     }
     
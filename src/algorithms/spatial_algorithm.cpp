@@ -1,142 +1,169 @@
 #include "../../include/tsp_common.h"
 #include "../../include/heap_utils.h"
+#include "../../include/mst_utils.h"
+#include "../../include/multi_start.h"
+#include "../../include/candidate_graph.h"
+#include "../../include/point_set.h"
 #include "../../include/benchmark_utils.h"
 #include "../../include/spatial_analysis.h"
+#include "../../include/memory_utils.h"
+#include "../../include/perf_counters.h"
+#include "../../include/json_output.h"
 #include <algorithm>
+#include <functional>
 #include <set>
 #include <ctime>
 
-// 2D 점 구조체
-struct Point2D {
-    double x, y;
-    int id;
+// 연산 횟수 (분석 모드에서 실행마다 초기화 후 SpatialStats로 복사)
+// 분할 모드와 다중 시작의 작업 스레드끼리 경쟁하지 않도록 스레드별로 둠
+struct OperationCounts {
+    long long kd_queries;
+    long long kd_nodes_visited;
+    long long heap_ops;
+    long long two_opt_evaluations;
     
-    Point2D() : x(0), y(0), id(-1) {}
-    Point2D(double x, double y, int id) : x(x), y(y), id(id) {}
-    
-    double distance(const Point2D& other) const {
-        double dx = x - other.x;
-        double dy = y - other.y;
-        return sqrt(dx * dx + dy * dy);
-    }
+    OperationCounts() : kd_queries(0), kd_nodes_visited(0), heap_ops(0), two_opt_evaluations(0) {}
 };
 
-// KD-Tree 노드
-struct KDNode {
-    Point2D point;
-    KDNode* left;
-    KDNode* right;
-    int depth;
-    
-    KDNode(const Point2D& p, int d) : point(p), left(nullptr), right(nullptr), depth(d) {}
-};
+thread_local OperationCounts opCounts;
+
+// 단계별 진행 메시지 출력 여부 (작업 스레드와 분할 모드의 셀 풀이에서는 끔)
+thread_local bool logPhases = true;
 
-// KD-Tree 클래스
+// KD-Tree (배열로 표현한 암시적 트리, 노드 포인터 없음)
+// 구간 [lo, hi)의 가운데 위치 mid가 노드이고 [lo, mid), [mid + 1, hi)가 두 자식 서브트리
+// 좌표는 트리 순서로 다시 배치한 복사본(PointSet과 같은 좌표 타입)을 사용해 탐색이 연속된 메모리를 읽음
+template <typename T>
 class KDTree {
 private:
-    KDNode* root;
+    std::vector<PackedPoint<T>> coords;  // 트리 순서 좌표
+    std::vector<int> ids;                // 트리 순서 위치의 원래 노드 번호
     
-    KDNode* buildTree(vector<Point2D>& points, int depth) {
-        if (points.empty()) return nullptr;
+    void buildTree(const vector<PackedPoint<T>>& source, int lo, int hi, int depth) {
+        if (hi - lo <= 1) return;
         
         int axis = depth % 2; // 0: x축, 1: y축
+        int mid = lo + (hi - lo) / 2;
         
-        // 현재 축을 기준으로 정렬
-        sort(points.begin(), points.end(), [axis](const Point2D& a, const Point2D& b) {
-            return (axis == 0) ? a.x < b.x : a.y < b.y;
+        // 현재 축의 중앙값을 mid에 두고 작은 값은 왼쪽, 큰 값은 오른쪽으로
+        vector<int>::iterator base = ids.begin();
+        nth_element(base + lo, base + mid, base + hi, [&](int a, int b) {
+            return (axis == 0) ? source[a].x < source[b].x : source[a].y < source[b].y;
         });
         
-        int median = points.size() / 2;
-        KDNode* node = new KDNode(points[median], depth);
-        
-        vector<Point2D> leftPoints(points.begin(), points.begin() + median);
-        vector<Point2D> rightPoints(points.begin() + median + 1, points.end());
-        
-        node->left = buildTree(leftPoints, depth + 1);
-        node->right = buildTree(rightPoints, depth + 1);
-        
-        return node;
+        buildTree(source, lo, mid, depth + 1);
+        buildTree(source, mid + 1, hi, depth + 1);
     }
     
-    void knnSearch(KDNode* node, const Point2D& target, int k, 
-                   DistNode* nearest, int& heap_size) {
-        if (!node) return;
+    void knnSearch(int lo, int hi, int depth, double tx, double ty, int k,
+                   DistNode* nearest, int& heap_size) const {
+        if (lo >= hi) return;
         
-        double dist = target.distance(node->point);
+        int mid = lo + (hi - lo) / 2;
+        opCounts.kd_nodes_visited++;
+        double dx = tx - (double)coords[mid].x;
+        double dy = ty - (double)coords[mid].y;
+        double dist = sqrt(dx * dx + dy * dy);
         
         // max-heap을 사용한 k-nearest neighbor
-        insert_max_heap(nearest, heap_size, k, DistNode(dist, node->point.id));
+        insert_max_heap(nearest, heap_size, k, DistNode(dist, ids[mid]));
+        opCounts.heap_ops++;
         
-        int axis = node->depth % 2;
-        double targetAxis = (axis == 0) ? target.x : target.y;
-        double nodeAxis = (axis == 0) ? node->point.x : node->point.y;
+        int axis = depth % 2;
+        double targetAxis = (axis == 0) ? tx : ty;
+        double nodeAxis = (axis == 0) ? (double)coords[mid].x : (double)coords[mid].y;
         
-        KDNode* first = (targetAxis < nodeAxis) ? node->left : node->right;
-        KDNode* second = (targetAxis < nodeAxis) ? node->right : node->left;
-        
-        knnSearch(first, target, k, nearest, heap_size);
+        bool goLeft = targetAxis < nodeAxis;
+        if (goLeft) {
+            knnSearch(lo, mid, depth + 1, tx, ty, k, nearest, heap_size);
+        } else {
+            knnSearch(mid + 1, hi, depth + 1, tx, ty, k, nearest, heap_size);
+        }
         
-        // 다른 쪽도 확인할 필요가 있는지 판단
-        if (heap_size < k || abs(targetAxis - nodeAxis) < nearest[0].dist) {
-            knnSearch(second, target, k, nearest, heap_size);
+        // 다른 쪽도 확인할 필요가 있는지 판단 (경계 거리와 같은 동률 점도 찾도록 <=)
+        if (heap_size < k || abs(targetAxis - nodeAxis) <= nearest[0].dist) {
+            if (goLeft) {
+                knnSearch(mid + 1, hi, depth + 1, tx, ty, k, nearest, heap_size);
+            } else {
+                knnSearch(lo, mid, depth + 1, tx, ty, k, nearest, heap_size);
+            }
         }
     }
     
 public:
-    KDTree(vector<Point2D> points) {
-        root = buildTree(points, 0);
+    explicit KDTree(const PointSet<T>& points) {
+        int n = points.size();
+        ids.resize(n);
+        for (int i = 0; i < n; i++) ids[i] = i;
+        buildTree(points.points, 0, n, 0);
+        
+        coords.resize(n);
+        for (int i = 0; i < n; i++) coords[i] = points.points[ids[i]];
+    }
+    
+    // KD-Tree 메모리 (트리 순서 좌표 + 노드 번호)
+    size_t getMemoryBytes() const {
+        return coords.capacity() * sizeof(PackedPoint<T>) + ids.capacity() * sizeof(int);
     }
     
-    vector<int> findKNN(const Point2D& target, int k) {
-        DistNode* nearest = new DistNode[k];
+    // 호출자가 준 버퍼(크기 k 이상)에 (tx, ty)의 k-최근접 이웃을 채우고 개수를 반환
+    // (거리, id) 오름차순으로 정렬: 동률 처리가 힙 순서와 트리 모양에 좌우되지 않고,
+    // 앞의 k'개가 곧 k'-최근접 이웃이므로 K 스윕에서 잘라 쓸 수 있음
+    int findKNN(double tx, double ty, int k, DistNode* nearest) const {
         int heap_size = 0;
+        opCounts.kd_queries++;
         
-        knnSearch(root, target, k, nearest, heap_size);
+        knnSearch(0, (int)ids.size(), 0, tx, ty, k, nearest, heap_size);
         
-        vector<int> result;
-        for (int i = 0; i < heap_size; i++) {
-            result.push_back(nearest[i].id);
-        }
-        
-        delete[] nearest;
-        return result;
+        sort(nearest, nearest + heap_size, distNodeLess);
+        return heap_size;
     }
 };
 
-// Phase 1: Candidate Edge Filtering
-vector<vector<int>> buildCandidateEdges(const vector<Point2D>& points, int k = 20) {
-    cout << "Phase 1: Building candidate edges with k=" << k << endl;
+// Phase 1: Candidate Edge Filtering (각 후보 목록은 가까운 순서로 정렬됨)
+template <typename T>
+CandidateGraph buildCandidateEdges(const PointSet<T>& points, int k, size_t& kdtree_bytes,
+                                   PerfCounters* query_counters = nullptr) {
+    if (logPhases) cout << "Phase 1: Building candidate edges with k=" << k << endl;
     
-    vector<Point2D> pointsCopy = points;
-    KDTree kdTree(pointsCopy);
+    KDTree<T> kdTree(points);
+    kdtree_bytes = kdTree.getMemoryBytes();
     
     int n = points.size();
-    vector<vector<int>> candidates(n);
+    CandidateGraph candidates;
+    candidates.startBuild(n, (size_t)n * k);
+    vector<DistNode> nearest(k + 1);  // 질의마다 재사용하는 kNN 버퍼
+    
+    // KD-tree 질의 구간만 별도로 하드웨어 카운터 측정
+    if (query_counters) query_counters->start();
     
     for (int i = 0; i < n; i++) {
-        vector<int> neighbors = kdTree.findKNN(points[i], k + 1); // +1 because it includes itself
+        int found = kdTree.findKNN(points.x(i), points.y(i), k + 1, nearest.data()); // +1 because it includes itself
         
-        for (int neighbor : neighbors) {
-            if (neighbor != i) {
-                candidates[i].push_back(neighbor);
+        for (int j = 0; j < found; j++) {
+            if (nearest[j].id != i) {
+                candidates.addEdge(nearest[j].id, nearest[j].dist);
             }
         }
+        candidates.finishNode();
     }
     
+    if (query_counters) query_counters->stop();
+    
     return candidates;
 }
 
 // Phase 2: Greedy Insertion
-vector<int> greedyInsertion(const vector<Point2D>& points, 
-                           const vector<vector<int>>& candidates) {
-    cout << "Phase 2: Greedy insertion" << endl;
+template <typename T>
+vector<int> greedyInsertion(const PointSet<T>& points, 
+                           const CandidateGraph& candidates, int start = 0) {
+    if (logPhases) cout << "Phase 2: Greedy insertion" << endl;
     
     int n = points.size();
     vector<bool> visited(n, false);
     vector<int> tour;
     
-    // 시작점 선택 (중앙에 가까운 점)
-    int start = 0;
+    // 시작점 (기본값 0번 노드, 다중 시작에서는 시작점마다 다름)
     tour.push_back(start);
     visited[start] = true;
     
@@ -146,13 +173,11 @@ vector<int> greedyInsertion(const vector<Point2D>& points,
         double minDist = INFINITY;
         
         // 현재 점의 후보 이웃들 중에서 가장 가까운 미방문 점 찾기
-        for (int candidate : candidates[current]) {
-            if (!visited[candidate]) {
-                double dist = points[current].distance(points[candidate]);
-                if (dist < minDist) {
-                    minDist = dist;
-                    next = candidate;
-                }
+        // (후보 목록이 거리순이므로 처음 만나는 미방문 점)
+        for (int e = candidates.begin(current); e < candidates.end(current); e++) {
+            if (!visited[candidates.neighbors[e]]) {
+                next = candidates.neighbors[e];
+                break;
             }
         }
         
@@ -160,7 +185,7 @@ vector<int> greedyInsertion(const vector<Point2D>& points,
         if (next == -1) {
             for (int i = 0; i < n; i++) {
                 if (!visited[i]) {
-                    double dist = points[current].distance(points[i]);
+                    double dist = points.distance(current, i);
                     if (dist < minDist) {
                         minDist = dist;
                         next = i;
@@ -180,90 +205,69 @@ vector<int> greedyInsertion(const vector<Point2D>& points,
 }
 
 // Phase 3: MST-Based Correction
-vector<int> mstBasedTour(const vector<Point2D>& points, 
-                        const vector<vector<int>>& candidates) {
-    cout << "Phase 3: MST-based correction" << endl;
+template <typename T>
+vector<int> mstBasedTour(const PointSet<T>& points, 
+                        const CandidateGraph& candidates, int root = 0) {
+    if (logPhases) cout << "Phase 3: MST-based correction" << endl;
     
     int n = points.size();
-    vector<vector<pair<int, double>>> mstAdj(n);
     
     // Prim's algorithm로 MST 구축 (candidate edges만 사용)
     vector<bool> inMST(n, false);
     vector<double> key(n, INFINITY);
     vector<int> parent(n, -1);
     
-    PQNode* pq = new PQNode[n];
-    int pq_size = n;
+    // priority 큐 초기화 (정점 위치 맵으로 decrease-key O(log n))
+    key[root] = 0;
+    IndexedMinHeap<PQNode> pq(n);
+    pq.build(key);
+    opCounts.heap_ops++;
     
-    // priority 큐 초기화
-    for (int i = 0; i < n; i++) {
-        pq[i] = PQNode(i, INFINITY);
-        key[i] = INFINITY;
-    }
-    
-    pq[0].key = 0;
-    key[0] = 0;
-    
-    build_min_heap(pq, pq_size);
-    
-    while (pq_size > 0) {
-        PQNode min_node = extract_min(pq, pq_size);
+    while (!pq.empty()) {
+        PQNode min_node = pq.extractMin();
+        opCounts.heap_ops++;
         int u = min_node.vertex;
         
+        // 후보 그래프가 끊어져 있으면 남은 정점을 트리의 가장 가까운 정점에 연결하고 계속
+        // (중단하면 도달하지 못한 정점이 투어에서 빠짐)
         if (min_node.key == INFINITY) {
-            break;
+            for (int t = 0; t < n; t++) {
+                if (inMST[t] && points.distance(u, t) < key[u]) {
+                    key[u] = points.distance(u, t);
+                    parent[u] = t;
+                }
+            }
         }
         
         inMST[u] = true;
         
-        // 후보 이웃들 확인
-        for (int v : candidates[u]) {
+        // 후보 이웃들 확인 (간선 길이는 Phase 1에서 계산한 값 사용)
+        for (int e = candidates.begin(u); e < candidates.end(u); e++) {
+            int v = candidates.neighbors[e];
             if (!inMST[v]) {
-                double weight = points[u].distance(points[v]);
+                double weight = candidates.lengths[e];
                 if (weight < key[v]) {
                     key[v] = weight;
                     parent[v] = u;
-                    decrease_key(pq, pq_size, v, weight);
+                    pq.decreaseKey(v, weight);
+                    opCounts.heap_ops++;
                 }
             }
         }
     }
     
-    delete[] pq;
-    
-    // MST 인접 리스트 구성
-    for (int i = 1; i < n; i++) {
-        if (parent[i] != -1) {
-            mstAdj[parent[i]].push_back({i, key[i]});
-            mstAdj[i].push_back({parent[i], key[i]});
-        }
-    }
-    
-    // DFS로 MST traversal
-    vector<int> mstTour;
-    vector<bool> visited(n, false);
-    
-    function<void(int)> dfs = [&](int u) {
-        visited[u] = true;
-        mstTour.push_back(u);
-        
-        for (auto& edge : mstAdj[u]) {
-            int v = edge.first;
-            if (!visited[v]) {
-                dfs(v);
-            }
-        }
-    };
-    
-    dfs(0);
-    mstTour.push_back(0); // 시작점으로 돌아가기
+    // MST 자식 배열(CSR) 구성 후 명시적 스택으로 전위 순회
+    MSTChildArray mstTree = buildMSTChildArray(parent);
+    vector<int> mstTour = mstPreorder(mstTree, root);
+    mstTour.push_back(root); // 시작점으로 돌아가기
     
     return mstTour;
 }
 
 // Phase 4: Selective 2-opt Post-Processing
-void selective2opt(vector<int>& tour, const vector<Point2D>& points, int iterations = 2) {
-    cout << "Phase 4: Selective 2-opt improvement" << endl;
+template <typename T>
+void selective2opt(vector<int>& tour, const PointSet<T>& points, int iterations = 2) {
+    if (logPhases) cout << "Phase 4: Selective 2-opt improvement" << endl;
     
     int n = tour.size() - 1; // 마지막은 시작점으로 돌아가는 것
     
@@ -273,7 +277,7 @@ void selective2opt(vector<int>& tour, const vector<Point2D>& points, int iterati
         for (int i = 0; i < n; i++) {
             int from = tour[i];
             int to = tour[i + 1];
-            double length = points[from].distance(points[to]);
+            double length = points.distance(from, to);
             edgeLengths.push_back({length, i});
         }
         
@@ -289,13 +293,15 @@ void selective2opt(vector<int>& tour, const vector<Point2D>& points, int iterati
             for (int j = i + 2; j < n; j++) {
                 if (j == n - 1 && i == 0) continue; // 같은 간선
                 
+                opCounts.two_opt_evaluations++;
+                
                 // 현재 거리
-                double dist1 = points[tour[i]].distance(points[tour[i + 1]]) +
-                              points[tour[j]].distance(points[tour[j + 1]]);
+                double dist1 = points.distance(tour[i], tour[i + 1]) +
+                              points.distance(tour[j], tour[j + 1]);
                 
                 // 2-opt 교환 후 거리
-                double dist2 = points[tour[i]].distance(points[tour[j]]) +
-                              points[tour[i + 1]].distance(points[tour[j + 1]]);
+                double dist2 = points.distance(tour[i], tour[j]) +
+                              points.distance(tour[i + 1], tour[j + 1]);
                 
                 if (dist2 < dist1) {
                     // 2-opt 교환 수행
@@ -312,31 +318,49 @@ void selective2opt(vector<int>& tour, const vector<Point2D>& points, int iterati
 }
 
 // 투어의 총 거리 계산
-double calculateTourLength(const vector<int>& tour, const vector<Point2D>& points) {
+template <typename T>
+double calculateTourLength(const vector<int>& tour, const PointSet<T>& points) {
     double totalLength = 0;
     for (int i = 0; i < tour.size() - 1; i++) {
-        totalLength += points[tour[i]].distance(points[tour[i + 1]]);
+        totalLength += points.distance(tour[i], tour[i + 1]);
     }
     return totalLength;
 }
 
+// 기본 후보 이웃 수 (--k로 지정하지 않은 경우)
+int defaultCandidateK(int n) {
+    return min(30, max(10, n / 10));
+}
+
+// start에서 시작하는 Greedy 투어와 start를 루트로 하는 MST 투어 중 짧은 것을 골라 2-opt 적용 (Phase 2~4)
+template <typename T>
+vector<int> solveFromStart(const PointSet<T>& points, const CandidateGraph& candidates, int start) {
+    vector<int> greedyTour = greedyInsertion(points, candidates, start);
+    vector<int> mstTour = mstBasedTour(points, candidates, start);
+    bool useGreedy = calculateTourLength(greedyTour, points) < calculateTourLength(mstTour, points);
+    vector<int>& tour = useGreedy ? greedyTour : mstTour;
+    selective2opt(tour, points);
+    return tour;
+}
+
 // 메인 Spatial TSP 알고리즘
 vector<int> spatialTSP(const CompleteGraph& graph) {
     int n = graph.getNodeNum();
     
     // 좌표 정보가 필요하므로 임시로 그리드 형태로 생성
-    vector<Point2D> points(n);
+    PointSet<double> points;
     for (int i = 0; i < n; i++) {
         // 간단한 그리드 배치 (실제로는 파일에서 읽어와야 함)
         int gridSize = (int)sqrt(n) + 1;
-        points[i] = Point2D(i % gridSize, i / gridSize, i);
+        points.push_back(i % gridSize, i / gridSize);
     }
     
     cout << "Starting Spatial TSP Algorithm for " << n << " nodes" << endl;
     
     // Phase 1: Candidate Edge Filtering
-    int k = min(30, max(10, n / 10)); // 적응적 k 값
-    vector<vector<int>> candidates = buildCandidateEdges(points, k);
+    int k = defaultCandidateK(n);
+    size_t kdtree_bytes = 0;
+    CandidateGraph candidates = buildCandidateEdges(points, k, kdtree_bytes);
     
     // Phase 2: Greedy Insertion
     vector<int> greedyTour = greedyInsertion(points, candidates);
@@ -361,39 +385,74 @@ vector<int> spatialTSP(const CompleteGraph& graph) {
 }
 
 // 실제 좌표를 사용하는 버전 (분석 기능 포함)
-vector<int> spatialTSPWithCoordsAnalysis(const vector<pair<double, double>>& coordinates, SpatialStats& stats) {
-    int n = coordinates.size();
-    
-    // 좌표를 Point2D로 변환
-    vector<Point2D> points(n);
-    for (int i = 0; i < n; i++) {
-        points[i] = Point2D(coordinates[i].first, coordinates[i].second, i);
-    }
+// profile=true이면 단계별/KD-tree 질의 구간의 하드웨어 카운터(perf_event)를 함께 측정
+// k <= 0이면 defaultCandidateK(n) 사용
+// starts > 1이면 multiStartNodes의 시작점마다 Phase 2~4를 실행해 최단 투어를 고름:
+// 0번 시작점은 아래 단계별 계측 경로로, 나머지는 threads - 1개 작업 스레드에서 동시에 실행
+// (단계별 시간/연산 횟수/카운터는 0번 시작점 기준, 할당 바이트는 동시 실행분 포함)
+template <typename T>
+vector<int> spatialTSPWithPoints(const PointSet<T>& points, SpatialStats& stats, bool profile, int k,
+                                 int starts, int threads) {
+    int n = points.size();
     
     cout << "Starting Spatial TSP Algorithm for " << n << " nodes with detailed analysis" << endl;
     
     BenchmarkTimer phaseTimer;
+    MemoryTracker phaseMemory;
+    size_t peak_heap_bytes = 0;
+    opCounts = OperationCounts();
+    
+    PerfCounters phaseCounters;
+    PerfCounters queryCounters;
+    if (profile && !(phaseCounters.open() && queryCounters.open())) {
+        cout << "Hardware counters unavailable (perf_event_open failed, see /proc/sys/kernel/perf_event_paranoid)" << endl;
+    }
     
     // Phase 1: Candidate Edge Filtering
     phaseTimer.start();
-    int k = min(30, max(10, n / 10)); 
-    vector<vector<int>> candidates = buildCandidateEdges(points, k);
+    phaseMemory.start();
+    phaseCounters.start();
+    if (k <= 0) k = defaultCandidateK(n);
+    stats.k = k;
+    CandidateGraph candidates = buildCandidateEdges(points, k, stats.kdtree_bytes,
+                                                    profile ? &queryCounters : nullptr);
+    phaseCounters.stop();
+    phaseMemory.stop();
     phaseTimer.stop();
+    stats.phase1_counters = phaseCounters.getValues();
+    stats.kd_query_counters = queryCounters.getValues();
     stats.phase1_time_ms = phaseTimer.getMilliseconds();
+    stats.phase1_alloc_bytes = phaseMemory.getAllocatedBytes();
+    stats.candidate_bytes = candidates.getMemoryBytes();
+    peak_heap_bytes = max(peak_heap_bytes, peakLiveHeapBytes());
     
     // Phase 2: Greedy Insertion  
     phaseTimer.start();
+    phaseMemory.start();
+    phaseCounters.start();
     vector<int> greedyTour = greedyInsertion(points, candidates);
+    phaseCounters.stop();
+    phaseMemory.stop();
     phaseTimer.stop();
+    stats.phase2_counters = phaseCounters.getValues();
     stats.phase2_time_ms = phaseTimer.getMilliseconds();
+    stats.phase2_alloc_bytes = phaseMemory.getAllocatedBytes();
+    peak_heap_bytes = max(peak_heap_bytes, peakLiveHeapBytes());
     double greedyLength = calculateTourLength(greedyTour, points);
     cout << "Greedy tour length: " << greedyLength << endl;
     
     // Phase 3: MST-Based Correction
     phaseTimer.start();
+    phaseMemory.start();
+    phaseCounters.start();
     vector<int> mstTour = mstBasedTour(points, candidates);
+    phaseCounters.stop();
+    phaseMemory.stop();
     phaseTimer.stop();
+    stats.phase3_counters = phaseCounters.getValues();
     stats.phase3_time_ms = phaseTimer.getMilliseconds();
+    stats.phase3_alloc_bytes = phaseMemory.getAllocatedBytes();
+    peak_heap_bytes = max(peak_heap_bytes, peakLiveHeapBytes());
     double mstLength = calculateTourLength(mstTour, points);
     cout << "MST tour length: " << mstLength << endl;
     
@@ -419,15 +478,66 @@ vector<int> spatialTSPWithCoordsAnalysis(const vector<pair<double, double>>& coo
     
     // Phase 4: Selective 2-opt Post-Processing
     phaseTimer.start();
+    phaseMemory.start();
+    phaseCounters.start();
     selective2opt(bestTour, points);
+    phaseCounters.stop();
+    phaseMemory.stop();
     phaseTimer.stop();
+    stats.phase4_counters = phaseCounters.getValues();
     stats.phase4_time_ms = phaseTimer.getMilliseconds();
+    stats.phase4_alloc_bytes = phaseMemory.getAllocatedBytes();
+    peak_heap_bytes = max(peak_heap_bytes, peakLiveHeapBytes());
+    stats.peak_heap_bytes = peak_heap_bytes;
     double finalLength = calculateTourLength(bestTour, points);
     cout << "Final optimized tour length: " << finalLength << endl;
     
+    // 다중 시작: 0번 시작점 외의 시작점은 후보 그래프를 읽기 전용으로 공유하며 병렬 실행
+    // 메모리 카운터는 프로세스 전체 값이므로, Phase 2-4의 시간/할당량/최대 힙이 0번 시작점의
+    // 구성만 나타내도록 Phase 4 측정이 끝난 뒤에 시작함
+    vector<int> start_nodes = multiStartNodes(n, starts);
+    int extra_starts = start_nodes.size() - 1;
+    vector<vector<int>> extraTours(extra_starts);
+    vector<double> lengths(start_nodes.size(), 0);
+    lengths[0] = finalLength;
+    phaseTimer.start();
+    if (extra_starts > 0) {
+        // 호출 스레드도 작업에 참여하므로 끝나면 logPhases를 원래 값으로 되돌림
+        bool previousLogPhases = logPhases;
+        exception_ptr extraError;
+        try {
+            parallelFor(extra_starts, threads, [&](int i) {
+                logPhases = false;
+                extraTours[i] = solveFromStart(points, candidates, start_nodes[i + 1]);
+                lengths[i + 1] = calculateTourLength(extraTours[i], points);
+            });
+        } catch (...) {
+            extraError = current_exception();
+        }
+        logPhases = previousLogPhases;
+        if (extraError) {
+            rethrow_exception(extraError);
+        }
+    }
+    phaseTimer.stop();
+    stats.multi_start_wait_ms = phaseTimer.getMilliseconds();
+    stats.start_spread = summarizeStarts(start_nodes, lengths);
+    stats.multi_start_threads = threads;
+    if (extra_starts > 0) {
+        int best = min_element(lengths.begin(), lengths.end()) - lengths.begin();
+        if (best > 0) {
+            bestTour.swap(extraTours[best - 1]);
+            finalLength = lengths[best];
+        }
+        cout << "Multi-start: " << stats.start_spread.starts << " starts, best start node "
+             << stats.start_spread.best_start << " (tour length min " << stats.start_spread.min_length
+             << " / mean " << stats.start_spread.mean_length << " / max "
+             << stats.start_spread.max_length << ")" << endl;
+    }
+    
     stats.final_distance = finalLength;
     stats.total_time_ms = stats.phase1_time_ms + stats.phase2_time_ms + 
-                          stats.phase3_time_ms + stats.phase4_time_ms;
+                          stats.phase3_time_ms + stats.phase4_time_ms + stats.multi_start_wait_ms;
     
     cout << "\n=== PHASE ANALYSIS ===" << endl;
     cout << "Phase 1 (Candidate Filtering): " << stats.phase1_time_ms << " ms" << endl;
@@ -436,66 +546,780 @@ vector<int> spatialTSPWithCoordsAnalysis(const vector<pair<double, double>>& coo
     cout << "Phase 4 (2-opt Optimization): " << stats.phase4_time_ms << " ms" << endl;
     cout << "Total: " << stats.total_time_ms << " ms" << endl;
     
+    cout << "\n=== MEMORY ANALYSIS ===" << endl;
+    cout << "KD-Tree nodes: " << stats.kdtree_bytes << " bytes" << endl;
+    cout << "Candidate lists: " << stats.candidate_bytes << " bytes" << endl;
+    cout << "Phase 1 allocated: " << stats.phase1_alloc_bytes << " bytes" << endl;
+    cout << "Phase 2 allocated: " << stats.phase2_alloc_bytes << " bytes" << endl;
+    cout << "Phase 3 allocated: " << stats.phase3_alloc_bytes << " bytes" << endl;
+    cout << "Phase 4 allocated: " << stats.phase4_alloc_bytes << " bytes" << endl;
+    cout << "Peak heap: " << stats.peak_heap_bytes << " bytes" << endl;
+    
+    stats.kd_queries = opCounts.kd_queries;
+    stats.kd_nodes_visited = opCounts.kd_nodes_visited;
+    stats.heap_ops = opCounts.heap_ops;
+    stats.two_opt_evaluations = opCounts.two_opt_evaluations;
+    
+    cout << "\n=== OPERATION COUNTS ===" << endl;
+    cout << "KD-Tree queries: " << stats.kd_queries << endl;
+    cout << "KD-Tree nodes visited: " << stats.kd_nodes_visited;
+    if (stats.kd_queries > 0) {
+        cout << " (" << (double)stats.kd_nodes_visited / stats.kd_queries << " per query)";
+    }
+    cout << endl;
+    cout << "Heap operations: " << stats.heap_ops << endl;
+    cout << "2-opt move evaluations: " << stats.two_opt_evaluations << endl;
+    
+    if (profile && phaseCounters.isAvailable()) {
+        const char* names[] = {"Phase 1", "  KD queries", "Phase 2", "Phase 3", "Phase 4"};
+        const PerfCounterValues* sections[] = {&stats.phase1_counters, &stats.kd_query_counters,
+                                               &stats.phase2_counters, &stats.phase3_counters,
+                                               &stats.phase4_counters};
+        cout << "\n=== HARDWARE COUNTERS ===" << endl;
+        for (int i = 0; i < 5; i++) {
+            const PerfCounterValues& v = *sections[i];
+            cout << names[i] << ": cycles=" << v.cycles
+                 << " instructions=" << v.instructions
+                 << " IPC=" << v.ipc()
+                 << " cache-misses=" << v.cache_misses
+                 << " (MPKI " << v.cacheMissesPerKiloInstruction() << ")"
+                 << " branch-misses=" << v.branch_misses << endl;
+        }
+    }
+    
     return bestTour;
 }
 
+// 좌표를 mode의 PointSet으로 옮겨 spatialTSPWithPoints 실행
+vector<int> spatialTSPWithCoordsAnalysis(const vector<pair<double, double>>& coordinates, SpatialStats& stats,
+                                         bool profile = false, int k = 0, int starts = 1, int threads = 1,
+                                         CoordinateMode mode = COORDS_DOUBLE) {
+    switch (mode) {
+        case COORDS_FLOAT:
+            return spatialTSPWithPoints(PointSet<float>(coordinates), stats, profile, k, starts, threads);
+        case COORDS_INT32:
+            return spatialTSPWithPoints(PointSet<int32_t>(coordinates), stats, profile, k, starts, threads);
+        default:
+            return spatialTSPWithPoints(PointSet<double>(coordinates), stats, profile, k, starts, threads);
+    }
+}
+
+// K 스윕 결과 (--k-sweep)
+struct KSweepResult {
+    int k;
+    int distance;
+    double time_ms;         // 후보 목록 잘라내기 + Phase 2~4
+    double phase2_time_ms;
+    double phase3_time_ms;
+    double phase4_time_ms;
+    string winner;
+};
+
+// K 스윕: KD-tree 구축과 kNN 질의는 가장 큰 K로 한 번만 수행하고 (거리순 정렬),
+// 더 작은 K의 후보 목록은 그 앞부분을 잘라 만든 뒤 Phase 2~4만 K마다 실행
+// best_tour에는 거리가 가장 짧은 K의 투어를 저장 (같으면 작은 K)
+// (거리는 scorer로 계산: EXPLICIT 파일은 간선 가중치 행렬, 나머지는 원래 좌표의 TSPLIB 거리)
+template <typename T>
+vector<KSweepResult> spatialKSweepPoints(const PointSet<T>& points, const TourScorer& scorer,
+                                         vector<int> k_values, SpatialStats& stats, vector<int>& best_tour) {
+    int n = points.size();
+    
+    sort(k_values.begin(), k_values.end());
+    k_values.erase(unique(k_values.begin(), k_values.end()), k_values.end());
+    int max_k = k_values.back();
+    
+    cout << "Starting Spatial TSP K sweep for " << n << " nodes (" << k_values.size()
+         << " K values, shared phase 1 at k=" << max_k << ")" << endl;
+    
+    BenchmarkTimer phaseTimer;
+    phaseTimer.start();
+    CandidateGraph sorted_candidates = buildCandidateEdges(points, max_k, stats.kdtree_bytes);
+    phaseTimer.stop();
+    stats.k = max_k;
+    stats.phase1_time_ms = phaseTimer.getMilliseconds();
+    stats.candidate_bytes = sorted_candidates.getMemoryBytes();
+    
+    vector<KSweepResult> results;
+    BenchmarkTimer sweepTimer;
+    for (int k : k_values) {
+        KSweepResult result;
+        result.k = k;
+        
+        sweepTimer.start();
+        CandidateGraph candidates = truncateCandidateGraph(sorted_candidates, k);
+        
+        phaseTimer.start();
+        vector<int> greedyTour = greedyInsertion(points, candidates);
+        phaseTimer.stop();
+        result.phase2_time_ms = phaseTimer.getMilliseconds();
+        
+        phaseTimer.start();
+        vector<int> mstTour = mstBasedTour(points, candidates);
+        phaseTimer.stop();
+        result.phase3_time_ms = phaseTimer.getMilliseconds();
+        
+        double greedyLength = calculateTourLength(greedyTour, points);
+        double mstLength = calculateTourLength(mstTour, points);
+        result.winner = (greedyLength < mstLength) ? "Greedy" : "MST";
+        vector<int>& tour = (greedyLength < mstLength) ? greedyTour : mstTour;
+        
+        phaseTimer.start();
+        selective2opt(tour, points);
+        phaseTimer.stop();
+        result.phase4_time_ms = phaseTimer.getMilliseconds();
+        sweepTimer.stop();
+        
+        result.time_ms = sweepTimer.getMilliseconds();
+        result.distance = scorer.tourLength(tour);
+        cout << "K=" << k << ": distance " << result.distance << ", " << result.time_ms
+             << " ms (" << result.winner << ")" << endl;
+        
+        if (results.empty() || result.distance < stats.final_distance) {
+            stats.final_distance = result.distance;
+            best_tour = tour;
+        }
+        results.push_back(result);
+    }
+    
+    return results;
+}
+
+vector<KSweepResult> spatialKSweep(const vector<pair<double, double>>& coordinates, const vector<int>& k_values,
+                                   SpatialStats& stats, vector<int>& best_tour, const TourScorer& scorer,
+                                   CoordinateMode mode = COORDS_DOUBLE) {
+    switch (mode) {
+        case COORDS_FLOAT:
+            return spatialKSweepPoints(PointSet<float>(coordinates), scorer, k_values, stats, best_tour);
+        case COORDS_INT32:
+            return spatialKSweepPoints(PointSet<int32_t>(coordinates), scorer, k_values, stats, best_tour);
+        default:
+            return spatialKSweepPoints(PointSet<double>(coordinates), scorer, k_values, stats, best_tour);
+    }
+}
+
+// 분할 모드 (--partition) 통계
+struct PartitionStats {
+    int cell_size;
+    int cells;
+    int threads;
+    double partition_time_ms;   // 셀 분할 + 셀 방문 순서 결정
+    double solve_time_ms;       // 셀 병렬 풀이 (벽시계 시간)
+    double max_cell_time_ms;    // 가장 오래 걸린 셀
+    double stitch_time_ms;
+    double repair_time_ms;
+    double stitched_length;     // 이어붙인 직후 투어 길이
+    double final_length;        // 이음매 보정 후 투어 길이
+    
+    PartitionStats() : cell_size(0), cells(0), threads(0), partition_time_ms(0), solve_time_ms(0),
+                       max_cell_time_ms(0), stitch_time_ms(0), repair_time_ms(0),
+                       stitched_length(0), final_length(0) {}
+};
+
+const int DEFAULT_PARTITION_CELL_SIZE = 20000;
+const int SEAM_WINDOW = 50;  // 이음매 양쪽으로 보정하는 투어 위치 수
+
+// ids[begin, end)를 바운딩 박스의 긴 축 중앙값으로 재귀 분할해 max_cell_size 이하의 구간(셀)으로 나눔
+template <typename T>
+void splitIntoCells(const PointSet<T>& points, vector<int>& ids, int begin, int end,
+                    int max_cell_size, vector<pair<int, int>>& cells) {
+    if (end - begin <= max_cell_size) {
+        cells.push_back({begin, end});
+        return;
+    }
+    
+    double min_x = INFINITY, max_x = -INFINITY, min_y = INFINITY, max_y = -INFINITY;
+    for (int i = begin; i < end; i++) {
+        double x = points.x(ids[i]);
+        double y = points.y(ids[i]);
+        min_x = min(min_x, x);
+        max_x = max(max_x, x);
+        min_y = min(min_y, y);
+        max_y = max(max_y, y);
+    }
+    bool split_x = (max_x - min_x) >= (max_y - min_y);
+    
+    int mid = begin + (end - begin) / 2;
+    nth_element(ids.begin() + begin, ids.begin() + mid, ids.begin() + end, [&](int a, int b) {
+        return split_x ? points.x(a) < points.x(b) : points.y(a) < points.y(b);
+    });
+    splitIntoCells(points, ids, begin, mid, max_cell_size, cells);
+    splitIntoCells(points, ids, mid, end, max_cell_size, cells);
+}
+
+// ids[0..m)의 점들을 Phase 1~4 파이프라인으로 풀어 순환 투어(시작점 반복 없음, 원래 id)를 반환
+template <typename T>
+vector<int> solveCell(const PointSet<T>& points, const int* ids, int m, int k) {
+    if (m <= 3) {
+        return vector<int>(ids, ids + m);
+    }
+    
+    PointSet<T> local = points.subset(ids, m);
+    
+    size_t kdtree_bytes = 0;
+    CandidateGraph candidates = buildCandidateEdges(local, k > 0 ? k : defaultCandidateK(m), kdtree_bytes);
+    vector<int> tour = solveFromStart(local, candidates, 0);
+    
+    vector<int> cycle(m);
+    for (int i = 0; i < m; i++) {
+        cycle[i] = ids[tour[i]];
+    }
+    return cycle;
+}
+
+// 셀 투어를 cell_order 순서로 이어붙여 열린 투어를 만들고, 셀이 시작되는 위치를 seams에 기록
+// 셀마다 끊을 간선과 방향을 골라 (이전 끝점 -> 시작점) + (끝점 -> 다음 셀 중심) - (끊은 간선)을 최소화
+template <typename T>
+vector<int> stitchCells(const PointSet<T>& points, const vector<vector<int>>& cycles,
+                        const vector<int>& cell_order, const PointSet<double>& centers,
+                        vector<int>& seams) {
+    int c = cell_order.size();
+    vector<int> tour;
+    tour.reserve(points.size() + 1);
+    
+    for (int idx = 0; idx < c; idx++) {
+        const vector<int>& cycle = cycles[cell_order[idx]];
+        int m = cycle.size();
+        // 이전 끝점과 다음 셀 중심 좌표 (첫 셀은 마지막 셀 중심에서, 마지막 셀은 투어 시작점으로)
+        double prev_x, prev_y, next_x, next_y;
+        if (idx == 0) {
+            prev_x = centers.x(cell_order[c - 1]);
+            prev_y = centers.y(cell_order[c - 1]);
+        } else {
+            prev_x = points.x(tour.back());
+            prev_y = points.y(tour.back());
+        }
+        if (idx == c - 1) {
+            int first = tour.empty() ? cycle[0] : tour[0];
+            next_x = points.x(first);
+            next_y = points.y(first);
+        } else {
+            next_x = centers.x(cell_order[idx + 1]);
+            next_y = centers.y(cell_order[idx + 1]);
+        }
+        if (idx > 0) {
+            seams.push_back(tour.size());
+        }
+        
+        int best_cut = 0;
+        bool best_reverse = false;
+        double best_cost = INFINITY;
+        for (int i = 0; i < m; i++) {
+            int a = cycle[i];
+            int b = cycle[(i + 1) % m];
+            double cut = points.distance(a, b);
+            double forward = points.distanceTo(b, prev_x, prev_y) + points.distanceTo(a, next_x, next_y) - cut;   // b ... a
+            double backward = points.distanceTo(a, prev_x, prev_y) + points.distanceTo(b, next_x, next_y) - cut;  // a ... b
+            if (forward < best_cost) {
+                best_cost = forward;
+                best_cut = i;
+                best_reverse = false;
+            }
+            if (backward < best_cost) {
+                best_cost = backward;
+                best_cut = i;
+                best_reverse = true;
+            }
+        }
+        
+        for (int step = 0; step < m; step++) {
+            int pos = best_reverse ? (best_cut - step + m) % m : (best_cut + 1 + step) % m;
+            tour.push_back(cycle[pos]);
+        }
+    }
+    
+    return tour;
+}
+
+// 열린 투어의 [lo, hi] 위치 구간 안에서만 2-opt와 Or-opt(1~3개 점 이동)를 적용 (구간 밖 간선은 그대로)
+// 개선이 있었으면 true
+template <typename T>
+bool improveWindow(vector<int>& tour, const PointSet<T>& points, int lo, int hi) {
+    const double eps = 1e-9;
+    bool improved = false;
+    
+    // 2-opt: 간선 (i, i+1), (j, j+1)을 (i, j), (i+1, j+1)로 교체
+    for (int i = lo; i <= hi - 2; i++) {
+        for (int j = i + 2; j <= hi - 1; j++) {
+            int a = tour[i];
+            int b = tour[i + 1];
+            int c = tour[j];
+            int d = tour[j + 1];
+            if (points.distance(a, c) + points.distance(b, d) <
+                points.distance(a, b) + points.distance(c, d) - eps) {
+                reverse(tour.begin() + i + 1, tour.begin() + j + 1);
+                improved = true;
+            }
+        }
+    }
+    
+    // Or-opt: 연속된 len개 점을 구간 안의 다른 간선 사이로 이동 (뒤집기 포함)
+    for (int len = 1; len <= 3; len++) {
+        for (int s = lo + 1; s + len <= hi; s++) {
+            int prev = tour[s - 1];
+            int first = tour[s];
+            int last = tour[s + len - 1];
+            int after = tour[s + len];
+            double removeGain = points.distance(prev, first) + points.distance(last, after) -
+                                points.distance(prev, after);
+            
+            int best_j = -1;
+            bool best_reverse = false;
+            double best_gain = eps;
+            for (int j = lo; j <= hi - 1; j++) {
+                if (j >= s - 1 && j <= s + len - 1) continue;
+                int u = tour[j];
+                int v = tour[j + 1];
+                double edge = points.distance(u, v);
+                double forward = removeGain - (points.distance(u, first) + points.distance(last, v) - edge);
+                double backward = removeGain - (points.distance(u, last) + points.distance(first, v) - edge);
+                if (forward > best_gain) {
+                    best_gain = forward;
+                    best_j = j;
+                    best_reverse = false;
+                }
+                if (backward > best_gain) {
+                    best_gain = backward;
+                    best_j = j;
+                    best_reverse = true;
+                }
+            }
+            if (best_j == -1) continue;
+            
+            // 구간 [s, s+len)을 간선 (best_j, best_j+1) 사이로 회전 이동
+            int seg_begin;
+            if (best_j > s) {
+                rotate(tour.begin() + s, tour.begin() + s + len, tour.begin() + best_j + 1);
+                seg_begin = best_j + 1 - len;
+            } else {
+                rotate(tour.begin() + best_j + 1, tour.begin() + s, tour.begin() + s + len);
+                seg_begin = best_j + 1;
+            }
+            if (best_reverse) {
+                reverse(tour.begin() + seg_begin, tour.begin() + seg_begin + len);
+            }
+            improved = true;
+        }
+    }
+    
+    return improved;
+}
+
+// 분할 후 이어붙이기: 점 집합을 셀로 나눠 스레드 풀에서 셀마다 Phase 1~4를 실행하고,
+// 셀 중심점 투어 순서로 셀 투어를 이어붙인 뒤 이음매 주변만 2-opt/Or-opt로 보정
+// k <= 0이면 셀 크기에 맞춰 defaultCandidateK 사용
+template <typename T>
+vector<int> spatialPartitionPoints(const PointSet<T>& points, int cell_size, int threads, int k,
+                                   PartitionStats& stats) {
+    int n = points.size();
+    
+    stats.cell_size = cell_size;
+    BenchmarkTimer stepTimer;
+    
+    // 1. 셀 분할과 셀 방문 순서 (셀 중심점들의 투어)
+    stepTimer.start();
+    vector<int> ids(n);
+    for (int i = 0; i < n; i++) ids[i] = i;
+    vector<pair<int, int>> cells;
+    splitIntoCells(points, ids, 0, n, cell_size, cells);
+    int c = cells.size();
+    stats.cells = c;
+    
+    PointSet<double> centers;
+    vector<int> cell_ids(c);
+    for (int cell = 0; cell < c; cell++) {
+        double sx = 0, sy = 0;
+        for (int i = cells[cell].first; i < cells[cell].second; i++) {
+            sx += points.x(ids[i]);
+            sy += points.y(ids[i]);
+        }
+        int size = cells[cell].second - cells[cell].first;
+        centers.push_back(sx / size, sy / size);
+        cell_ids[cell] = cell;
+    }
+    
+    logPhases = false;
+    vector<int> cell_order = solveCell(centers, cell_ids.data(), c, 0);
+    stepTimer.stop();
+    stats.partition_time_ms = stepTimer.getMilliseconds();
+    cout << "Partitioned " << n << " nodes into " << c << " cells of at most " << cell_size
+         << " nodes" << endl;
+    
+    // 2. 셀 병렬 풀이: 작업 스레드가 다음 셀 번호를 가져가며 실행
+    threads = max(1, min(threads, c));
+    stats.threads = threads;
+    vector<vector<int>> cycles(c);
+    vector<double> cell_times(c, 0);
+    
+    stepTimer.start();
+    parallelFor(c, threads, [&](int cell) {
+        logPhases = false;
+        BenchmarkTimer cellTimer;
+        cellTimer.start();
+        cycles[cell] = solveCell(points, ids.data() + cells[cell].first,
+                                 cells[cell].second - cells[cell].first, k);
+        cellTimer.stop();
+        cell_times[cell] = cellTimer.getMilliseconds();
+    });
+    stepTimer.stop();
+    logPhases = true;
+    stats.solve_time_ms = stepTimer.getMilliseconds();
+    stats.max_cell_time_ms = *max_element(cell_times.begin(), cell_times.end());
+    cout << "Solved " << c << " cells with " << threads << " threads in " << stats.solve_time_ms
+         << " ms (slowest cell " << stats.max_cell_time_ms << " ms)" << endl;
+    
+    // 3. 이어붙이기: 셀이 하나면 그 투어를 그대로 사용
+    stepTimer.start();
+    vector<int> seams;
+    vector<int> tour = (c == 1) ? cycles[0] : stitchCells(points, cycles, cell_order, centers, seams);
+    
+    // 닫는 간선(마지막 셀 -> 첫 셀)도 구간 안에 오도록 첫 셀 가운데에서 시작하게 회전
+    int shift = (c == 1) ? 0 : (int)cycles[cell_order[0]].size() / 2;
+    rotate(tour.begin(), tour.begin() + shift, tour.end());
+    for (int& seam : seams) {
+        seam -= shift;
+    }
+    if (c > 1) {
+        seams.push_back(n - shift);
+    }
+    tour.push_back(tour[0]);
+    stepTimer.stop();
+    stats.stitch_time_ms = stepTimer.getMilliseconds();
+    stats.stitched_length = calculateTourLength(tour, points);
+    
+    // 4. 이음매 보정 (열린 경로 [0, n-1] 위에서, 닫는 간선은 건드리지 않음)
+    stepTimer.start();
+    for (int seam : seams) {
+        int lo = max(0, seam - SEAM_WINDOW);
+        int hi = min(n - 1, seam + SEAM_WINDOW);
+        for (int pass = 0; pass < 10 && improveWindow(tour, points, lo, hi); pass++) {
+        }
+    }
+    stepTimer.stop();
+    stats.repair_time_ms = stepTimer.getMilliseconds();
+    stats.final_length = calculateTourLength(tour, points);
+    cout << "Stitched tour length: " << stats.stitched_length << ", after seam repair: "
+         << stats.final_length << endl;
+    
+    return tour;
+}
+
+vector<int> spatialPartitionTSP(const vector<pair<double, double>>& coordinates, int cell_size,
+                                int threads, int k, PartitionStats& stats,
+                                CoordinateMode mode = COORDS_DOUBLE) {
+    switch (mode) {
+        case COORDS_FLOAT:
+            return spatialPartitionPoints(PointSet<float>(coordinates), cell_size, threads, k, stats);
+        case COORDS_INT32:
+            return spatialPartitionPoints(PointSet<int32_t>(coordinates), cell_size, threads, k, stats);
+        default:
+            return spatialPartitionPoints(PointSet<double>(coordinates), cell_size, threads, k, stats);
+    }
+}
+
 // 기존 spatialTSPWithCoords 함수 (호환성 유지)
-vector<int> spatialTSPWithCoords(const vector<pair<double, double>>& coordinates) {
+vector<int> spatialTSPWithCoords(const vector<pair<double, double>>& coordinates, int k = 0,
+                                 int starts = 1, int threads = 1, CoordinateMode mode = COORDS_DOUBLE) {
     SpatialStats dummy_stats;
-    return spatialTSPWithCoordsAnalysis(coordinates, dummy_stats);
+    return spatialTSPWithCoordsAnalysis(coordinates, dummy_stats, false, k, starts, threads, mode);
+}
+
+// 좌표 저장 방식과 정확성 검사 결과 출력 (JSON "coordinates" 객체 반환)
+JsonObject reportCoordinateCheck(const vector<pair<double, double>>& coordinates, CoordinateMode mode,
+                                 MetricType metric, const vector<int>& tour) {
+    CoordinateCheck check = checkCoordinates(coordinates, mode, tour, metric);
+    size_t point_bytes = check.bytes_per_point * coordinates.size();
+    cout << "Coordinates: " << coordinateModeName(mode) << " (" << check.bytes_per_point
+         << " bytes/point, " << point_bytes << " bytes)" << endl;
+    if (check.rounded_coordinates > 0) {
+        cout << "Rounded coordinates: " << check.rounded_coordinates
+             << " (max error " << check.max_coordinate_error << ")" << endl;
+        cout << "Tour edges with a different " << metricName(metric) << " length: "
+             << check.edge_mismatches << endl;
+    }
+    
+    JsonObject result;
+    result.add("mode", coordinateModeName(mode))
+          .add("bytes_per_point", check.bytes_per_point)
+          .add("point_bytes", point_bytes)
+          .add("rounded_coordinates", check.rounded_coordinates)
+          .add("max_coordinate_error", check.max_coordinate_error)
+          .add("edge_mismatches", check.edge_mismatches)
+          .add("exact", check.exact);
+    return result;
 }
 
 int main(int argc, char* argv[]) {
-    if (argc < 3) {
-        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file] [analysis_csv]" << endl;
+    SolverArgs args = parseSolverArgs(argc, argv);
+    if (args.positional.size() < 2) {
+        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [csv_file] [analysis_csv] [--profile] [--json] [--k=N] [--k-sweep=K1,K2,...] [--partition[=CELL_SIZE]] [--starts=M] [--threads=N] [--coords=MODE]" << endl;
+        cout << "  --k=N              candidate neighbours per node (default: min(30, max(10, n/10)))" << endl;
+        cout << "  --k-sweep=K1,K2,.. solve once per K, sharing one kNN query at the largest K;" << endl;
+        cout << "                     the output file receives the shortest tour" << endl;
+        cout << "  --partition[=N]    split into cells of at most N nodes (default " << DEFAULT_PARTITION_CELL_SIZE << "), solve" << endl;
+        cout << "                     the cells in parallel and stitch them with seam repair" << endl;
+        cout << "  --starts=M         run phases 2-4 from M spread start nodes and keep the best tour" << endl;
+        cout << "  --threads=N        worker threads for --partition and --starts (default: hardware threads)" << endl;
+        cout << "  --coords=MODE      coordinate storage: auto (int32 for integer files, else double)," << endl;
+        cout << "                     double, float or int (default: auto)" << endl;
         return 1;
     }
     
-    string tsp_filename = argv[1];
-    string output_filename = argv[2];
-    string csv_filename = (argc > 3) ? argv[3] : "";
-    string analysis_csv = (argc > 4) ? argv[4] : "";
+    string tsp_filename = args.positional[0];
+    string output_filename = args.positional[1];
+    string csv_filename = (args.positional.size() > 2) ? args.positional[2] : "";
+    string analysis_csv = (args.positional.size() > 3) ? args.positional[3] : "";
+    bool profile = args.hasOption("profile");
+    
+    // --k=N: 후보 이웃 수 (scripts/tune_k.py가 데이터셋별로 튜닝한 값을 전달)
+    int k = 0;
+    if (args.hasOption("k")) {
+        string k_option = args.getOption("k");
+        char* end = nullptr;
+        long value = strtol(k_option.c_str(), &end, 10);
+        if (k_option.empty() || *end != '\0' || value < 1 || value > 1000) {
+            cout << "Invalid --k value: " << k_option << " (expected an integer in 1..1000)" << endl;
+            return 1;
+        }
+        k = (int)value;
+    }
+    
+    // --k-sweep=K1,K2,...: K 스윕 모드
+    vector<int> sweep_k_values;
+    if (args.hasOption("k-sweep")) {
+        stringstream k_list(args.getOption("k-sweep"));
+        string item;
+        while (getline(k_list, item, ',')) {
+            char* end = nullptr;
+            long value = strtol(item.c_str(), &end, 10);
+            if (item.empty() || *end != '\0' || value < 1 || value > 1000) {
+                cout << "Invalid --k-sweep value: " << item << " (expected integers in 1..1000)" << endl;
+                return 1;
+            }
+            sweep_k_values.push_back((int)value);
+        }
+        if (sweep_k_values.empty()) {
+            cout << "--k-sweep needs at least one K value" << endl;
+            return 1;
+        }
+    }
+    
+    // --partition[=CELL_SIZE]: 분할 후 이어붙이기 모드
+    int cell_size = 0;
+    if (args.hasOption("partition")) {
+        string cell_option = args.getOption("partition");
+        cell_size = DEFAULT_PARTITION_CELL_SIZE;
+        if (!cell_option.empty()) {
+            char* end = nullptr;
+            long value = strtol(cell_option.c_str(), &end, 10);
+            if (*end != '\0' || value < 1 || value > 100000000) {
+                cout << "Invalid --partition cell size: " << cell_option << " (expected a positive integer)" << endl;
+                return 1;
+            }
+            cell_size = (int)value;
+        }
+        if (!sweep_k_values.empty()) {
+            cout << "--partition cannot be combined with --k-sweep" << endl;
+            return 1;
+        }
+    }
+    // --starts=M: 다중 시작 시작점 수 (분석/일반 모드)
+    int starts = 1;
+    if (args.hasOption("starts")) {
+        string starts_option = args.getOption("starts");
+        char* end = nullptr;
+        long value = strtol(starts_option.c_str(), &end, 10);
+        if (starts_option.empty() || *end != '\0' || value < 1 || value > 100000) {
+            cout << "Invalid --starts value: " << starts_option << " (expected an integer in 1..100000)" << endl;
+            return 1;
+        }
+        if (!sweep_k_values.empty() || cell_size > 0) {
+            cout << "--starts cannot be combined with --k-sweep or --partition" << endl;
+            return 1;
+        }
+        starts = (int)value;
+    }
+    // --threads=N: 셀 풀이/다중 시작 스레드 수
+    int threads = defaultThreadCount();
+    if (args.hasOption("threads")) {
+        string threads_option = args.getOption("threads");
+        char* end = nullptr;
+        long value = strtol(threads_option.c_str(), &end, 10);
+        if (threads_option.empty() || *end != '\0' || value < 1 || value > 1024) {
+            cout << "Invalid --threads value: " << threads_option << " (expected an integer in 1..1024)" << endl;
+            return 1;
+        }
+        threads = (int)value;
+    }
+    
+    // --json: stdout에 결과 레코드 한 줄만 출력
+    JsonOutputMode json(args.hasOption("json"));
+    JsonObject record;
+    record.add("algorithm", "Spatial-Algorithm")
+          .add("dataset", getDatasetName(tsp_filename))
+          .add("file", tsp_filename);
     
     try {
         // I/O 시간 제외하고 순수 계산 시간만 측정
         vector<pair<double, double>> coordinates = parseCoordinates(tsp_filename);
         
+        // --coords=MODE: 좌표 저장 방식 (auto는 결과가 기존과 같은 방식만 고름)
+        CoordinateMode coord_mode;
+        string coord_error;
+        if (!parseCoordinateMode(args.getOption("coords", "auto"), coordinates, coord_mode, coord_error)) {
+            throw invalid_argument(coord_error);
+        }
+        
+        // EDGE_WEIGHT_TYPE: 각 Phase는 좌표의 유클리드 거리로 탐색하고, 모든 모드의 투어 길이는 scorer로 계산
+        // (EUC_2D, CEIL_2D, ATT는 유클리드 거리의 단조 함수라 후보 이웃 순서가 같음)
+        TourScorer scorer(tsp_filename, coordinates);
+        cout << "Edge weight type: " << scorer.getName() << endl;
+        record.add("edge_weight_type", scorer.getName());
+        
+        if (!sweep_k_values.empty()) {
+            SpatialStats stats;
+            vector<int> tour;
+            vector<KSweepResult> results = spatialKSweep(coordinates, sweep_k_values, stats, tour, scorer, coord_mode);
+            saveTourToFile(tour, coordinates, output_filename, (int)stats.final_distance);
+            
+            double total_time_ms = stats.phase1_time_ms;
+            int best_k = 0;  // 최단 거리를 낸 가장 작은 K
+            JsonArray sweep_json;
+            for (const KSweepResult& result : results) {
+                total_time_ms += result.time_ms;
+                if (best_k == 0 && result.distance == (int)stats.final_distance) {
+                    best_k = result.k;
+                }
+                JsonObject entry;
+                entry.add("k", result.k)
+                     .add("distance", result.distance)
+                     .add("time_ms", result.time_ms)
+                     .add("phase2_time_ms", result.phase2_time_ms)
+                     .add("phase3_time_ms", result.phase3_time_ms)
+                     .add("phase4_time_ms", result.phase4_time_ms)
+                     .add("winner", result.winner);
+                sweep_json.add(entry);
+            }
+            
+            cout << "Algorithm: Spatial-Algorithm (K sweep)" << endl;
+            cout << "Shared phase 1 (k=" << stats.k << "): " << stats.phase1_time_ms << " ms" << endl;
+            cout << "Best K: " << best_k << " (distance " << (int)stats.final_distance << ")" << endl;
+            JsonObject coordinates_json = reportCoordinateCheck(coordinates, coord_mode, scorer.getMetricType(), tour);
+            
+            JsonObject parameters;
+            parameters.add("max_k", stats.k)
+                      .add("coords", coordinateModeName(coord_mode));
+            JsonObject phase1;
+            phase1.add("time_ms", stats.phase1_time_ms)
+                  .add("kdtree_bytes", stats.kdtree_bytes)
+                  .add("candidate_bytes", stats.candidate_bytes);
+            record.add("mode", "k_sweep")
+                  .add("n", (int)coordinates.size())
+                  .add("parameters", parameters)
+                  .add("status", "SUCCESS")
+                  .add("time_ms", total_time_ms)
+                  .add("distance", (int)stats.final_distance)
+                  .add("best_k", best_k)
+                  .add("phase1", phase1)
+                  .add("coordinates", coordinates_json)
+                  .add("k_sweep", sweep_json);
+            json.emit(record);
+            return 0;
+        }
+        
+        if (cell_size > 0) {
+            BenchmarkTimer timer;
+            MemoryTracker memory;
+            timer.start();
+            memory.start();
+            PartitionStats stats;
+            vector<int> tour = spatialPartitionTSP(coordinates, cell_size, threads, k, stats, coord_mode);
+            memory.stop();
+            timer.stop();
+            
+            int total_distance = scorer.tourLength(tour);
+            cout << "Algorithm: Spatial-Algorithm (partition)" << endl;
+            cout << "Dataset: " << tsp_filename << endl;
+            cout << "Nodes: " << coordinates.size() << endl;
+            cout << "Execution time: " << timer.getMilliseconds() << " ms" << endl;
+            cout << "Tour distance: " << total_distance << endl;
+            cout << "Allocated during solve: " << memory.getAllocatedBytes() << " bytes" << endl;
+            cout << "Peak RSS: " << getPeakRSSKB() << " KB" << endl;
+            JsonObject coordinates_json = reportCoordinateCheck(coordinates, coord_mode, scorer.getMetricType(), tour);
+            
+            saveTourToFile(tour, coordinates, output_filename, total_distance);
+            if (!csv_filename.empty()) {
+                saveBenchmarkResult(csv_filename, "Spatial-Algorithm-Partition", getDatasetName(tsp_filename),
+                                  coordinates.size(), timer.getMilliseconds(), total_distance,
+                                  getPeakRSSKB(), scorer.getGraphBytes(), memory.getAllocatedBytes());
+            }
+            
+            JsonObject parameters;
+            parameters.add("k", k)
+                      .add("cell_size", stats.cell_size)
+                      .add("threads", stats.threads)
+                      .add("coords", coordinateModeName(coord_mode));
+            JsonObject partition;
+            partition.add("cells", stats.cells)
+                     .add("partition_time_ms", stats.partition_time_ms)
+                     .add("solve_time_ms", stats.solve_time_ms)
+                     .add("max_cell_time_ms", stats.max_cell_time_ms)
+                     .add("stitch_time_ms", stats.stitch_time_ms)
+                     .add("repair_time_ms", stats.repair_time_ms)
+                     .add("stitched_length", stats.stitched_length)
+                     .add("final_length", stats.final_length);
+            JsonObject memory_json;
+            memory_json.add("peak_rss_kb", getPeakRSSKB())
+                       .add("allocated_bytes", memory.getAllocatedBytes());
+            record.add("mode", "partition")
+                  .add("n", (int)coordinates.size())
+                  .add("parameters", parameters)
+                  .add("status", "SUCCESS")
+                  .add("time_ms", timer.getMilliseconds())
+                  .add("distance", total_distance)
+                  .add("partition", partition)
+                  .add("coordinates", coordinates_json)
+                  .add("memory", memory_json);
+            json.emit(record);
+            return 0;
+        }
+        
         BenchmarkTimer timer;
+        MemoryTracker memory;
         timer.start();
+        memory.start();
         
         // 분석 모드인지 확인
         SpatialStats stats;
         vector<int> tour;
         
-        if (!analysis_csv.empty()) {
+        if (!analysis_csv.empty() || profile || json.isEnabled()) {
             // 분석 모드
             string dataset_name = tsp_filename.substr(tsp_filename.find_last_of("/") + 1);
             dataset_name = dataset_name.substr(0, dataset_name.find_last_of("."));
             stats.dataset_name = dataset_name;
             stats.nodes = coordinates.size();
             
-            tour = spatialTSPWithCoordsAnalysis(coordinates, stats);
+            tour = spatialTSPWithCoordsAnalysis(coordinates, stats, profile, k, starts, threads, coord_mode);
         } else {
             // 일반 모드
-            tour = spatialTSPWithCoords(coordinates);
+            tour = spatialTSPWithCoords(coordinates, k, starts, threads, coord_mode);
         }
         
+        memory.stop();
         timer.stop();
         
-        // 결과 저장을 위해 그래프도 생성
-        CompleteGraph graph = parseTSP(tsp_filename);
-        
-        // 투어 길이 계산
-        int total_distance = 0;
-        for (int i = 0; i < tour.size() - 1; i++) {
-            total_distance += graph.getCost(tour[i], tour[i + 1]);
-        }
+        // 투어 길이 계산 (EXPLICIT 파일만 완전 그래프 사용, 나머지는 좌표의 TSPLIB 거리로 O(n) 계산)
+        int total_distance = scorer.tourLength(tour);
+        size_t graph_bytes = scorer.getGraphBytes();
         
         cout << "Algorithm: Spatial-Algorithm" << endl;
         cout << "Dataset: " << tsp_filename << endl;
         cout << "Nodes: " << coordinates.size() << endl;
         cout << "Execution time: " << timer.getMilliseconds() << " ms" << endl;
         cout << "Tour distance: " << total_distance << endl;
+        cout << "Allocated during solve: " << memory.getAllocatedBytes() << " bytes" << endl;
+        cout << "Peak RSS: " << getPeakRSSKB() << " KB" << endl;
+        JsonObject coordinates_json = reportCoordinateCheck(coordinates, coord_mode, scorer.getMetricType(), tour);
         
         // 결과 저장
         saveTourToFile(tour, coordinates, output_filename, total_distance);
@@ -505,7 +1329,8 @@ int main(int argc, char* argv[]) {
             string dataset_name = tsp_filename.substr(tsp_filename.find_last_of("/") + 1);
             dataset_name = dataset_name.substr(0, dataset_name.find_last_of("."));
             saveBenchmarkResult(csv_filename, "Spatial-Algorithm", dataset_name, 
-                              coordinates.size(), timer.getMilliseconds(), total_distance);
+                              coordinates.size(), timer.getMilliseconds(), total_distance,
+                              getPeakRSSKB(), graph_bytes, memory.getAllocatedBytes());
         }
         
         // 분석 결과 저장
@@ -519,11 +1344,26 @@ int main(int argc, char* argv[]) {
                 initSpatialStatsCSV(analysis_csv);
             }
             
+            stats.peak_rss_kb = getPeakRSSKB();
             saveSpatialStats(analysis_csv, stats);
         }
         
+        stats.peak_rss_kb = getPeakRSSKB();
+        JsonObject memory_json;
+        memory_json.add("graph_bytes", graph_bytes)
+                   .add("allocated_bytes", memory.getAllocatedBytes());
+        record.add("n", (int)coordinates.size())
+              .add("status", "SUCCESS")
+              .add("time_ms", timer.getMilliseconds())
+              .add("distance", total_distance)
+              .add("coordinates", coordinates_json);
+        addSpatialStatsToJson(record, stats, memory_json, profile);
+        json.emit(record);
+        
     } catch (const exception& e) {
         cout << "Error: " << e.what() << endl;
+        record.add("status", "ERROR").add("error", e.what());
+        json.emit(record);
         return 1;
     }
     
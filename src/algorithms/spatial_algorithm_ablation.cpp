@@ -1,10 +1,18 @@
 #include "../../include/tsp_common.h"
 #include "../../include/heap_utils.h"
+#include "../../include/mst_utils.h"
+#include "../../include/candidate_graph.h"
+#include "../../include/multi_start.h"
 #include "../../include/benchmark_utils.h"
 #include "../../include/ablation_study.h"
+#include "../../include/memory_utils.h"
+#include "../../include/json_output.h"
 #include <algorithm>
+#include <functional>
+#include <map>
 #include <set>
 #include <ctime>
+#include <random>
 
 // 2D 점 구조체
 struct Point2D {
@@ -35,6 +43,7 @@ struct KDNode {
 class KDTree {
 private:
     KDNode* root;
+    size_t node_count;
     
     KDNode* buildTree(vector<Point2D>& points, int depth) {
         if (points.empty()) return nullptr;
@@ -48,6 +57,7 @@ private:
         
         int median = points.size() / 2;
         KDNode* node = new KDNode(points[median], depth);
+        node_count++;
         
         vector<Point2D> leftPoints(points.begin(), points.begin() + median);
         vector<Point2D> rightPoints(points.begin() + median + 1, points.end());
@@ -76,74 +86,141 @@ private:
         
         knnSearch(first, target, k, nearest, heap_size);
         
-        // 다른 쪽도 확인할 필요가 있는지 판단
-        if (heap_size < k || abs(targetAxis - nodeAxis) < nearest[0].dist) {
+        // 다른 쪽도 확인할 필요가 있는지 판단 (경계 거리와 같은 동률 점도 찾도록 <=)
+        if (heap_size < k || abs(targetAxis - nodeAxis) <= nearest[0].dist) {
             knnSearch(second, target, k, nearest, heap_size);
         }
     }
     
+    void freeTree(KDNode* node) {
+        if (!node) return;
+        freeTree(node->left);
+        freeTree(node->right);
+        delete node;
+    }
+    
 public:
-    KDTree(vector<Point2D> points) {
+    KDTree(vector<Point2D> points) : root(nullptr), node_count(0) {
         root = buildTree(points, 0);
     }
     
-    vector<int> findKNN(const Point2D& target, int k) {
-        DistNode* nearest = new DistNode[k];
+    ~KDTree() {
+        freeTree(root);
+    }
+    
+    // KD-Tree 노드 메모리
+    size_t getMemoryBytes() const {
+        return node_count * sizeof(KDNode);
+    }
+    
+    // 호출자가 준 버퍼(크기 k 이상)에 k-최근접 이웃을 (거리, id) 순으로 채우고 개수를 반환
+    int findKNN(const Point2D& target, int k, DistNode* nearest) {
         int heap_size = 0;
         
         knnSearch(root, target, k, nearest, heap_size);
         
-        vector<int> result;
-        for (int i = 0; i < heap_size; i++) {
-            result.push_back(nearest[i].id);
-        }
-        
-        delete[] nearest;
-        return result;
+        sort(nearest, nearest + heap_size, distNodeLess);
+        return heap_size;
     }
 };
 
-// Brute-force KNN 구현
-vector<int> bruteForceFindKNN(const vector<Point2D>& points, int targetId, int k) {
-    vector<pair<double, int>> distances;
-    
-    for (int i = 0; i < points.size(); i++) {
-        if (i != targetId) {
-            double dist = points[targetId].distance(points[i]);
-            distances.push_back({dist, i});
-        }
+const int BF_QUERY_BLOCK = 64;   // 작업 하나가 맡는 질의 점 수
+const int BF_POINT_TILE = 2048;  // 질의 블록이 함께 훑는 후보 점 구간 (캐시에 머무는 크기)
+
+// Brute-force KNN (블록 단위): queries[0..q)마다 자기 자신을 제외한 모든 점 중 (거리, id) 순으로 가장 가까운 k개를
+// nearest[i * k ..]에 정렬해 넣고 개수를 counts[i]에 기록
+// 후보 점을 타일로 나눠 타일 하나를 블록의 모든 질의가 훑은 뒤 다음 타일로 넘어가고,
+// 질의마다 크기 k의 최대 힙으로 부분 선택하므로 전체 거리 배열을 만들거나 정렬하지 않음 (O(n log k))
+void bruteForceKNNBlock(const vector<Point2D>& points, const int* queries, int q, int k,
+                        DistNode* nearest, int* counts) {
+    int n = points.size();
+    for (int i = 0; i < q; i++) {
+        counts[i] = 0;
     }
     
-    // 거리 기준 정렬
-    sort(distances.begin(), distances.end());
-    
-    vector<int> result;
-    for (int i = 0; i < min(k, (int)distances.size()); i++) {
-        result.push_back(distances[i].second);
+    for (int tile = 0; tile < n; tile += BF_POINT_TILE) {
+        int tile_end = min(n, tile + BF_POINT_TILE);
+        for (int i = 0; i < q; i++) {
+            const Point2D& target = points[queries[i]];
+            DistNode* heap = nearest + (size_t)i * k;
+            int& heap_size = counts[i];
+            for (int j = tile; j < tile_end; j++) {
+                if (j == queries[i]) continue;
+                DistNode node(target.distance(points[j]), j);
+                if (heap_size < k || distNodeLess(node, heap[0])) {
+                    insert_max_heap(heap, heap_size, k, node);
+                }
+            }
+        }
     }
     
-    return result;
+    for (int i = 0; i < q; i++) {
+        DistNode* heap = nearest + (size_t)i * k;
+        sort(heap, heap + counts[i], distNodeLess);
+    }
+}
+
+// 질의 점들의 brute-force KNN을 threads개 스레드로 계산 (BF_QUERY_BLOCK개씩 작업 분배)
+// nearest는 queries.size() * k, counts는 queries.size() 크기로 맞춰짐
+void bruteForceKNN(const vector<Point2D>& points, const vector<int>& queries, int k, int threads,
+                   vector<DistNode>& nearest, vector<int>& counts) {
+    int q = queries.size();
+    nearest.assign((size_t)q * k, DistNode());
+    counts.assign(q, 0);
+    int blocks = (q + BF_QUERY_BLOCK - 1) / BF_QUERY_BLOCK;
+    parallelFor(blocks, threads, [&](int block) {
+        int begin = block * BF_QUERY_BLOCK;
+        int size = min(BF_QUERY_BLOCK, q - begin);
+        bruteForceKNNBlock(points, queries.data() + begin, size, k,
+                           nearest.data() + (size_t)begin * k, counts.data() + begin);
+    });
+}
+
+// 질의 점별 brute-force 이웃 중 reference 후보 목록에도 있는 비율 (정확한 KNN이면 1)
+double candidateAgreement(const CandidateGraph& reference, const vector<int>& queries, int k,
+                          const vector<DistNode>& nearest, const vector<int>& counts) {
+    long long matched = 0;
+    long long total = 0;
+    for (size_t i = 0; i < queries.size(); i++) {
+        int u = queries[i];
+        for (int j = 0; j < counts[i]; j++) {
+            int v = nearest[i * k + j].id;
+            for (int e = reference.begin(u); e < reference.end(u); e++) {
+                if (reference.neighbors[e] == v) {
+                    matched++;
+                    break;
+                }
+            }
+        }
+        total += counts[i];
+    }
+    return total > 0 ? (double)matched / total : 1.0;
 }
 
 // Phase 1: KD-Tree를 사용한 Candidate Edge Filtering
-vector<vector<int>> buildCandidateEdgesKDTree(const vector<Point2D>& points, int k, double& time_ms) {
+CandidateGraph buildCandidateEdgesKDTree(const vector<Point2D>& points, int k, double& time_ms,
+                                         size_t& kdtree_bytes) {
     BenchmarkTimer timer;
     timer.start();
     
     vector<Point2D> pointsCopy = points;
     KDTree kdTree(pointsCopy);
+    kdtree_bytes = kdTree.getMemoryBytes();
     
     int n = points.size();
-    vector<vector<int>> candidates(n);
+    CandidateGraph candidates;
+    candidates.startBuild(n, (size_t)n * k);
+    vector<DistNode> nearest(k + 1);  // 질의마다 재사용하는 kNN 버퍼
     
     for (int i = 0; i < n; i++) {
-        vector<int> neighbors = kdTree.findKNN(points[i], k + 1); // +1 because it includes itself
+        int found = kdTree.findKNN(points[i], k + 1, nearest.data()); // +1 because it includes itself
         
-        for (int neighbor : neighbors) {
-            if (neighbor != i) {
-                candidates[i].push_back(neighbor);
+        for (int j = 0; j < found; j++) {
+            if (nearest[j].id != i) {
+                candidates.addEdge(nearest[j].id, nearest[j].dist);
             }
         }
+        candidates.finishNode();
     }
     
     timer.stop();
@@ -152,37 +229,72 @@ vector<vector<int>> buildCandidateEdgesKDTree(const vector<Point2D>& points, int
     return candidates;
 }
 
-// Phase 1: Brute-Force를 사용한 Candidate Edge Filtering
-vector<vector<int>> buildCandidateEdgesBruteForce(const vector<Point2D>& points, int k, double& time_ms) {
+// Phase 1: Brute-Force를 사용한 Candidate Edge Filtering (블록 단위, threads개 스레드)
+// agreement에는 KD-tree 후보 목록과의 일치율을 기록 (측정 시간에서 제외)
+CandidateGraph buildCandidateEdgesBruteForce(const vector<Point2D>& points, int k, int threads,
+                                             const CandidateGraph& kdCandidates, double& time_ms,
+                                             double& agreement) {
     BenchmarkTimer timer;
     timer.start();
     
     int n = points.size();
-    vector<vector<int>> candidates(n);
-    
+    vector<int> queries(n);
+    for (int i = 0; i < n; i++) queries[i] = i;
+    vector<DistNode> nearest;
+    vector<int> counts;
+    bruteForceKNN(points, queries, k, threads, nearest, counts);
+    
+    CandidateGraph candidates;
+    candidates.startBuild(n, (size_t)n * k);
     for (int i = 0; i < n; i++) {
-        vector<int> neighbors = bruteForceFindKNN(points, i, k);
-        candidates[i] = neighbors;
+        for (int j = 0; j < counts[i]; j++) {
+            candidates.addEdge(nearest[(size_t)i * k + j].id, nearest[(size_t)i * k + j].dist);
+        }
+        candidates.finishNode();
     }
     
     timer.stop();
     time_ms = timer.getMilliseconds();
+    agreement = candidateAgreement(kdCandidates, queries, k, nearest, counts);
     
     return candidates;
 }
 
-// 후보 간선 개수 계산
-double countCandidateEdges(const vector<vector<int>>& candidates) {
-    double total = 0;
-    for (const auto& candidateList : candidates) {
-        total += candidateList.size();
+// 표본 모드: 무작위로 고른 sample개 질의 점만 brute-force로 계산해 전체 시간(sample 시간 × n / sample)과
+// KD-tree 후보 목록과의 일치율을 추정 (표본은 seed로 고정)
+double estimateBruteForceTime(const vector<Point2D>& points, int k, int threads, int sample,
+                              const CandidateGraph& kdCandidates, double& agreement,
+                              unsigned int seed = 0) {
+    int n = points.size();
+    vector<int> ids(n);
+    for (int i = 0; i < n; i++) ids[i] = i;
+    mt19937 rng(seed);
+    for (int i = 0; i < sample; i++) {
+        uniform_int_distribution<int> pick(i, n - 1);
+        swap(ids[i], ids[pick(rng)]);
     }
-    return total / 2.0; // 중복 제거
+    vector<int> queries(ids.begin(), ids.begin() + sample);
+    sort(queries.begin(), queries.end());
+    
+    BenchmarkTimer timer;
+    timer.start();
+    vector<DistNode> nearest;
+    vector<int> counts;
+    bruteForceKNN(points, queries, k, threads, nearest, counts);
+    timer.stop();
+    
+    agreement = candidateAgreement(kdCandidates, queries, k, nearest, counts);
+    return timer.getMilliseconds() * n / sample;
+}
+
+// 후보 간선 개수 계산
+double countCandidateEdges(const CandidateGraph& candidates) {
+    return candidates.edgeCount() / 2.0; // 중복 제거
 }
 
 // Phase 2: Greedy Insertion
 vector<int> greedyInsertion(const vector<Point2D>& points, 
-                           const vector<vector<int>>& candidates) {
+                           const CandidateGraph& candidates) {
     int n = points.size();
     vector<bool> visited(n, false);
     vector<int> tour;
@@ -198,13 +310,11 @@ vector<int> greedyInsertion(const vector<Point2D>& points,
         double minDist = INFINITY;
         
         // 현재 점의 후보 이웃들 중에서 가장 가까운 미방문 점 찾기
-        for (int candidate : candidates[current]) {
-            if (!visited[candidate]) {
-                double dist = points[current].distance(points[candidate]);
-                if (dist < minDist) {
-                    minDist = dist;
-                    next = candidate;
-                }
+        // (후보 목록이 거리순이므로 처음 만나는 미방문 점)
+        for (int e = candidates.begin(current); e < candidates.end(current); e++) {
+            if (!visited[candidates.neighbors[e]]) {
+                next = candidates.neighbors[e];
+                break;
             }
         }
         
@@ -233,79 +343,53 @@ vector<int> greedyInsertion(const vector<Point2D>& points,
 
 // Phase 3: MST-Based Correction
 vector<int> mstBasedTour(const vector<Point2D>& points, 
-                        const vector<vector<int>>& candidates) {
+                        const CandidateGraph& candidates) {
     int n = points.size();
-    vector<vector<pair<int, double>>> mstAdj(n);
     
     // Prim's algorithm로 MST 구축 (candidate edges만 사용)
     vector<bool> inMST(n, false);
     vector<double> key(n, INFINITY);
     vector<int> parent(n, -1);
     
-    PQNode* pq = new PQNode[n];
-    int pq_size = n;
-    
-    // priority 큐 초기화
-    for (int i = 0; i < n; i++) {
-        pq[i] = PQNode(i, INFINITY);
-        key[i] = INFINITY;
-    }
-    
-    pq[0].key = 0;
+    // priority 큐 초기화 (정점 위치 맵으로 decrease-key O(log n))
     key[0] = 0;
+    IndexedMinHeap<PQNode> pq(n);
+    pq.build(key);
     
-    build_min_heap(pq, pq_size);
-    
-    while (pq_size > 0) {
-        PQNode min_node = extract_min(pq, pq_size);
+    while (!pq.empty()) {
+        PQNode min_node = pq.extractMin();
         int u = min_node.vertex;
         
+        // 후보 그래프가 끊어져 있으면 남은 정점을 트리의 가장 가까운 정점에 연결하고 계속
+        // (중단하면 도달하지 못한 정점이 투어에서 빠짐)
         if (min_node.key == INFINITY) {
-            break;
+            for (int t = 0; t < n; t++) {
+                if (inMST[t] && points[u].distance(points[t]) < key[u]) {
+                    key[u] = points[u].distance(points[t]);
+                    parent[u] = t;
+                }
+            }
         }
         
         inMST[u] = true;
         
-        // 후보 이웃들 확인
-        for (int v : candidates[u]) {
+        // 후보 이웃들 확인 (간선 길이는 Phase 1에서 계산한 값 사용)
+        for (int e = candidates.begin(u); e < candidates.end(u); e++) {
+            int v = candidates.neighbors[e];
             if (!inMST[v]) {
-                double weight = points[u].distance(points[v]);
+                double weight = candidates.lengths[e];
                 if (weight < key[v]) {
                     key[v] = weight;
                     parent[v] = u;
-                    decrease_key(pq, pq_size, v, weight);
+                    pq.decreaseKey(v, weight);
                 }
             }
         }
     }
     
-    delete[] pq;
-    
-    // MST 인접 리스트 구성
-    for (int i = 1; i < n; i++) {
-        if (parent[i] != -1) {
-            mstAdj[parent[i]].push_back({i, key[i]});
-            mstAdj[i].push_back({parent[i], key[i]});
-        }
-    }
-    
-    // DFS로 MST traversal
-    vector<int> mstTour;
-    vector<bool> visited(n, false);
-    
-    function<void(int)> dfs = [&](int u) {
-        visited[u] = true;
-        mstTour.push_back(u);
-        
-        for (auto& edge : mstAdj[u]) {
-            int v = edge.first;
-            if (!visited[v]) {
-                dfs(v);
-            }
-        }
-    };
-    
-    dfs(0);
+    // MST 자식 배열(CSR) 구성 후 명시적 스택으로 전위 순회
+    MSTChildArray mstTree = buildMSTChildArray(parent);
+    vector<int> mstTour = mstPreorder(mstTree, 0);
     mstTour.push_back(0); // 시작점으로 돌아가기
     
     return mstTour;
@@ -382,8 +466,136 @@ void selective2optMeasured(vector<int>& tour, const vector<Point2D>& points,
     timeAfter = calculateTourLength(tour, points);
 }
 
+// 단계 결과: 투어, 길이, 측정 시간
+struct PhaseResult {
+    vector<int> tour;
+    double length;
+    double time_ms;
+};
+
+// Ablation 변형 실행기
+// 후보 그래프를 내용 지문으로 등록하고 단계 결과를 (그래프 번호, 단계, 입력 투어, 반복 횟수)별로 캐시해
+// 같은 입력의 단계는 한 번만 계산함 (정확한 kNN이면 KD-tree와 brute-force 후보가 같아 Phase 2~4를 공유)
+class AblationRunner {
+private:
+    const vector<Point2D>& points;
+    vector<const CandidateGraph*> graphs;
+    vector<unsigned long long> hashes;
+    map<string, PhaseResult> phases;  // map의 원소 참조는 삽입 후에도 유효
+    
+    // key 단계를 캐시에서 찾거나 compute로 계산하고, 변형의 시간과 재사용 횟수에 반영
+    const PhaseResult& phase(const string& key, const function<PhaseResult()>& compute,
+                             AblationVariantResult& result) {
+        auto it = phases.find(key);
+        if (it != phases.end()) {
+            result.reused_phases++;
+            result.reused_time_ms += it->second.time_ms;
+            result.time_ms += it->second.time_ms;
+            return it->second;
+        }
+        PhaseResult computed = compute();
+        result.computed_phases++;
+        result.time_ms += computed.time_ms;
+        return phases.emplace(key, std::move(computed)).first->second;
+    }
+    
+public:
+    explicit AblationRunner(const vector<Point2D>& points) : points(points) {}
+    
+    // 후보 그래프 등록: 내용이 같은 그래프가 이미 있으면 그 번호를 반환
+    // (그래프는 실행기보다 오래 살아 있어야 함)
+    int addCandidates(const CandidateGraph& graph) {
+        unsigned long long hash = candidateGraphHash(graph);
+        for (size_t i = 0; i < graphs.size(); i++) {
+            if (hashes[i] == hash && sameCandidateGraph(*graphs[i], graph)) {
+                return (int)i;
+            }
+        }
+        graphs.push_back(&graph);
+        hashes.push_back(hash);
+        return (int)graphs.size() - 1;
+    }
+    
+    int graphCount() const { return (int)graphs.size(); }
+    
+    // 변형 실행: phase1_time_ms는 후보 그래프 구축 시간, tour가 있으면 최종 투어를 복사
+    AblationVariantResult run(const AblationVariant& variant, int graph_id, double phase1_time_ms,
+                              vector<int>* tour = nullptr) {
+        AblationVariantResult result;
+        result.variant = variant;
+        result.graph_id = graph_id;
+        result.time_ms = phase1_time_ms;
+        result.reused_time_ms = 0;
+        result.two_opt_time_ms = 0;
+        result.computed_phases = 0;
+        result.reused_phases = 0;
+        
+        const CandidateGraph& candidates = *graphs[graph_id];
+        string graph_key = to_string(graph_id);
+        
+        // Phase 2 & 3: 필요한 초기 투어만 생성
+        const PhaseResult* greedy = nullptr;
+        const PhaseResult* mst = nullptr;
+        if (variant.construction != "mst") {
+            greedy = &phase("greedy:" + graph_key, [&]() {
+                BenchmarkTimer timer;
+                timer.start();
+                PhaseResult r;
+                r.tour = greedyInsertion(points, candidates);
+                r.length = calculateTourLength(r.tour, points);
+                timer.stop();
+                r.time_ms = timer.getMilliseconds();
+                return r;
+            }, result);
+        }
+        if (variant.construction != "greedy") {
+            mst = &phase("mst:" + graph_key, [&]() {
+                BenchmarkTimer timer;
+                timer.start();
+                PhaseResult r;
+                r.tour = mstBasedTour(points, candidates);
+                r.length = calculateTourLength(r.tour, points);
+                timer.stop();
+                r.time_ms = timer.getMilliseconds();
+                return r;
+            }, result);
+        }
+        
+        // "best"는 기존과 같이 Greedy가 더 짧을 때만 Greedy 투어 사용
+        const PhaseResult* source = (greedy != nullptr && (mst == nullptr || greedy->length < mst->length))
+                                    ? greedy : mst;
+        result.source = (source == greedy) ? "greedy" : "mst";
+        result.distance_before_2opt = source->length;
+        
+        // Phase 4: 같은 초기 투어와 반복 횟수의 2-opt는 한 번만 실행
+        const PhaseResult* final_result = source;
+        if (variant.two_opt_iterations > 0) {
+            string key = "2opt:" + graph_key + ":" + result.source + ":" +
+                         to_string(variant.two_opt_iterations);
+            final_result = &phase(key, [&]() {
+                PhaseResult r;
+                r.tour = source->tour;
+                double before;
+                selective2optMeasured(r.tour, points, before, r.length, r.time_ms,
+                                      variant.two_opt_iterations);
+                return r;
+            }, result);
+            result.two_opt_time_ms = final_result->time_ms;
+        }
+        result.distance = final_result->length;
+        if (tour != nullptr) *tour = final_result->tour;
+        return result;
+    }
+};
+
 // Ablation Study 메인 함수
-AblationStudyStats runAblationStudy(const vector<pair<double, double>>& coordinates) {
+// bf_sample > 0이고 노드 수보다 작으면 brute-force는 표본 모드 (Phase 1 시간과 후보 일치율만 추정하고
+// brute-force 후보로 투어를 만드는 비교는 생략해 관련 값은 NaN)
+// variants는 기존 KD-tree/brute-force 비교 뒤에 추가로 실행할 변형, finalTour에는 KD-tree 전체 파이프라인의 투어
+// k <= 0이면 적응적 k 값 min(30, max(10, n / 10)) 사용
+AblationStudyStats runAblationStudy(const vector<pair<double, double>>& coordinates, int threads,
+                                    int bf_sample, const vector<AblationVariant>& variants,
+                                    vector<int>& finalTour, int k = 0) {
     int n = coordinates.size();
     
     // 좌표를 Point2D로 변환
@@ -395,97 +607,230 @@ AblationStudyStats runAblationStudy(const vector<pair<double, double>>& coordina
     AblationStudyStats stats;
     stats.nodes = n;
     
-    BenchmarkTimer totalTimer;
-    
     cout << "🔬 Starting Ablation Study for " << n << " nodes" << endl;
     
     // Phase 1 비교: KD-tree vs Brute-force
     cout << "📊 Phase 1: KD-tree vs Brute-force KNN comparison" << endl;
     
-    int k = min(30, max(10, n / 10)); // 적응적 k 값
+    if (k <= 0) k = min(30, max(10, n / 10)); // 적응적 k 값
+    stats.k = k;
     
-    totalTimer.start();
-    vector<vector<int>> candidatesKDTree = buildCandidateEdgesKDTree(points, k, stats.kdtree_phase1_time_ms);
-    stats.kdtree_candidate_edges = countCandidateEdges(candidatesKDTree);
+    MemoryTracker phaseMemory;
     
-    vector<vector<int>> candidatesBruteForce = buildCandidateEdgesBruteForce(points, k, stats.bruteforce_phase1_time_ms);
-    stats.bruteforce_candidate_edges = countCandidateEdges(candidatesBruteForce);
+    phaseMemory.start();
+    CandidateGraph candidatesKDTree = buildCandidateEdgesKDTree(points, k, stats.kdtree_phase1_time_ms,
+                                                                stats.kdtree_bytes);
+    phaseMemory.stop();
+    stats.kdtree_phase1_alloc_bytes = phaseMemory.getAllocatedBytes();
+    stats.kdtree_candidate_edges = countCandidateEdges(candidatesKDTree);
+    stats.candidate_bytes = candidatesKDTree.getMemoryBytes();
+    
+    bool sampled = bf_sample > 0 && bf_sample < n;
+    stats.bruteforce_mode = sampled ? "sampled" : "full";
+    stats.bruteforce_sample_queries = sampled ? bf_sample : n;
+    stats.bruteforce_threads = max(1, threads);
+    
+    phaseMemory.start();
+    CandidateGraph candidatesBruteForce;
+    if (sampled) {
+        stats.bruteforce_phase1_time_ms = estimateBruteForceTime(points, k, threads, bf_sample, candidatesKDTree,
+                                                                 stats.candidate_agreement);
+        stats.bruteforce_candidate_edges = NAN;
+    } else {
+        candidatesBruteForce = buildCandidateEdgesBruteForce(points, k, threads, candidatesKDTree,
+                                                             stats.bruteforce_phase1_time_ms,
+                                                             stats.candidate_agreement);
+        stats.bruteforce_candidate_edges = countCandidateEdges(candidatesBruteForce);
+    }
+    phaseMemory.stop();
+    stats.bruteforce_phase1_alloc_bytes = phaseMemory.getAllocatedBytes();
     
     cout << "   KD-tree time: " << stats.kdtree_phase1_time_ms << " ms" << endl;
-    cout << "   Brute-force time: " << stats.bruteforce_phase1_time_ms << " ms" << endl;
+    if (sampled) {
+        cout << "   Brute-force time: " << stats.bruteforce_phase1_time_ms << " ms (estimated from "
+             << bf_sample << " sampled queries, " << stats.bruteforce_threads << " threads)" << endl;
+    } else {
+        cout << "   Brute-force time: " << stats.bruteforce_phase1_time_ms << " ms ("
+             << stats.bruteforce_threads << " threads)" << endl;
+    }
+    cout << "   Candidate agreement: " << (stats.candidate_agreement * 100) << "%" << endl;
     cout << "   Speed-up ratio: " << (stats.bruteforce_phase1_time_ms / stats.kdtree_phase1_time_ms) << "x" << endl;
+    cout << "   KD-tree allocated: " << stats.kdtree_phase1_alloc_bytes << " bytes" << endl;
+    cout << "   Brute-force allocated: " << stats.bruteforce_phase1_alloc_bytes << " bytes" << endl;
+    
+    // Phase 2~4: 변형마다 실행하되 같은 후보 그래프의 단계는 재사용
+    // (KD-tree 전체 파이프라인과 brute-force 전체 파이프라인이 기존 비교, 추가 변형은 그 뒤에 실행)
+    AblationRunner runner(points);
+    int kdGraph = runner.addCandidates(candidatesKDTree);
+    int bfGraph = sampled ? -1 : runner.addCandidates(candidatesBruteForce);
+    
+    vector<AblationVariant> presets = ablationVariantPresets();
+    vector<AblationVariant> queue = {presets[0]};
+    if (!sampled) queue.push_back(presets[1]);
+    for (const AblationVariant& variant : variants) {
+        if (variant.candidates == "bruteforce" && sampled) {
+            throw invalid_argument("variant '" + variant.name +
+                                   "' needs the full brute-force baseline (drop --bf-sample)");
+        }
+        // 이름이 달라도 구성이 같은 변형은 한 번만 실행
+        bool duplicate = false;
+        for (const AblationVariant& queued : queue) {
+            duplicate = duplicate || (queued.candidates == variant.candidates &&
+                                      queued.construction == variant.construction &&
+                                      queued.two_opt_iterations == variant.two_opt_iterations);
+        }
+        if (!duplicate) queue.push_back(variant);
+    }
     
-    // Phase 2 & 3: KD-tree 버전으로 투어 생성
-    vector<int> greedyTour = greedyInsertion(points, candidatesKDTree);
-    vector<int> mstTour = mstBasedTour(points, candidatesKDTree);
-    
-    double greedyLength = calculateTourLength(greedyTour, points);
-    double mstLength = calculateTourLength(mstTour, points);
-    
-    vector<int> bestTour = (greedyLength < mstLength) ? greedyTour : mstTour;
-    vector<int> bestTourCopy = bestTour; // 2-opt 비교용 복사본
+    cout << "📊 Phases 2-4: " << queue.size() << " variants on " << runner.graphCount()
+         << " unique candidate graph(s)" << endl;
+    if (!sampled && bfGraph == kdGraph) {
+        cout << "   ♻️  Brute-force candidates match the KD-tree candidates - downstream phases are shared" << endl;
+    }
     
-    // Phase 4: 2-opt 효과 측정
-    cout << "📊 Phase 4: 2-opt optimization analysis" << endl;
+    for (size_t i = 0; i < queue.size(); i++) {
+        const AblationVariant& variant = queue[i];
+        bool kd = variant.candidates == "kdtree";
+        AblationVariantResult result = runner.run(variant, kd ? kdGraph : bfGraph,
+                                                  kd ? stats.kdtree_phase1_time_ms
+                                                     : stats.bruteforce_phase1_time_ms,
+                                                  i == 0 ? &finalTour : nullptr);
+        stats.computed_phases += result.computed_phases;
+        stats.reused_phases += result.reused_phases;
+        stats.reused_time_ms += result.reused_time_ms;
+        stats.variants.push_back(result);
+        
+        cout << "   " << variant.name << ": distance " << result.distance << ", "
+             << result.time_ms << " ms (" << result.computed_phases << " computed, "
+             << result.reused_phases << " reused phases)" << endl;
+    }
+    stats.unique_candidate_graphs = runner.graphCount();
     
-    selective2optMeasured(bestTour, points, stats.distance_before_2opt, 
-                         stats.distance_after_2opt, stats.phase4_2opt_time_ms);
+    // 기존 통계는 full 변형(KD-tree, Greedy/MST 중 짧은 투어, 2-opt 2회)에서 가져옴
+    const AblationVariantResult& full = stats.variants[0];
+    stats.distance_before_2opt = full.distance_before_2opt;
+    stats.distance_after_2opt = full.distance;
+    stats.phase4_2opt_time_ms = full.two_opt_time_ms;
     
     stats.improvement_ratio_2opt = (stats.distance_before_2opt - stats.distance_after_2opt) / stats.distance_before_2opt;
     
+    cout << "📊 Phase 4: 2-opt optimization analysis" << endl;
     cout << "   Distance before 2-opt: " << stats.distance_before_2opt << endl;
     cout << "   Distance after 2-opt: " << stats.distance_after_2opt << endl;
     cout << "   2-opt improvement: " << (stats.improvement_ratio_2opt * 100) << "%" << endl;
     cout << "   2-opt time: " << stats.phase4_2opt_time_ms << " ms" << endl;
     
-    totalTimer.stop();
-    stats.total_time_kdtree_ms = totalTimer.getMilliseconds();
-    stats.final_distance_kdtree = stats.distance_after_2opt;
-    
-    // Brute-force 전체 실행 (비교용)
-    totalTimer.start();
-    vector<int> greedyTourBF = greedyInsertion(points, candidatesBruteForce);
-    vector<int> mstTourBF = mstBasedTour(points, candidatesBruteForce);
-    
-    double greedyLengthBF = calculateTourLength(greedyTourBF, points);
-    double mstLengthBF = calculateTourLength(mstTourBF, points);
+    stats.total_time_kdtree_ms = full.time_ms;
+    stats.final_distance_kdtree = full.distance;
     
-    vector<int> bestTourBF = (greedyLengthBF < mstLengthBF) ? greedyTourBF : mstTourBF;
+    // 분석 결과 계산
+    stats.time_complexity_ratio = stats.bruteforce_phase1_time_ms / stats.kdtree_phase1_time_ms;
     
-    double dummy1, dummy2, dummy3;
-    selective2optMeasured(bestTourBF, points, dummy1, dummy2, dummy3);
+    if (sampled) {
+        stats.total_time_bruteforce_ms = NAN;
+        stats.final_distance_bruteforce = NAN;
+        stats.quality_difference = NAN;
+        cout << "\n🎯 Ablation Study Summary:" << endl;
+        cout << "   Time complexity ratio (BF/KD, estimated): " << stats.time_complexity_ratio << "x" << endl;
+        return stats;
+    }
     
-    totalTimer.stop();
-    stats.total_time_bruteforce_ms = totalTimer.getMilliseconds();
-    stats.final_distance_bruteforce = calculateTourLength(bestTourBF, points);
+    const AblationVariantResult& bruteforce = stats.variants[1];
+    stats.total_time_bruteforce_ms = bruteforce.time_ms;
+    stats.final_distance_bruteforce = bruteforce.distance;
     
-    // 분석 결과 계산
-    stats.time_complexity_ratio = stats.bruteforce_phase1_time_ms / stats.kdtree_phase1_time_ms;
     stats.quality_difference = abs(stats.final_distance_kdtree - stats.final_distance_bruteforce) / 
                               min(stats.final_distance_kdtree, stats.final_distance_bruteforce);
     
     cout << "\n🎯 Ablation Study Summary:" << endl;
     cout << "   Time complexity ratio (BF/KD): " << stats.time_complexity_ratio << "x" << endl;
     cout << "   Quality difference: " << (stats.quality_difference * 100) << "%" << endl;
+    cout << "   Reused phases: " << stats.reused_phases << " (" << stats.reused_time_ms
+         << " ms not recomputed)" << endl;
     
     return stats;
 }
 
 int main(int argc, char* argv[]) {
-    if (argc < 3) {
-        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [ablation_csv]" << endl;
+    SolverArgs args = parseSolverArgs(argc, argv);
+    if (args.positional.size() < 2) {
+        cout << "Usage: " << argv[0] << " <tsp_file> <output_file> [ablation_csv] [--json] [--threads=N] [--bf-sample=S] [--variants=LIST] [--k=N]" << endl;
+        cout << "  --threads=N    threads for the brute-force KNN baseline (default: hardware threads)" << endl;
+        cout << "  --bf-sample=S  estimate the brute-force time and candidate agreement from S random" << endl;
+        cout << "                 query points instead of running it for every node" << endl;
+        cout << "  --variants=LIST  extra variants to run after the KD-tree/brute-force comparison:" << endl;
+        cout << "                 preset names (no_2opt, greedy_only, mst_only, ...) or" << endl;
+        cout << "                 candidates:construction:iterations, e.g. bruteforce:mst:0" << endl;
+        cout << "  --k=N          candidate neighbours per node (default: min(30, max(10, n/10)))" << endl;
         return 1;
     }
     
-    string tsp_filename = argv[1];
-    string output_filename = argv[2];
-    string ablation_csv = (argc > 3) ? argv[3] : "";
+    string tsp_filename = args.positional[0];
+    string output_filename = args.positional[1];
+    string ablation_csv = (args.positional.size() > 2) ? args.positional[2] : "";
+    
+    // --threads=N: brute-force KNN 스레드 수
+    int threads = defaultThreadCount();
+    if (args.hasOption("threads")) {
+        string threads_option = args.getOption("threads");
+        char* end = nullptr;
+        long value = strtol(threads_option.c_str(), &end, 10);
+        if (threads_option.empty() || *end != '\0' || value < 1 || value > 1024) {
+            cout << "Invalid --threads value: " << threads_option << " (expected an integer in 1..1024)" << endl;
+            return 1;
+        }
+        threads = (int)value;
+    }
+    
+    // --bf-sample=S: brute-force 표본 모드의 질의 점 수
+    int bf_sample = 0;
+    if (args.hasOption("bf-sample")) {
+        string sample_option = args.getOption("bf-sample");
+        char* end = nullptr;
+        long value = strtol(sample_option.c_str(), &end, 10);
+        if (sample_option.empty() || *end != '\0' || value < 1 || value > 100000000) {
+            cout << "Invalid --bf-sample value: " << sample_option << " (expected a positive integer)" << endl;
+            return 1;
+        }
+        bf_sample = (int)value;
+    }
+    
+    // --k=N: 후보 이웃 수 (scripts/ablation_matrix.py의 K 그리드)
+    int k = 0;
+    if (args.hasOption("k")) {
+        string k_option = args.getOption("k");
+        char* end = nullptr;
+        long value = strtol(k_option.c_str(), &end, 10);
+        if (k_option.empty() || *end != '\0' || value < 1 || value > 1000) {
+            cout << "Invalid --k value: " << k_option << " (expected an integer in 1..1000)" << endl;
+            return 1;
+        }
+        k = (int)value;
+    }
+    
+    // --variants=LIST: 추가로 실행할 ablation 변형
+    vector<AblationVariant> variants;
+    if (args.hasOption("variants")) {
+        string error;
+        if (!parseAblationVariants(args.getOption("variants"), variants, error)) {
+            cout << "Invalid --variants value: " << error << endl;
+            return 1;
+        }
+    }
+    
+    // --json: stdout에 결과 레코드 한 줄만 출력
+    JsonOutputMode json(args.hasOption("json"));
+    JsonObject record;
+    record.add("algorithm", "Spatial-Algorithm-Ablation")
+          .add("dataset", getDatasetName(tsp_filename))
+          .add("file", tsp_filename);
     
     try {
         vector<pair<double, double>> coordinates = parseCoordinates(tsp_filename);
         
         // Ablation Study 실행
-        AblationStudyStats stats = runAblationStudy(coordinates);
+        vector<int> finalTour;
+        AblationStudyStats stats = runAblationStudy(coordinates, threads, bf_sample, variants, finalTour, k);
         
         string dataset_name = tsp_filename.substr(tsp_filename.find_last_of("/") + 1);
         dataset_name = dataset_name.substr(0, dataset_name.find_last_of("."));
@@ -495,33 +840,9 @@ int main(int argc, char* argv[]) {
         cout << "Dataset: " << tsp_filename << endl;
         cout << "Nodes: " << coordinates.size() << endl;
         
-        // 결과 저장
-        // 여기서는 KD-tree 버전 결과를 저장
-        vector<Point2D> points(coordinates.size());
-        for (int i = 0; i < coordinates.size(); i++) {
-            points[i] = Point2D(coordinates[i].first, coordinates[i].second, i);
-        }
-        
-        // KD-tree 버전으로 최종 투어 생성
-        int k = min(30, max(10, (int)coordinates.size() / 10));
-        double dummy_time;
-        vector<vector<int>> candidates = buildCandidateEdgesKDTree(points, k, dummy_time);
-        vector<int> greedyTour = greedyInsertion(points, candidates);
-        vector<int> mstTour = mstBasedTour(points, candidates);
-        
-        double greedyLength = calculateTourLength(greedyTour, points);
-        double mstLength = calculateTourLength(mstTour, points);
-        vector<int> finalTour = (greedyLength < mstLength) ? greedyTour : mstTour;
-        
-        double dummy1, dummy2, dummy3;
-        selective2optMeasured(finalTour, points, dummy1, dummy2, dummy3);
-        
-        // CompleteGraph 생성하여 정수 거리로 변환
-        CompleteGraph graph = parseTSP(tsp_filename);
-        int total_distance = 0;
-        for (int i = 0; i < finalTour.size() - 1; i++) {
-            total_distance += graph.getCost(finalTour[i], finalTour[i + 1]);
-        }
+        // 결과 저장: KD-tree 전체 파이프라인(full 변형)의 투어
+        // 정수 거리로 변환 (EXPLICIT 파일만 완전 그래프 사용, 나머지는 EDGE_WEIGHT_TYPE의 TSPLIB 거리)
+        int total_distance = TourScorer(tsp_filename, coordinates).tourLength(finalTour);
         
         saveTourToFile(finalTour, coordinates, output_filename, total_distance);
         
@@ -535,11 +856,21 @@ int main(int argc, char* argv[]) {
                 initAblationStatsCSV(ablation_csv);
             }
             
+            stats.peak_rss_kb = getPeakRSSKB();
             saveAblationStats(ablation_csv, stats);
         }
         
+        stats.peak_rss_kb = getPeakRSSKB();
+        record.add("n", (int)coordinates.size())
+              .add("status", "SUCCESS")
+              .add("distance", total_distance);
+        addAblationStatsToJson(record, stats);
+        json.emit(record);
+        
     } catch (const exception& e) {
         cout << "Error: " << e.what() << endl;
+        record.add("status", "ERROR").add("error", e.what());
+        json.emit(record);
         return 1;
     }
     
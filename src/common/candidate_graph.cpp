@@ -0,0 +1,45 @@
+#include "../../include/candidate_graph.h"
+#include <algorithm>
+#include <cstring>
+
+CandidateGraph truncateCandidateGraph(const CandidateGraph& graph, int k) {
+    int n = graph.nodeCount();
+    CandidateGraph truncated;
+    truncated.startBuild(n, std::min(graph.edgeCount(), (size_t)n * k));
+    
+    for (int u = 0; u < n; u++) {
+        int end = std::min(graph.end(u), graph.begin(u) + k);
+        for (int e = graph.begin(u); e < end; e++) {
+            truncated.neighbors.push_back(graph.neighbors[e]);
+            truncated.lengths.push_back(graph.lengths[e]);
+        }
+        truncated.finishNode();
+    }
+    
+    return truncated;
+}
+
+// 바이트 배열을 FNV-1a 해시에 누적
+static void fnv1aUpdate(unsigned long long& hash, const void* data, size_t bytes) {
+    const unsigned char* p = static_cast<const unsigned char*>(data);
+    for (size_t i = 0; i < bytes; i++) {
+        hash ^= p[i];
+        hash *= 1099511628211ULL;
+    }
+}
+
+unsigned long long candidateGraphHash(const CandidateGraph& graph) {
+    unsigned long long hash = 14695981039346656037ULL;
+    fnv1aUpdate(hash, graph.offsets.data(), graph.offsets.size() * sizeof(int));
+    fnv1aUpdate(hash, graph.neighbors.data(), graph.neighbors.size() * sizeof(int));
+    fnv1aUpdate(hash, graph.lengths.data(), graph.lengths.size() * sizeof(float));
+    return hash;
+}
+
+bool sameCandidateGraph(const CandidateGraph& a, const CandidateGraph& b) {
+    // 길이는 같은 계산식으로 만들어지므로 비트 단위로 비교
+    return a.offsets == b.offsets && a.neighbors == b.neighbors &&
+           a.lengths.size() == b.lengths.size() &&
+           (a.lengths.empty() ||
+            memcmp(a.lengths.data(), b.lengths.data(), a.lengths.size() * sizeof(float)) == 0);
+}
@@ -35,11 +35,11 @@ void max_heapify(DistNode* heap, int heap_size, int i) {
     int right_i = right_child(i);
     int largest = i;
     
-    if (left_i < heap_size && heap[left_i].dist > heap[i].dist) {
+    if (left_i < heap_size && distNodeLess(heap[i], heap[left_i])) {
         largest = left_i;
     }
 
-    if (right_i < heap_size && heap[right_i].dist > heap[largest].dist) {
+    if (right_i < heap_size && distNodeLess(heap[largest], heap[right_i])) {
         largest = right_i;
     }
     
@@ -120,13 +120,13 @@ void insert_max_heap(DistNode* heap, int& heap_size, int max_size, DistNode new_
         
         // 위로 올라가며 정렬
         int i = heap_size - 1;
-        while (i > 0 && heap[(i-1)/2].dist < heap[i].dist) {
+        while (i > 0 && distNodeLess(heap[(i-1)/2], heap[i])) {
             DistNode temp = heap[i];
             heap[i] = heap[(i-1)/2];
             heap[(i-1)/2] = temp;
             i = (i-1)/2;
         }
-    } else if (new_node.dist < heap[0].dist) {
+    } else if (distNodeLess(new_node, heap[0])) {
         heap[0] = new_node;
         max_heapify(heap, heap_size, 0);
     }
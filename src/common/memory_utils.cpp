@@ -0,0 +1,95 @@
+#include "../../include/memory_utils.h"
+#include <atomic>
+#include <cstdlib>
+#include <fstream>
+#include <new>
+#include <string>
+#include <sys/resource.h>
+
+namespace {
+
+std::atomic<size_t> allocated_bytes(0);
+std::atomic<size_t> live_bytes(0);
+std::atomic<size_t> peak_live_bytes(0);
+
+// 해제 시 크기를 알기 위해 블록 앞에 크기를 기록 (16바이트로 정렬 유지)
+const size_t HEADER_SIZE = 16;
+
+void* trackedAlloc(size_t size) {
+    void* raw = malloc(size + HEADER_SIZE);
+    if (!raw) {
+        throw std::bad_alloc();
+    }
+    *static_cast<size_t*>(raw) = size;
+    
+    allocated_bytes.fetch_add(size, std::memory_order_relaxed);
+    size_t live = live_bytes.fetch_add(size, std::memory_order_relaxed) + size;
+    size_t peak = peak_live_bytes.load(std::memory_order_relaxed);
+    while (live > peak && !peak_live_bytes.compare_exchange_weak(peak, live, std::memory_order_relaxed)) {
+    }
+    
+    return static_cast<char*>(raw) + HEADER_SIZE;
+}
+
+void trackedFree(void* ptr) {
+    if (!ptr) return;
+    void* raw = static_cast<char*>(ptr) - HEADER_SIZE;
+    live_bytes.fetch_sub(*static_cast<size_t*>(raw), std::memory_order_relaxed);
+    free(raw);
+}
+
+}
+
+void* operator new(size_t size) {
+    return trackedAlloc(size);
+}
+
+void* operator new[](size_t size) {
+    return trackedAlloc(size);
+}
+
+void operator delete(void* ptr) noexcept {
+    trackedFree(ptr);
+}
+
+void operator delete[](void* ptr) noexcept {
+    trackedFree(ptr);
+}
+
+size_t totalAllocatedBytes() {
+    return allocated_bytes.load(std::memory_order_relaxed);
+}
+
+size_t liveHeapBytes() {
+    return live_bytes.load(std::memory_order_relaxed);
+}
+
+size_t peakLiveHeapBytes() {
+    return peak_live_bytes.load(std::memory_order_relaxed);
+}
+
+void resetPeakLiveHeapBytes() {
+    peak_live_bytes.store(live_bytes.load(std::memory_order_relaxed), std::memory_order_relaxed);
+}
+
+long getPeakRSSKB() {
+    // Linux: VmHWM은 exec 시 초기화되므로 실행한 부모 프로세스(Python 등)의 RSS가 섞이지 않음
+    std::ifstream status("/proc/self/status");
+    std::string line;
+    while (std::getline(status, line)) {
+        if (line.compare(0, 6, "VmHWM:") == 0) {
+            return atol(line.c_str() + 6);
+        }
+    }
+    
+    // ru_maxrss는 exec 이전 이미지의 최대 RSS까지 포함할 수 있음
+    struct rusage usage;
+    if (getrusage(RUSAGE_SELF, &usage) != 0) {
+        return -1;
+    }
+#ifdef __APPLE__
+    return usage.ru_maxrss / 1024; // macOS는 바이트 단위
+#else
+    return usage.ru_maxrss;        // Linux는 KB 단위
+#endif
+}
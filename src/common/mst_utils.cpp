@@ -0,0 +1,50 @@
+#include "../../include/mst_utils.h"
+
+MSTChildArray buildMSTChildArray(const std::vector<int>& parent) {
+    int n = parent.size();
+    MSTChildArray tree;
+    tree.child_start.assign(n + 1, 0);
+    
+    // 부모별 자식 수를 센 뒤 누적합으로 구간 시작 위치 계산
+    for (int v = 0; v < n; v++) {
+        if (parent[v] != -1) {
+            tree.child_start[parent[v] + 1]++;
+        }
+    }
+    for (int u = 0; u < n; u++) {
+        tree.child_start[u + 1] += tree.child_start[u];
+    }
+    
+    // 정점 id 순으로 채우므로 각 구간은 id 오름차순
+    tree.child_ids.resize(tree.child_start[n]);
+    std::vector<int> next(tree.child_start.begin(), tree.child_start.end() - 1);
+    for (int v = 0; v < n; v++) {
+        if (parent[v] != -1) {
+            tree.child_ids[next[parent[v]]++] = v;
+        }
+    }
+    
+    return tree;
+}
+
+std::vector<int> mstPreorder(const MSTChildArray& tree, int root) {
+    int n = (int)tree.child_start.size() - 1;
+    std::vector<int> order;
+    order.reserve(n + 1);
+    
+    // 자식을 역순으로 쌓아 작은 id부터 꺼냄 (재귀 DFS와 같은 방문 순서)
+    std::vector<int> stack;
+    stack.reserve(n);
+    stack.push_back(root);
+    while (!stack.empty()) {
+        int u = stack.back();
+        stack.pop_back();
+        order.push_back(u);
+        
+        for (int i = tree.child_start[u + 1] - 1; i >= tree.child_start[u]; i--) {
+            stack.push_back(tree.child_ids[i]);
+        }
+    }
+    
+    return order;
+}
@@ -0,0 +1,52 @@
+#include "../../include/multi_start.h"
+
+#include <cmath>
+
+using namespace std;
+
+vector<int> multiStartNodes(int n, int starts) {
+    starts = max(1, min(starts, n));
+    vector<int> nodes(starts);
+    for (int i = 0; i < starts; i++) {
+        nodes[i] = (int)((long long)i * n / starts);
+    }
+    return nodes;
+}
+
+StartSpread summarizeStarts(const vector<int>& start_nodes, const vector<double>& lengths) {
+    StartSpread spread;
+    int m = lengths.size();
+    if (m == 0) return spread;
+    
+    int best = 0;
+    double sum = 0;
+    for (int i = 0; i < m; i++) {
+        if (lengths[i] < lengths[best]) best = i;
+        sum += lengths[i];
+    }
+    double mean = sum / m;
+    double squares = 0;
+    for (int i = 0; i < m; i++) {
+        squares += (lengths[i] - mean) * (lengths[i] - mean);
+    }
+    
+    spread.starts = m;
+    spread.best_start = start_nodes[best];
+    spread.min_length = lengths[best];
+    spread.mean_length = mean;
+    spread.max_length = *max_element(lengths.begin(), lengths.end());
+    spread.std_length = sqrt(squares / m);
+    return spread;
+}
+
+JsonObject startSpreadToJson(const StartSpread& spread, int threads) {
+    JsonObject json;
+    json.add("starts", spread.starts)
+        .add("threads", max(1, min(threads, spread.starts)))
+        .add("best_start", spread.best_start)
+        .add("min_length", spread.min_length)
+        .add("mean_length", spread.mean_length)
+        .add("max_length", spread.max_length)
+        .add("std_length", spread.std_length);
+    return json;
+}
@@ -0,0 +1,113 @@
+#include "../../include/perf_counters.h"
+#include <cstring>
+#include <stdint.h>
+
+#ifdef __linux__
+#include <linux/perf_event.h>
+#include <sys/ioctl.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+
+namespace {
+
+const uint64_t COUNTER_CONFIGS[] = {
+    PERF_COUNT_HW_CPU_CYCLES,
+    PERF_COUNT_HW_INSTRUCTIONS,
+    PERF_COUNT_HW_CACHE_MISSES,
+    PERF_COUNT_HW_BRANCH_MISSES,
+};
+
+int openCounter(uint64_t config) {
+    struct perf_event_attr attr;
+    memset(&attr, 0, sizeof(attr));
+    attr.size = sizeof(attr);
+    attr.type = PERF_TYPE_HARDWARE;
+    attr.config = config;
+    attr.disabled = 1;
+    attr.exclude_kernel = 1;
+    attr.exclude_hv = 1;
+    attr.read_format = PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING;
+    return syscall(__NR_perf_event_open, &attr, 0, -1, -1, 0);
+}
+
+// 카운터 멀티플렉싱 시 실행 비율로 보정한 값
+long long readCounter(int fd) {
+    uint64_t data[3]; // value, time_enabled, time_running
+    if (fd < 0 || read(fd, data, sizeof(data)) != (ssize_t)sizeof(data)) {
+        return -1;
+    }
+    if (data[2] == 0) {
+        return 0;
+    }
+    if (data[2] < data[1]) {
+        return (long long)((double)data[0] * data[1] / data[2]);
+    }
+    return (long long)data[0];
+}
+
+}
+
+PerfCounters::PerfCounters() {
+    for (int i = 0; i < NUM_COUNTERS; i++) fds[i] = -1;
+}
+
+PerfCounters::~PerfCounters() {
+    for (int i = 0; i < NUM_COUNTERS; i++) {
+        if (fds[i] >= 0) close(fds[i]);
+    }
+}
+
+bool PerfCounters::open() {
+    for (int i = 0; i < NUM_COUNTERS; i++) {
+        if (fds[i] < 0) fds[i] = openCounter(COUNTER_CONFIGS[i]);
+    }
+    return isAvailable();
+}
+
+bool PerfCounters::isAvailable() const {
+    for (int i = 0; i < NUM_COUNTERS; i++) {
+        if (fds[i] >= 0) return true;
+    }
+    return false;
+}
+
+void PerfCounters::start() {
+    for (int i = 0; i < NUM_COUNTERS; i++) {
+        if (fds[i] < 0) continue;
+        ioctl(fds[i], PERF_EVENT_IOC_RESET, 0);
+        ioctl(fds[i], PERF_EVENT_IOC_ENABLE, 0);
+    }
+}
+
+void PerfCounters::stop() {
+    for (int i = 0; i < NUM_COUNTERS; i++) {
+        if (fds[i] >= 0) ioctl(fds[i], PERF_EVENT_IOC_DISABLE, 0);
+    }
+    values.cycles = readCounter(fds[0]);
+    values.instructions = readCounter(fds[1]);
+    values.cache_misses = readCounter(fds[2]);
+    values.branch_misses = readCounter(fds[3]);
+}
+
+#else
+
+// perf_event를 지원하지 않는 플랫폼: 모든 값이 -1
+PerfCounters::PerfCounters() {
+    for (int i = 0; i < NUM_COUNTERS; i++) fds[i] = -1;
+}
+
+PerfCounters::~PerfCounters() {}
+
+bool PerfCounters::open() {
+    return false;
+}
+
+bool PerfCounters::isAvailable() const {
+    return false;
+}
+
+void PerfCounters::start() {}
+
+void PerfCounters::stop() {}
+
+#endif
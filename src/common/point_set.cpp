@@ -0,0 +1,98 @@
+#include "../../include/point_set.h"
+#include "../../include/tsp_common.h"
+#include <algorithm>
+#include <climits>
+
+std::string coordinateModeName(CoordinateMode mode) {
+    switch (mode) {
+        case COORDS_FLOAT: return "float32";
+        case COORDS_INT32: return "int32";
+        default: return "float64";
+    }
+}
+
+bool hasIntegerCoordinates(const std::vector<std::pair<double, double>>& coordinates) {
+    for (const std::pair<double, double>& c : coordinates) {
+        for (double value : {c.first, c.second}) {
+            if (value != std::floor(value) || value < INT_MIN || value > INT_MAX) {
+                return false;
+            }
+        }
+    }
+    return true;
+}
+
+bool parseCoordinateMode(const std::string& text, const std::vector<std::pair<double, double>>& coordinates,
+                         CoordinateMode& mode, std::string& error) {
+    if (text == "auto") {
+        mode = hasIntegerCoordinates(coordinates) ? COORDS_INT32 : COORDS_DOUBLE;
+    } else if (text == "double") {
+        mode = COORDS_DOUBLE;
+    } else if (text == "float") {
+        mode = COORDS_FLOAT;
+    } else if (text == "int") {
+        // 소수 좌표를 정수로 반올림하면 거리가 달라지므로 거부
+        if (!hasIntegerCoordinates(coordinates)) {
+            error = "--coords=int needs integer coordinates within the int32 range";
+            return false;
+        }
+        mode = COORDS_INT32;
+    } else {
+        error = "Invalid --coords value: " + text + " (expected auto, double, float or int)";
+        return false;
+    }
+    return true;
+}
+
+// 좌표를 PointSet<T>에 저장한 뒤 다시 읽은 값과 원래 좌표를 비교
+template <typename T>
+static void checkStoredCoordinates(const std::vector<std::pair<double, double>>& coordinates,
+                                   const std::vector<int>& tour, MetricType metric,
+                                   CoordinateCheck& check) {
+    PointSet<T> points(coordinates);
+    for (int i = 0; i < points.size(); i++) {
+        double errors[] = {std::fabs(points.x(i) - coordinates[i].first),
+                           std::fabs(points.y(i) - coordinates[i].second)};
+        for (double e : errors) {
+            if (e > 0) {
+                check.rounded_coordinates++;
+                check.max_coordinate_error = std::max(check.max_coordinate_error, e);
+            }
+        }
+    }
+
+    // 좌표가 그대로면 모든 거리가 같으므로 간선 검사는 생략
+    if (check.rounded_coordinates > 0) {
+        for (int i = 0; i + 1 < (int)tour.size(); i++) {
+            int a = tour[i];
+            int b = tour[i + 1];
+            std::pair<double, double> stored_a(points.x(a), points.y(a));
+            std::pair<double, double> stored_b(points.x(b), points.y(b));
+            if (metricDistance(metric, stored_a, stored_b) !=
+                metricDistance(metric, coordinates[a], coordinates[b])) {
+                check.edge_mismatches++;
+            }
+        }
+    }
+}
+
+CoordinateCheck checkCoordinates(const std::vector<std::pair<double, double>>& coordinates,
+                                 CoordinateMode mode, const std::vector<int>& tour, MetricType metric) {
+    CoordinateCheck check;
+    check.mode = mode;
+    switch (mode) {
+        case COORDS_FLOAT:
+            check.bytes_per_point = sizeof(PackedPoint<float>);
+            checkStoredCoordinates<float>(coordinates, tour, metric, check);
+            break;
+        case COORDS_INT32:
+            check.bytes_per_point = sizeof(PackedPoint<int32_t>);
+            checkStoredCoordinates<int32_t>(coordinates, tour, metric, check);
+            break;
+        default:
+            check.bytes_per_point = sizeof(PackedPoint<double>);
+            break;
+    }
+    check.exact = check.edge_mismatches == 0;
+    return check;
+}
@@ -1,4 +1,9 @@
 #include "tsp_common.h"
+#include <cerrno>
+#include <cstdio>
+#include <numeric>
+#include <sys/stat.h>
+#include <unistd.h>
 
 // 유클리드 거리 계산
 int euclideanDistance(const pair<double,double>& p1, const pair<double,double>& p2) {
@@ -22,6 +27,15 @@ int CompleteGraph::getNodeNum() const {
     return node_num;
 }
 
+// 인접 행렬 메모리 (n^2 int + 행 벡터 헤더)
+size_t CompleteGraph::getMemoryBytes() const {
+    size_t total = adj_mat.capacity() * sizeof(vector<int>);
+    for (size_t i = 0; i < adj_mat.size(); i++) {
+        total += adj_mat[i].capacity() * sizeof(int);
+    }
+    return total;
+}
+
 // EXPLICIT 타입 TSP 파일 파싱 (UPPER_ROW 형식)
 CompleteGraph parseTSPExplicit(const string& filename) {
     ifstream infile(filename);
@@ -107,8 +121,116 @@ vector<pair<double,double> > parseDisplayCoordinates(const string& filename) {
     return coordinates;
 }
 
+// 바이너리 좌표 파일 여부 확인 (매직 "TSPB")
+bool isBinaryTSP(const string& filename) {
+    ifstream infile(filename, ios::binary);
+    char magic[4] = {0, 0, 0, 0};
+    infile.read(magic, 4);
+    return infile.gcount() == 4 && string(magic, 4) == "TSPB";
+}
+
+// 바이너리 좌표 파일 파싱
+// 형식 (little-endian): "TSPB" | int32 version(=1) | int32 dimension | float64 x,y * dimension
+vector<pair<double,double> > parseBinaryCoordinates(const string& filename) {
+    ifstream infile(filename, ios::binary);
+    if (!infile.is_open()) {
+        throw runtime_error("Can't open the file");
+    }
+
+    char magic[4];
+    int version = 0;
+    int dim = -1;
+    infile.read(magic, 4);
+    infile.read(reinterpret_cast<char*>(&version), sizeof(int));
+    infile.read(reinterpret_cast<char*>(&dim), sizeof(int));
+
+    if (!infile || string(magic, 4) != "TSPB" || version != 1 || dim < 0) {
+        throw runtime_error("Invalid binary TSP header");
+    }
+
+    vector<double> raw(2 * (size_t)dim);
+    infile.read(reinterpret_cast<char*>(raw.data()), raw.size() * sizeof(double));
+    if (!infile) {
+        throw runtime_error("Binary TSP file is truncated");
+    }
+    infile.close();
+
+    vector<pair<double,double> > coordinates(dim);
+    for (int i = 0; i < dim; ++i) {
+        coordinates[i] = make_pair(raw[2 * i], raw[2 * i + 1]);
+    }
+    return coordinates;
+}
+
+// EXPLICIT 간선 가중치 파일인지 확인 (좌표로 거리를 계산할 수 없는 경우)
+bool hasExplicitWeights(const string& filename) {
+    if (isBinaryTSP(filename)) {
+        return false;
+    }
+
+    ifstream infile(filename);
+    string line;
+    while (getline(infile, line)) {
+        if (line.find("EDGE_WEIGHT_TYPE") != string::npos) {
+            return line.find("EXPLICIT") != string::npos;
+        }
+        if (line.find("_SECTION") != string::npos) {
+            break;
+        }
+    }
+    return false;
+}
+
+// 좌표로 투어 길이 계산
+int calculateTourDistance(const vector<int>& tour, const vector<pair<double,double> >& coordinates,
+                          MetricType metric) {
+    int total_distance = 0;
+    for (int i = 0; i + 1 < (int)tour.size(); i++) {
+        total_distance += metricDistance(metric, coordinates[tour[i]], coordinates[tour[i + 1]]);
+    }
+    return total_distance;
+}
+
+TourScorer::TourScorer(const string& tsp_filename, const vector<pair<double,double> >& coordinates)
+    : explicit_weights(hasExplicitWeights(tsp_filename)),
+      metric_type(readMetricType(tsp_filename)),
+      metric(coordinates, metric_type),
+      graph(explicit_weights ? parseTSP(tsp_filename) : CompleteGraph(0)) {}
+
+int TourScorer::tourLength(const vector<int>& tour) const {
+    if (!explicit_weights) {
+        return metric.tourLength(tour);
+    }
+    int total = 0;
+    for (int i = 0; i + 1 < (int)tour.size(); i++) {
+        total += graph.getCost(tour[i], tour[i + 1]);
+    }
+    return total;
+}
+
+// 좌표와 간선 가중치 타입으로 완전 그래프 구성 (행마다 TSPMetric::costsFrom으로 한 번에 계산)
+static CompleteGraph buildCoordinateGraph(const vector<pair<double,double> >& coordinates, MetricType type) {
+    int dim = coordinates.size();
+    TSPMetric metric(coordinates, type);
+    CompleteGraph graph(dim);
+    vector<int> ids(dim);
+    iota(ids.begin(), ids.end(), 0);
+    vector<int> row(dim);
+    for (int i = 0; i < dim; ++i) {
+        metric.costsFrom(i, ids.data() + i + 1, dim - i - 1, row.data());
+        for (int j = i + 1; j < dim; ++j) {
+            graph.addEdge(i, j, row[j - i - 1]);
+        }
+    }
+    return graph;
+}
+
 // 개선된 TSP 파일 파싱 (자동 타입 감지)
 CompleteGraph parseTSP(const string& filename) {
+    if (isBinaryTSP(filename)) {
+        return buildCoordinateGraph(parseBinaryCoordinates(filename), METRIC_EUC_2D);
+    }
+
     ifstream infile(filename);
     if (!infile.is_open()) {
         throw runtime_error("Can't open the file");
@@ -167,20 +289,17 @@ CompleteGraph parseTSP(const string& filename) {
         }
         infile2.close();
 
-        CompleteGraph graph(dim);
-        for (int i = 0; i < dim; ++i) {
-            for (int j = i + 1; j < dim; ++j) {
-                int dist = euclideanDistance(coordinates[i], coordinates[j]);
-                graph.addEdge(i, j, dist);
-            }
-        }
-        
-        return graph;
+        // EDGE_WEIGHT_TYPE(EUC_2D, CEIL_2D, ATT, GEO)에 맞는 거리 사용
+        return buildCoordinateGraph(coordinates, readMetricType(filename));
     }
 }
 
 // 개선된 좌표 파싱 (DISPLAY_DATA_SECTION과 NODE_COORD_SECTION 모두 지원)
 vector<pair<double,double> > parseCoordinates(const string& filename) {
+    if (isBinaryTSP(filename)) {
+        return parseBinaryCoordinates(filename);
+    }
+
     ifstream infile(filename);
     if (!infile.is_open()) {
         throw runtime_error("Can't open the file");
@@ -243,32 +362,149 @@ vector<pair<double,double> > parseCoordinates(const string& filename) {
 }
 
 // tour 결과를 파일로 저장하는 함수
-void saveTourToFile(const vector<int>& tour, const vector<pair<double,double> >& coordinates, 
-                    const string& tour_filename, int total_distance) {
-    // tour 경로 저장
-    ofstream tour_file(tour_filename.c_str());
-    tour_file << "# TSP Tour Result\n";
-    tour_file << "# Total Distance: " << total_distance << "\n";
-    tour_file << "# Tour Order:\n";
-    
-    for (int i = 0; i < tour.size(); i++) {
-        tour_file << tour[i];
-        if (i < tour.size() - 1) tour_file << " ";
+bool isBinaryTourFile(const string& filename) {
+    const string extension = ".tourb";
+    return filename.size() >= extension.size() &&
+           filename.compare(filename.size() - extension.size(), extension.size(), extension) == 0;
+}
+
+// 좌표 내용 해시 (FNV-1a 64비트, 노드 수와 좌표의 바이트 기준)
+unsigned long long hashCoordinates(const vector<pair<double,double> >& coordinates) {
+    unsigned long long hash = 1469598103934665603ULL;
+    const unsigned long long prime = 1099511628211ULL;
+
+    int dim = coordinates.size();
+    const unsigned char* bytes = reinterpret_cast<const unsigned char*>(&dim);
+    for (size_t i = 0; i < sizeof(int); i++) {
+        hash = (hash ^ bytes[i]) * prime;
     }
-    tour_file << "\n";
-    tour_file.close();
-    
-    // 좌표 데이터 저장 (실수형 좌표 지원)
-    string coord_filename = tour_filename.substr(0, tour_filename.find_last_of('.')) + "_coordinates.txt";
-    ofstream coord_file(coord_filename.c_str());
-    coord_file << "# Node Coordinates (node_id x y)\n";
-    coord_file << fixed << setprecision(4);  // 소수점 4자리까지 표시
-    
-    for (int i = 0; i < coordinates.size(); i++) {
-        coord_file << i << " " << coordinates[i].first << " " << coordinates[i].second << "\n";
+    for (size_t i = 0; i < coordinates.size(); i++) {
+        double xy[2] = {coordinates[i].first, coordinates[i].second};
+        bytes = reinterpret_cast<const unsigned char*>(xy);
+        for (size_t j = 0; j < sizeof(xy); j++) {
+            hash = (hash ^ bytes[j]) * prime;
+        }
+    }
+    return hash;
+}
+
+string coordinatesHashHex(unsigned long long hash) {
+    char buffer[17];
+    snprintf(buffer, sizeof(buffer), "%016llx", hash);
+    return string(buffer);
+}
+
+// 좌표를 <tour 디렉토리>/coordinates/<hash>.tspb에 저장하고 tour 파일 기준 상대 경로를 반환
+// 같은 데이터셋의 좌표 파일이 이미 있으면 다시 쓰지 않음 (동시 실행 대비 임시 파일 + rename)
+string saveCoordinatesOnce(const vector<pair<double,double> >& coordinates,
+                           const string& tour_filename, unsigned long long hash) {
+    size_t slash = tour_filename.find_last_of('/');
+    string tour_dir = (slash == string::npos) ? "" : tour_filename.substr(0, slash + 1);
+    string relative_path = "coordinates/" + coordinatesHashHex(hash) + ".tspb";
+    string coord_dir = tour_dir + "coordinates";
+    string coord_filename = tour_dir + relative_path;
+
+    struct stat info;
+    if (stat(coord_filename.c_str(), &info) == 0) {
+        cout << "Coordinates already stored in " << coord_filename << "." << endl;
+        return relative_path;
+    }
+
+    if (mkdir(coord_dir.c_str(), 0755) != 0 && errno != EEXIST) {
+        throw runtime_error("Can't create coordinate directory: " + coord_dir);
     }
+
+    string temp_filename = coord_filename + ".tmp." + to_string((long long)getpid());
+    ofstream coord_file(temp_filename.c_str(), ios::binary);
+    int version = 1;
+    int dim = coordinates.size();
+    coord_file.write("TSPB", 4);
+    coord_file.write(reinterpret_cast<const char*>(&version), sizeof(int));
+    coord_file.write(reinterpret_cast<const char*>(&dim), sizeof(int));
+    vector<double> raw(2 * coordinates.size());
+    for (size_t i = 0; i < coordinates.size(); i++) {
+        raw[2 * i] = coordinates[i].first;
+        raw[2 * i + 1] = coordinates[i].second;
+    }
+    coord_file.write(reinterpret_cast<const char*>(raw.data()), raw.size() * sizeof(double));
     coord_file.close();
+
+    if (!coord_file || rename(temp_filename.c_str(), coord_filename.c_str()) != 0) {
+        remove(temp_filename.c_str());
+        throw runtime_error("Can't write coordinate file: " + coord_filename);
+    }
+
+    cout << "The coordinate data is saved in " << coord_filename << "." << endl;
+    return relative_path;
+}
+
+void saveTourToFile(const vector<int>& tour, const vector<pair<double,double> >& coordinates, 
+                    const string& tour_filename, int total_distance) {
+    unsigned long long hash = hashCoordinates(coordinates);
+    string coord_path = saveCoordinatesOnce(coordinates, tour_filename, hash);
+
+    if (isBinaryTourFile(tour_filename)) {
+        // 바이너리 tour 저장 (int32 순열 + 헤더)
+        ofstream tour_file(tour_filename.c_str(), ios::binary);
+        int version = 1;
+        int length = tour.size();
+        int reserved = 0;
+        long long distance = total_distance;
+        tour_file.write("TOUR", 4);
+        tour_file.write(reinterpret_cast<const char*>(&version), sizeof(int));
+        tour_file.write(reinterpret_cast<const char*>(&length), sizeof(int));
+        tour_file.write(reinterpret_cast<const char*>(&reserved), sizeof(int));
+        tour_file.write(reinterpret_cast<const char*>(&distance), sizeof(long long));
+        tour_file.write(reinterpret_cast<const char*>(&hash), sizeof(unsigned long long));
+        tour_file.write(reinterpret_cast<const char*>(tour.data()), tour.size() * sizeof(int));
+        tour_file.close();
+    } else {
+        // tour 경로 저장
+        ofstream tour_file(tour_filename.c_str());
+        tour_file << "# TSP Tour Result\n";
+        tour_file << "# Total Distance: " << total_distance << "\n";
+        tour_file << "# Coordinates: " << coord_path << "\n";
+        tour_file << "# Tour Order:\n";
+        
+        for (int i = 0; i < tour.size(); i++) {
+            tour_file << tour[i];
+            if (i < tour.size() - 1) tour_file << " ";
+        }
+        tour_file << "\n";
+        tour_file.close();
+    }
     
     cout << "Tour results saved in " << tour_filename << "." << endl;
-    cout << "The coordinate data is saved in" << coord_filename << "." << endl;
-} 
\ No newline at end of file
+} 
+
+SolverArgs parseSolverArgs(int argc, char* argv[]) {
+    SolverArgs args;
+    for (int i = 1; i < argc; i++) {
+        string arg = argv[i];
+        if (arg.size() > 2 && arg.compare(0, 2, "--") == 0) {
+            size_t eq = arg.find('=');
+            if (eq == string::npos) {
+                args.options[arg.substr(2)] = "";
+            } else {
+                args.options[arg.substr(2, eq - 2)] = arg.substr(eq + 1);
+            }
+        } else {
+            args.positional.push_back(arg);
+        }
+    }
+    return args;
+}
+
+bool SolverArgs::hasOption(const string& name) const {
+    return options.find(name) != options.end();
+}
+
+string SolverArgs::getOption(const string& name, const string& default_value) const {
+    map<string, string>::const_iterator it = options.find(name);
+    return (it == options.end()) ? default_value : it->second;
+}
+
+string getDatasetName(const string& filename) {
+    string dataset_name = filename.substr(filename.find_last_of("/") + 1);
+    return dataset_name.substr(0, dataset_name.find_last_of("."));
+}
@@ -0,0 +1,188 @@
+#include "../../include/tsp_metric.h"
+#include "../../include/tsp_common.h"
+#include <cmath>
+#include <fstream>
+#include <stdexcept>
+
+// TSPLIB 문서(TSPLIB95)의 상수와 식을 그대로 사용
+static const double GEO_PI = 3.141592;
+static const double GEO_RADIUS = 6378.388;
+
+// 거리 함수: (ax, ay)에서 (bx, by)까지의 정수 거리
+// GEO는 x가 위도, y가 경도 (라디안으로 변환된 값)
+struct Euc2DCost {
+    int operator()(double ax, double ay, double bx, double by) const {
+        double dx = ax - bx;
+        double dy = ay - by;
+        return (int)(sqrt(dx * dx + dy * dy) + 0.5);
+    }
+};
+
+struct Ceil2DCost {
+    int operator()(double ax, double ay, double bx, double by) const {
+        double dx = ax - bx;
+        double dy = ay - by;
+        return (int)ceil(sqrt(dx * dx + dy * dy));
+    }
+};
+
+struct AttCost {
+    int operator()(double ax, double ay, double bx, double by) const {
+        double dx = ax - bx;
+        double dy = ay - by;
+        double r = sqrt((dx * dx + dy * dy) / 10.0);
+        int t = (int)(r + 0.5);
+        return (t < r) ? t + 1 : t;
+    }
+};
+
+struct GeoCost {
+    int operator()(double alat, double alon, double blat, double blon) const {
+        double q1 = cos(alon - blon);
+        double q2 = cos(alat - blat);
+        double q3 = cos(alat + blat);
+        return (int)(GEO_RADIUS * acos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0);
+    }
+};
+
+// GEO 좌표(DDD.MM: 정수부는 도, 소수부는 분)를 라디안으로
+// TSPLIB 참조 구현과 같이 정수부는 버림으로 구함
+static double geoRadians(double value) {
+    int degrees = (int)value;
+    double minutes = value - degrees;
+    return GEO_PI * (degrees + 5.0 * minutes / 3.0) / 180.0;
+}
+
+template <typename Cost>
+static void costsFromWith(const std::vector<double>& xs, const std::vector<double>& ys, int a,
+                          const int* ids, int count, int* out, Cost cost) {
+    double ax = xs[a];
+    double ay = ys[a];
+    for (int i = 0; i < count; i++) {
+        out[i] = cost(ax, ay, xs[ids[i]], ys[ids[i]]);
+    }
+}
+
+template <typename Cost>
+static int tourLengthWith(const std::vector<double>& xs, const std::vector<double>& ys,
+                          const std::vector<int>& tour, Cost cost) {
+    int total = 0;
+    for (int i = 0; i + 1 < (int)tour.size(); i++) {
+        int a = tour[i];
+        int b = tour[i + 1];
+        total += cost(xs[a], ys[a], xs[b], ys[b]);
+    }
+    return total;
+}
+
+std::string metricName(MetricType type) {
+    switch (type) {
+        case METRIC_CEIL_2D: return "CEIL_2D";
+        case METRIC_ATT: return "ATT";
+        case METRIC_GEO: return "GEO";
+        default: return "EUC_2D";
+    }
+}
+
+bool parseMetricType(const std::string& name, MetricType& type) {
+    if (name == "EUC_2D") {
+        type = METRIC_EUC_2D;
+    } else if (name == "CEIL_2D") {
+        type = METRIC_CEIL_2D;
+    } else if (name == "ATT") {
+        type = METRIC_ATT;
+    } else if (name == "GEO") {
+        type = METRIC_GEO;
+    } else {
+        return false;
+    }
+    return true;
+}
+
+MetricType readMetricType(const std::string& filename) {
+    if (isBinaryTSP(filename)) {
+        return METRIC_EUC_2D;
+    }
+
+    std::ifstream infile(filename);
+    if (!infile.is_open()) {
+        throw std::runtime_error("Can't open the file");
+    }
+
+    std::string line;
+    while (std::getline(infile, line)) {
+        if (line.find("EDGE_WEIGHT_TYPE") != std::string::npos) {
+            size_t pos = line.find(":");
+            std::string value = (pos == std::string::npos) ? "" : line.substr(pos + 1);
+            size_t first = value.find_first_not_of(" \t\r");
+            size_t last = value.find_last_not_of(" \t\r");
+            value = (first == std::string::npos) ? "" : value.substr(first, last - first + 1);
+
+            MetricType type;
+            if (value == "EXPLICIT") {
+                return METRIC_EUC_2D;
+            }
+            if (!parseMetricType(value, type)) {
+                throw std::runtime_error("Unsupported EDGE_WEIGHT_TYPE: " + value);
+            }
+            return type;
+        }
+        if (line.find("_SECTION") != std::string::npos) {
+            break;
+        }
+    }
+    return METRIC_EUC_2D;
+}
+
+int metricDistance(MetricType type, const std::pair<double, double>& p1, const std::pair<double, double>& p2) {
+    switch (type) {
+        case METRIC_CEIL_2D: return Ceil2DCost()(p1.first, p1.second, p2.first, p2.second);
+        case METRIC_ATT: return AttCost()(p1.first, p1.second, p2.first, p2.second);
+        case METRIC_GEO:
+            return GeoCost()(geoRadians(p1.first), geoRadians(p1.second),
+                             geoRadians(p2.first), geoRadians(p2.second));
+        default: return Euc2DCost()(p1.first, p1.second, p2.first, p2.second);
+    }
+}
+
+TSPMetric::TSPMetric(const std::vector<std::pair<double, double>>& coordinates, MetricType type)
+    : metric_type(type) {
+    xs.reserve(coordinates.size());
+    ys.reserve(coordinates.size());
+    for (const std::pair<double, double>& c : coordinates) {
+        if (type == METRIC_GEO) {
+            xs.push_back(geoRadians(c.first));
+            ys.push_back(geoRadians(c.second));
+        } else {
+            xs.push_back(c.first);
+            ys.push_back(c.second);
+        }
+    }
+}
+
+int TSPMetric::getCost(int a, int b) const {
+    switch (metric_type) {
+        case METRIC_CEIL_2D: return Ceil2DCost()(xs[a], ys[a], xs[b], ys[b]);
+        case METRIC_ATT: return AttCost()(xs[a], ys[a], xs[b], ys[b]);
+        case METRIC_GEO: return GeoCost()(xs[a], ys[a], xs[b], ys[b]);
+        default: return Euc2DCost()(xs[a], ys[a], xs[b], ys[b]);
+    }
+}
+
+void TSPMetric::costsFrom(int a, const int* ids, int count, int* out) const {
+    switch (metric_type) {
+        case METRIC_CEIL_2D: costsFromWith(xs, ys, a, ids, count, out, Ceil2DCost()); break;
+        case METRIC_ATT: costsFromWith(xs, ys, a, ids, count, out, AttCost()); break;
+        case METRIC_GEO: costsFromWith(xs, ys, a, ids, count, out, GeoCost()); break;
+        default: costsFromWith(xs, ys, a, ids, count, out, Euc2DCost()); break;
+    }
+}
+
+int TSPMetric::tourLength(const std::vector<int>& tour) const {
+    switch (metric_type) {
+        case METRIC_CEIL_2D: return tourLengthWith(xs, ys, tour, Ceil2DCost());
+        case METRIC_ATT: return tourLengthWith(xs, ys, tour, AttCost());
+        case METRIC_GEO: return tourLengthWith(xs, ys, tour, GeoCost());
+        default: return tourLengthWith(xs, ys, tour, Euc2DCost());
+    }
+}